@@ -8,8 +8,7 @@ from Controller.chatbot_agent import ChatbotAgent
 def save_config(DM, path):
     """Save the current DM.data structure back to disk."""
     try:
-        with open(path, "w") as f:
-            json.dump(DM.data, f, indent=4)
+        DM.saveData(path)
         print(f"Configuration saved to {path}")
     except Exception as e:
         print(f"Failed to save config: {e}")
@@ -36,9 +35,9 @@ def main(cfg_path=None):
     from Controller.main_controller import DM
 
     if os.path.exists(cfg_path):
-        with open(cfg_path, "r") as f:
-            DM.data = json.load(f)
-            print(f"Config loaded from {cfg_path}")
+        # replays the edits a crashed session left in the journal
+        DM.loadFile(cfg_path)
+        print(f"Config loaded from {cfg_path}")
     else:
         DM.data = {"config": {"rooms": [], "labs": [], "courses": [], "faculty": []}}
         print("No config file found. Starting with an empty config.")
@@ -1,3 +1,6 @@
+import os
+
+from Controller.schedule_db import ScheduleDatabase
 from Models import Schedule
 
 
@@ -31,6 +34,11 @@ def display_schedule():
         print("Invalid choice.")
         return
 
+    # SQLite exports hold many schedules, search them first
+    if filename.endswith(".db"):
+        query_schedule_db(os.path.join(Schedule.SCHEDULES_DIR, filename))
+        return
+
     # Read the selected CSV file
     rows = Schedule.read_schedule(filename)
 
@@ -39,3 +47,47 @@ def display_schedule():
     for row in rows:
         print(" | ".join(row))  # join row items with vertical bars
     print("-------------------------\n")
+
+
+# Filter the schedules of a .db export and show one of the matches
+def query_schedule_db(path):
+    try:
+        db = ScheduleDatabase(path)
+    except ValueError as e:
+        print(e)
+        return
+
+    with db:
+        print(f"\n{len(db)} schedules. Leave a filter empty to skip it.")
+        filters = {}
+        for key, prompt in (
+            ("course", "Course (i.e CMSC 140): "),
+            ("room", "Room: "),
+            ("faculty", "Faculty: "),
+            ("day", "Day (MON-FRI): "),
+            ("startsBefore", "Starts before (HH:MM): "),
+        ):
+            value = input(prompt).strip()
+            if value:
+                filters[key] = value
+
+        try:
+            matches = db.schedulesWhere(**filters)
+        except ValueError as e:
+            print(e)
+            return
+        if not matches:
+            print("No schedule matches.")
+            return
+
+        # shown 1 based like the viewer
+        print("Matching schedules: " + ", ".join(str(k + 1) for k in matches))
+        choice = input("Enter a schedule number to display: ").strip()
+        if not choice.isdigit() or int(choice) - 1 not in matches:
+            print("Invalid choice.")
+            return
+
+        print("\n--- Schedule Contents ---")
+        for row in db.rows(int(choice) - 1):
+            print(" | ".join(row))
+        print("-------------------------\n")
@@ -11,9 +11,9 @@
 # Imports
 import sys
 import os
+from functools import partial
 from contextlib import contextmanager
 import json
-import csv
 import click
 from CLI.course_cli import mainCourseController
 from CLI.faculty_cli import mainFacultyController
@@ -27,6 +27,15 @@ from CLI.room_cli import mainRoomControler
 from CLI.lab_cli import mainLabControler
 from scheduler import Scheduler, load_config_from_file
 from scheduler.config import CombinedConfig
+from Controller.decomposition import (
+    decomposedGroups,
+    generationMode,
+    iterDecomposedSchedules,
+)
+from Controller.feasibility import checkFeasibility, feasibilityReport
+from Controller.parallel_generation import iterParallelSchedules
+from Controller.schedule_io import SCHEDULE_FORMATS, openScheduleWriter
+from Controller.schedule_cache import ScheduleCache, cacheDirFor, cachedSchedules
 from CLI.display_schedule import display_schedule
 
 from Views.main_view import SchedulerApp
@@ -134,6 +143,25 @@ def saveConfig(path, rooms, labs, courses, faculty, timeslots, other):
     print("Changes have been saved! \n")
 
 
+# the schedules of one run as lists of csv rows, `mode` from generationMode
+def produceSchedules(mode, data, limit, groups, workers, configInput):
+    if mode == "decomposed":
+        # independent groups of courses are solved separately
+        return iterDecomposedSchedules(data, limit, groups)
+    if mode == "parallel":
+        # split the search across worker processes
+        return iterParallelSchedules(data, limit, workers)
+
+    config = load_config_from_file(CombinedConfig, f"{configInput}")
+
+    # Create scheduler
+    scheduler = Scheduler(config)
+    return (
+        [course.as_csv().split(",") for course in schedule]
+        for schedule in scheduler.get_models()
+    )
+
+
 def runScheduler(otherData):
     while True:
         print("\n--- Scheduler Controller ---")
@@ -191,18 +219,33 @@ def runScheduler(otherData):
                 else:
                     print("Please enter a valid integer.")
 
+            while True:
+                workers = input(
+                    "Enter number of worker processes to split the search across (default: 1): "
+                )
+                if not workers:
+                    workers = 1
+                    break
+                if workers.isdigit() and int(workers) > 0:
+                    workers = int(workers)
+                    break
+                else:
+                    print("Please enter a positive integer.")
+
             while True:
                 format = input(
-                    "Enter a format file csv or json (default: json): "
+                    "Enter a format file csv, json, jsonl, sched or db (default: json): "
                 ).lower()
 
                 if not format:
                     format = "json"
                     break
-                if format == "json" or format == "csv":
+                if format in SCHEDULE_FORMATS:
                     break
                 else:
-                    print("Please enter a valid format (csv or json): ")
+                    print(
+                        "Please enter a valid format (csv, json, jsonl, sched or db): "
+                    )
 
             outputFile = input("Enter the name of the output file: ").lower()
 
@@ -262,46 +305,47 @@ def runScheduler(otherData):
                 print(f"Cannot open config File: {configInput}.\n")
                 return
 
+            issues = checkFeasibility(data)
+            if issues:
+                print(feasibilityReport(issues))
+                return
+
             print("Running the schedule: \n")
-            config = load_config_from_file(CombinedConfig, f"{configInput}")
 
-            # Create scheduler
-            scheduler = Scheduler(config)
+            groups = decomposedGroups(data, workers)
+            mode = generationMode(groups, workers)
 
-            all_schedules = []
-            count = 0
-
-            for schedule in scheduler.get_models():
-                # Convert schedule to list of CSV rows
-                schedule_list = [course.as_csv().split(",") for course in schedule]
-                all_schedules.append(schedule_list)
+            produce = partial(
+                produceSchedules, mode, data, limit, groups, workers, configInput
+            )
 
-                # Increment count
-                count += 1
+            # reuses schedules from earlier runs of the same config and flags
+            cache = ScheduleCache(cacheDirFor(configInput))
+            schedule_lists = cachedSchedules(
+                cache, data, limit, selectedOptimizeList, produce, mode
+            )
 
-                # Print live progress after each schedule
-                bar_length = 50
-                progress = int((count / limit) * bar_length)
-                bar = "█" * progress + "-" * (bar_length - progress)
+            outputPath = f"output/{outputFile}.{format}"
+            count = 0
 
-                # Just print normally (will create multiple lines)
-                print(f"Progress: |{bar}| {count}/{limit}")
+            # each schedule is written and flushed as soon as it is generated
+            with openScheduleWriter(outputPath, format) as writer:
+                for schedule_list in schedule_lists:
+                    writer.write(schedule_list)
 
-            print("\nAll schedules generated!\n")
+                    # Increment count
+                    count += 1
 
-            if format == "json":
-                with open(f"output/{outputFile}.json", "w") as f:
-                    json.dump(all_schedules, f, indent=4)
-                print(f"\nSchedules saved to output/{outputFile}.json")
+                    # Print live progress after each schedule
+                    bar_length = 50
+                    progress = int((count / limit) * bar_length)
+                    bar = "█" * progress + "-" * (bar_length - progress)
 
-            elif format == "csv":
-                with open(f"output/{outputFile}.csv", "w", newline="") as f:
-                    writer = csv.writer(f)
-                    for schedule_list in all_schedules:
-                        writer.writerow([])
-                        writer.writerows(schedule_list)
+                    # Just print normally (will create multiple lines)
+                    print(f"Progress: |{bar}| {count}/{limit}")
 
-                print(f"\nSchedules saved to output/{outputFile}.csv")
+            print("\nAll schedules generated!\n")
+            print(f"\nSchedules saved to {outputPath}")
 
 
 def whatAction(rooms, labs, courses, faculty, timeslots, other):
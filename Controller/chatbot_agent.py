@@ -313,9 +313,8 @@ class ChatbotAgent:
 
         if hasattr(main_controller, "DM") and os.path.exists(self.get_config_path()):
             try:
-                with open(self.get_config_path(), "r") as f:
-                    main_controller.DM.data = json.load(f)
-                main_controller.DM.filePath = self.get_config_path()
+                # through loadFile, so journaled edits are replayed
+                main_controller.DM.loadFile(self.get_config_path())
             except Exception as e:
                 print(f"[ChatbotAgent] Warning: could not reload config: {e}")
 
@@ -761,11 +760,7 @@ class ChatbotAgent:
             if not hasattr(DM, "data") or not DM.data:
                 return "No configuration loaded. Import a config first."
 
-            ref = DM.data
-            keys = key_path.split(".")
-            for k in keys[:-1]:
-                ref = ref[k]
-            ref[keys[-1]] = json.loads(new_value)
+            DM.updateValue(key_path, json.loads(new_value))
             DM.saveData(self.get_config_path())
             return f"Updated {key_path}."
         except Exception as e:
@@ -774,41 +769,46 @@ class ChatbotAgent:
     # -----------------------------
     # CRUD tool wrappers
     # -----------------------------
+    # Each runs in a DM.batch(): the listeners (the GUI) see one change, and
+    # an edit that fails halfway leaves the config as it was.
 
     def _tool_add_item(self, category: str, data: dict):
         try:
-            if category == "room":
-                DM.addRoom(data.get("name", "Unnamed Room"))
-                return self._ok("Room added.", category, "add")
+            with DM.batch():
+                if category == "room":
+                    DM.addRoom(data.get("name", "Unnamed Room"))
+                    return self._ok("Room added.", category, "add")
 
-            if category == "lab":
-                DM.addLab(data.get("name", "Unnamed Lab"))
-                return self._ok("Lab added.", category, "add")
+                if category == "lab":
+                    DM.addLab(data.get("name", "Unnamed Lab"))
+                    return self._ok("Lab added.", category, "add")
 
-            if category == "faculty":
-                # Convert FacultyDetails → dict
-                if isinstance(data, FacultyDetails):
-                    data = data.dict()
+                if category == "faculty":
+                    # Convert FacultyDetails → dict
+                    if isinstance(data, FacultyDetails):
+                        data = data.dict()
 
-                clean = self._normalize_faculty_payload(data, self.last_user_input)
+                    clean = self._normalize_faculty_payload(data, self.last_user_input)
 
-                DM.addFaculty(clean)
-                return self._ok(f"Faculty '{clean['name']}' added.", category, "add")
+                    DM.addFaculty(clean)
+                    return self._ok(
+                        f"Faculty '{clean['name']}' added.", category, "add"
+                    )
 
-            if category == "course":
-                clean = self._normalize_course_payload(data, self.last_user_input)
-                DM.addCourse(clean)
-                return self._ok(
-                    f"Course '{clean['course_id']}' added.", category, "add"
-                )
+                if category == "course":
+                    clean = self._normalize_course_payload(data, self.last_user_input)
+                    DM.addCourse(clean)
+                    return self._ok(
+                        f"Course '{clean['course_id']}' added.", category, "add"
+                    )
 
-            if category == "class_pattern":
-                # Details may already match MeetingDetails, or raw dict
-                data = data.dict() if isinstance(data, MeetingDetails) else data
-                DM.addClassPattern(data)
-                return self._ok("Class meeting pattern added.", category, "add")
+                if category == "class_pattern":
+                    # Details may already match MeetingDetails, or raw dict
+                    data = data.dict() if isinstance(data, MeetingDetails) else data
+                    DM.addClassPattern(data)
+                    return self._ok("Class meeting pattern added.", category, "add")
 
-            return self._err(f"Unknown category '{category}'.", category, "add")
+                return self._err(f"Unknown category '{category}'.", category, "add")
 
         except Exception as e:
             traceback.print_exc()
@@ -816,84 +816,89 @@ class ChatbotAgent:
 
     def _tool_edit_item(self, category: str, identifier: str, updates: dict):
         try:
-            if category == "room":
-                DM.editRoom(identifier, updates.get("name", identifier))
-                return self._ok(f"Room '{identifier}' updated.", category, "edit")
-
-            if category == "lab":
-                DM.editLabs(identifier, updates.get("name", identifier))
-                return self._ok(f"Lab '{identifier}' updated.", category, "edit")
-
-            if category == "faculty":
-                # Convert FacultyDetails → dict
-                if isinstance(updates, FacultyDetails):
-                    updates = updates.dict()
+            with DM.batch():
+                if category == "room":
+                    DM.editRoom(identifier, updates.get("name", identifier))
+                    return self._ok(f"Room '{identifier}' updated.", category, "edit")
+
+                if category == "lab":
+                    DM.editLabs(identifier, updates.get("name", identifier))
+                    return self._ok(f"Lab '{identifier}' updated.", category, "edit")
+
+                if category == "faculty":
+                    # Convert FacultyDetails → dict
+                    if isinstance(updates, FacultyDetails):
+                        updates = updates.dict()
+
+                    clean_updates = self._normalize_faculty_payload(
+                        updates, self.last_user_input
+                    )
 
-                clean_updates = self._normalize_faculty_payload(
-                    updates, self.last_user_input
-                )
+                    # Remove name field if it's just the same identifier
+                    if clean_updates.get("name", "").lower() == identifier.lower():
+                        clean_updates.pop("name", None)
 
-                # Remove name field if it’s just the same identifier
-                if clean_updates.get("name", "").lower() == identifier.lower():
-                    clean_updates.pop("name", None)
+                    DM.editFaculty(identifier, clean_updates)
+                    return self._ok(
+                        f"Faculty '{identifier}' updated.", category, "edit"
+                    )
 
-                DM.editFaculty(identifier, clean_updates)
-                return self._ok(f"Faculty '{identifier}' updated.", category, "edit")
+                if category == "course":
+                    DM.editCourse(identifier, updates)
+                    return self._ok(f"Course '{identifier}' updated.", category, "edit")
 
-            if category == "course":
-                DM.editCourse(identifier, updates)
-                return self._ok(f"Course '{identifier}' updated.", category, "edit")
+                if category == "class_pattern":
+                    import re
 
-            if category == "class_pattern":
-                import re
+                    match = re.search(r"\d+", str(identifier))
+                    if not match:
+                        raise ValueError(
+                            f"Could not determine pattern index from '{identifier}'"
+                        )
 
-                match = re.search(r"\d+", str(identifier))
-                if not match:
-                    raise ValueError(
-                        f"Could not determine pattern index from '{identifier}'"
-                    )
+                    idx = int(match.group()) - 1
 
-                idx = int(match.group()) - 1
+                    data_root = DM.data or {}
+                    cfg = data_root.get("time_slot_config", {}) or {}
+                    classes = cfg.get("classes", [])
 
-                data_root = DM.data or {}
-                cfg = data_root.get("time_slot_config", {}) or {}
-                classes = cfg.get("classes", [])
+                    if idx < 0 or idx >= len(classes):
+                        raise ValueError(f"Pattern index {idx + 1} out of range")
 
-                if idx < 0 or idx >= len(classes):
-                    raise ValueError(f"Pattern index {idx + 1} out of range")
+                    existing = classes[idx]
 
-                existing = classes[idx]
+                    # Merge changes
+                    merged = existing.copy()
 
-                # Merge changes
-                merged = existing.copy()
+                    if "credits" in updates:
+                        merged["credits"] = int(updates["credits"])
 
-                if "credits" in updates:
-                    merged["credits"] = int(updates["credits"])
+                    if "start_time" in updates:
+                        merged["start_time"] = updates["start_time"]
 
-                if "start_time" in updates:
-                    merged["start_time"] = updates["start_time"]
+                    if "disabled" in updates:
+                        merged["disabled"] = bool(updates["disabled"])
 
-                if "disabled" in updates:
-                    merged["disabled"] = bool(updates["disabled"])
+                    # If meetings published, replace them
+                    if "meetings" in updates:
+                        merged["meetings"] = updates["meetings"]
 
-                # If meetings published, replace them
-                if "meetings" in updates:
-                    merged["meetings"] = updates["meetings"]
+                    # Store updated pattern
+                    DM.editClassPattern(idx, merged)
 
-                # Store updated pattern
-                DM.editClassPattern(idx, merged)
-
-                updated_pattern = (
-                    (DM.data or {}).get("time_slot_config", {}).get("classes", [])[idx]
-                )
-                return self._ok(
-                    f"Class pattern #{idx + 1} updated.",
-                    category,
-                    "edit",
-                    payload={"class_pattern": updated_pattern},
-                )
+                    updated_pattern = (
+                        (DM.data or {})
+                        .get("time_slot_config", {})
+                        .get("classes", [])[idx]
+                    )
+                    return self._ok(
+                        f"Class pattern #{idx + 1} updated.",
+                        category,
+                        "edit",
+                        payload={"class_pattern": updated_pattern},
+                    )
 
-            return self._err(f"Unknown category '{category}'.", category, "edit")
+                return self._err(f"Unknown category '{category}'.", category, "edit")
 
         except Exception as e:
             traceback.print_exc()
@@ -901,35 +906,40 @@ class ChatbotAgent:
 
     def _tool_delete_item(self, category: str, identifier: str):
         try:
-            if category == "room":
-                DM.removeRoom(identifier)
-                return self._ok(f"Room '{identifier}' deleted.", category, "delete")
-            if category == "lab":
-                DM.removeLabs(identifier)
-                return self._ok(f"Lab '{identifier}' deleted.", category, "delete")
-            if category == "faculty":
-                DM.removeFaculty(identifier)
-                return self._ok(f"Faculty '{identifier}' deleted.", category, "delete")
-            if category == "course":
-                DM.removeCourse(identifier)
-                return self._ok(f"Course '{identifier}' deleted.", category, "delete")
-            if category == "class_pattern":
-                import re
-
-                match = re.search(r"\d+", str(identifier))
-                if not match:
-                    raise ValueError(
-                        f"Could not determine pattern index from '{identifier}'"
+            with DM.batch():
+                if category == "room":
+                    DM.removeRoom(identifier)
+                    return self._ok(f"Room '{identifier}' deleted.", category, "delete")
+                if category == "lab":
+                    DM.removeLabs(identifier)
+                    return self._ok(f"Lab '{identifier}' deleted.", category, "delete")
+                if category == "faculty":
+                    DM.removeFaculty(identifier)
+                    return self._ok(
+                        f"Faculty '{identifier}' deleted.", category, "delete"
+                    )
+                if category == "course":
+                    DM.removeCourse(identifier)
+                    return self._ok(
+                        f"Course '{identifier}' deleted.", category, "delete"
                     )
+                if category == "class_pattern":
+                    import re
+
+                    match = re.search(r"\d+", str(identifier))
+                    if not match:
+                        raise ValueError(
+                            f"Could not determine pattern index from '{identifier}'"
+                        )
 
-                # Convert "1" → 0, "2" → 1, etc.
-                idx = int(match.group()) - 1
+                    # Convert "1" → 0, "2" → 1, etc.
+                    idx = int(match.group()) - 1
 
-                DM.removeClassPattern(idx)
-                return self._ok(
-                    f"Class pattern #{identifier} deleted.", category, "delete"
-                )
-            return self._err(f"Unknown category '{category}'.", category, "delete")
+                    DM.removeClassPattern(idx)
+                    return self._ok(
+                        f"Class pattern #{identifier} deleted.", category, "delete"
+                    )
+                return self._err(f"Unknown category '{category}'.", category, "delete")
         except Exception as e:
             traceback.print_exc()
             return self._err(f"Error deleting {category}: {e}", category, "delete")
@@ -0,0 +1,256 @@
+# File Name: compact_html.py
+#
+# Self-contained HTML viewer for many schedules (.htm export).
+#
+# exportMultiScheduleHTML pre-renders an SVG for every room and faculty of
+# every schedule. Here the schedules are embedded once as compact json and a
+# small inline script draws the SVGs of the page being looked at, so the file
+# stays small, needs no CDN and opens just as fast with thousands of schedules.
+#
+# Data layout:
+#   strings    every course/faculty/room/lab name once
+#   schedules  one list per schedule, one row per course:
+#              [course, faculty, room, lab, *meetings] where the names are
+#              indices into strings and a meeting is packed into one int,
+#              ((day * 1440 + start) * 1440 + end) * 2 + isLab
+
+import html
+import json
+
+from Models.Schedule import ScheduledCourse
+
+from .schedule_layout import sortSchedulesByTime
+
+
+def packMeeting(meeting):
+    day, start, end, isLab = meeting
+    return ((day * 1440 + start) * 1440 + end) * 2 + int(isLab)
+
+
+def unpackMeeting(value):
+    value, isLab = divmod(value, 2)
+    value, end = divmod(value, 1440)
+    day, start = divmod(value, 1440)
+    return day, start, end, bool(isLab)
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings = []
+        self._lookup = {}
+
+    def id(self, value):
+        if value not in self._lookup:
+            self._lookup[value] = len(self.strings)
+            self.strings.append(value)
+        return self._lookup[value]
+
+
+def _packSchedule(schedule, table):
+    typed = [
+        row if isinstance(row, ScheduledCourse) else ScheduledCourse.fromRow(row)
+        for row in schedule
+    ]
+    rows = []
+    # in the order orderedSchedules puts them, groupsOf keeps row order
+    for row in sortSchedulesByTime(typed):
+        rows.append(
+            [table.id(v) for v in (row.course, row.faculty, row.room, row.lab)]
+            + [packMeeting(m) for m in row.meetings]
+        )
+    return rows
+
+
+def _scriptJson(value):
+    # safe inside <script>, "</" would end the tag
+    return json.dumps(value, separators=(",", ":")).replace("</", "<\\/")
+
+
+_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>{title} Weekly Schedule</title>
+<style>
+body { font-family: Arial, sans-serif; background: #f0f0f0; }
+.schedule-container { background: white; width: 700px; margin: 20px auto; padding: 10px; }
+#nav-bar { text-align: center; margin-bottom: 20px; font-size: 18px; }
+#nav-bar button { padding: 6px 12px; margin: 0px 10px; }
+.single-svg { width: 100%; display: flex; flex-direction: column; align-items: center; text-align: center; margin-bottom: 20px; }
+.seperator { margin: auto; height: 10px; width: 100%; background: #f0f0f0; }
+text { font-family: Arial, sans-serif; }
+@media print { #nav-bar { display: none; } .single-svg { page-break-after: always; } }
+</style>
+</head>
+<body>
+<div class="schedule-container">
+<div id="nav-bar">
+<button id="leftbutton">Previous</button>
+<span id="num">1 of 1</span>
+<button id="rightbutton">Next</button>
+</div>
+<div id="svg-container"></div>
+</div>
+<script id="schedules" type="application/json">"""
+
+# same geometry, colors and grouping as drawScheduleSVG / orderedSchedules
+_SCRIPT = r"""
+<script>
+(function () {
+  var schedules = JSON.parse(document.getElementById("schedules").textContent);
+  var strings = JSON.parse(document.getElementById("strings").textContent);
+  var DAYS = ["MON", "TUE", "WED", "THU", "FRI"];
+  var COLORS = ["#6fa8dc", "#93c47d", "#f6b26b", "#e06666", "#8e7cc3",
+                "#d5b451", "#76a5af", "#c27ba0", "#a4c2f4", "#b6d7a8"];
+  var LEFT = 55, DAY_WIDTH = 125, HOUR_HEIGHT = 60;
+  var SVG_NS = "http://www.w3.org/2000/svg";
+  var page = 0;
+
+  function unpack(v) {
+    var isLab = v % 2; v = Math.floor(v / 2);
+    var end = v % 1440; v = Math.floor(v / 1440);
+    return {day: Math.floor(v / 1440), start: v % 1440, end: end, lab: isLab};
+  }
+
+  function to12h(minutes) {
+    var h = Math.floor(minutes / 60), m = minutes % 60;
+    var shown = h % 12 === 0 ? 12 : h % 12;
+    return shown + ":" + (m < 10 ? "0" : "") + m + (h < 12 ? " AM" : " PM");
+  }
+
+  function add(groups, order, name, cls) {
+    if (!(name in groups)) { groups[name] = []; order.push(name); }
+    groups[name].push(cls);
+  }
+
+  // [[name, [[line1, line2, meetings]]]] for rooms & labs, then faculty
+  function groupsOf(rows) {
+    var result = [], groups = {}, order = [], i, row, meetings;
+    for (i = 0; i < rows.length; i++) {
+      row = rows[i];
+      add(groups, order, strings[row[2]],
+          [strings[row[0]], strings[row[1]], row.slice(4).map(unpack)]);
+    }
+    for (i = 0; i < rows.length; i++) {
+      row = rows[i];
+      if (strings[row[3]] === "None") continue;
+      meetings = row.slice(4).map(unpack).filter(function (m) {
+        return ((m.end - m.start) % 1440 + 1440) % 1440 === 110;
+      });
+      add(groups, order, strings[row[3]], [strings[row[0]], strings[row[1]], meetings]);
+    }
+    order.forEach(function (name) { result.push([name, groups[name]]); });
+
+    groups = {}; order = [];
+    for (i = 0; i < rows.length; i++) {
+      row = rows[i];
+      add(groups, order, strings[row[1]],
+          [strings[row[0]], strings[row[2]], row.slice(4).map(unpack)]);
+    }
+    order.forEach(function (name) { result.push([name, groups[name]]); });
+    return result;
+  }
+
+  function el(tag, attrs, text) {
+    var node = document.createElementNS(SVG_NS, tag);
+    for (var key in attrs) node.setAttribute(key, attrs[key]);
+    if (text !== undefined) node.textContent = text;
+    return node;
+  }
+
+  function drawSVG(name, classes) {
+    var first = Infinity, last = -Infinity;
+    classes.forEach(function (cls) {
+      cls[2].forEach(function (m) {
+        first = Math.min(first, m.start / 60);
+        last = Math.max(last, m.end / 60);
+      });
+    });
+    var startHour = first === Infinity ? 8 : Math.floor(first);
+    var endHour = last === -Infinity ? 17 : Math.ceil(last);
+    var width = LEFT + DAY_WIDTH * 5 + 20;
+    var svg = el("svg", {width: width, height: (endHour - startHour) * HOUR_HEIGHT + 80});
+
+    DAYS.forEach(function (day, i) {
+      svg.appendChild(el("text", {x: LEFT + i * DAY_WIDTH + DAY_WIDTH / 2, y: 20,
+        "text-anchor": "middle", "font-size": 13, "font-weight": 700}, day));
+    });
+    for (var h = startHour; h <= endHour; h++) {
+      var y = 40 + (h - startHour) * HOUR_HEIGHT;
+      svg.appendChild(el("line", {x1: LEFT, y1: y, x2: width, y2: y,
+        stroke: "#ccc", "stroke-width": 1}));
+      svg.appendChild(el("text", {x: 5, y: y + 5, "font-size": 11}, to12h(h * 60)));
+    }
+
+    classes.forEach(function (cls, c) {
+      cls[2].forEach(function (m) {
+        if (m.day > 4) return;
+        var x = LEFT + m.day * DAY_WIDTH + 2;
+        var y = 40 + (m.start / 60 - startHour) * HOUR_HEIGHT;
+        var height = (((m.end - m.start) % 1440 + 1440) % 1440) / 60 * HOUR_HEIGHT;
+        svg.appendChild(el("rect", {x: x, y: y, width: DAY_WIDTH - 4, height: height,
+          fill: COLORS[c % COLORS.length], stroke: "none"}));
+        svg.appendChild(el("text", {x: x + 8, y: y + 15, "font-size": 11, "font-weight": 700},
+          to12h(m.start) + " - " + to12h(m.end)));
+        svg.appendChild(el("text", {x: x + 8, y: y + 30, "font-size": 11}, cls[1]));
+        svg.appendChild(el("text", {x: x + 8, y: y + 45, "font-size": 11}, cls[0]));
+      });
+    });
+
+    var box = document.createElement("div");
+    box.className = "single-svg";
+    var title = document.createElement("h2");
+    title.textContent = name;
+    box.appendChild(title);
+    box.appendChild(svg);
+    return box;
+  }
+
+  function show(k) {
+    if (k < 0 || k >= schedules.length) return;
+    page = k;
+    var container = document.getElementById("svg-container");
+    container.textContent = "";
+    groupsOf(schedules[k]).forEach(function (group, i) {
+      if (i > 0) {
+        var sep = document.createElement("div");
+        sep.className = "seperator";
+        container.appendChild(sep);
+      }
+      container.appendChild(drawSVG(group[0], group[1]));
+    });
+    document.getElementById("num").textContent = (k + 1) + " of " + schedules.length;
+  }
+
+  document.getElementById("leftbutton").onclick = function () { show(page - 1); };
+  document.getElementById("rightbutton").onclick = function () { show(page + 1); };
+  show(0);
+})();
+</script>
+</body>
+</html>
+"""
+
+
+def exportCompactScheduleHTML(schedules, filepath):
+    """
+    Write every schedule into one small html file that renders the shown
+    schedule in the browser. Schedules are written one at a time.
+    """
+    title = filepath.replace("\\", "/").split("/")[-1].rsplit(".", 1)[0]
+    table = _StringTable()
+
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(_HEAD.replace("{title}", html.escape(title)))
+        f.write("[")
+        for idx, schedule in enumerate(schedules):
+            if idx:
+                f.write(",")
+            f.write(_scriptJson(_packSchedule(schedule, table)))
+        f.write("]</script>\n")
+        f.write('<script id="strings" type="application/json">')
+        f.write(_scriptJson(table.strings))
+        f.write("</script>")
+        f.write(_SCRIPT)
+
+    print("Saved:", filepath)
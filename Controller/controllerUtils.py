@@ -1,53 +1,70 @@
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-import math
-from tkinter import filedialog
+from functools import lru_cache
+import io
+import multiprocessing
+import queue
 import re
+import threading
+from tkinter import filedialog
 import os
 
-
-def sortSchedulesByTime(data):
-    # Priority for the days, no classes on SAT, SUN but who knows..
-    dayOrder = {"MON": 0, "TUE": 1, "WED": 2, "THU": 3, "FRI": 4}
-
-    def getEarliestMeeting(schedule):
-        times = []
-        for entry in schedule[4:]:
-            try:
-                day, time_range = entry.split()
-                startTime = time_range.split("-")[0]
-                hour, minute = map(int, startTime.split(":"))
-                times.append((dayOrder[day], hour, minute))
-            except Exception:
-                continue
-        return min(times) if times else (float("inf"), float("inf"), float("inf"))
-
-    # sort using the funciton we give it, usingt he times
-    return sorted(data, key=getEarliestMeeting)
+from Models.Schedule import (
+    DAYS,
+    ClassRow,
+    ScheduledCourse,
+    parseMeetingText,
+    schedulesToRows,
+)
+
+from .export_manifest import ExportManifest, contentHash
+from .schedule_layout import (
+    COLORLIST,
+    GRID_DAYS,
+    blockTimes,
+    getTimeRange,  # noqa: F401 kept importable from here
+    scheduleLayout,
+    sortSchedulesByTime,
+    to12h,
+)
 
 
 def filterDurations(times, dur):
     valid = []
     for t in times:
         t = t.replace("^", "").strip()
-        try:
-            day, time_range = t.split(" ")
-            start, end = time_range.split("-")
-
-            fmt = "%H:%M"
-            start_time = datetime.strptime(start, fmt)
-            end_time = datetime.strptime(end, fmt)
-
-            duration = (end_time - start_time).seconds / 60
-            if duration == dur:
-                valid.append(t)
-        except ValueError:
+        meeting = parseMeetingText(t)
+        if meeting is None:
             continue
+        _, start, end, _ = meeting
+        # same wrap around as the old timedelta.seconds
+        if (end - start) % (24 * 60) == dur:
+            valid.append(t)
     return valid
 
 
+def _groupedRow(row, fields, labDuration=None):
+    # [*fields, *times] for the room or faculty view. Typed rows keep their
+    # int meetings (ClassRow), plain rows keep their text like before
+    if isinstance(row, ScheduledCourse):
+        meetings = row.meetings
+        if labDuration is not None:
+            # lab blocks only, without the ^ like filterDurations
+            meetings = [
+                (day, start, end, False)
+                for day, start, end, _ in meetings
+                if (end - start) % (24 * 60) == labDuration
+            ]
+        return ClassRow(fields, meetings)
+    days = row[4:]
+    if labDuration is not None:
+        days = filterDurations(days, labDuration)
+    return list(fields) + days
+
+
 def orderedSchedules(schedules, order):
     schedules = sortSchedulesByTime(schedules)
     reoderedSchedules = []
@@ -59,73 +76,49 @@ def orderedSchedules(schedules, order):
     else:
         result = {}
         for row in schedules:
-            course, faculty, room, lab, *days = row
+            course, faculty, room, lab = row[0], row[1], row[2], row[3]
             if order == "Rooms & Labs":
                 if room not in result:
                     result[room] = []
 
-                result[room].append([course, faculty] + days)
+                result[room].append(_groupedRow(row, [course, faculty]))
             elif order == "Faculty":
                 if faculty not in result:
                     result[faculty] = []
 
-                result[faculty].append([course, room, lab] + days)
+                result[faculty].append(_groupedRow(row, [course, room, lab]))
 
         for row in schedules:
-            course, faculty, room, lab, *days = row
+            course, faculty, lab = row[0], row[1], row[3]
             if order == "Rooms & Labs":
                 if lab not in (None, "None"):
                     if lab not in result:
                         result[lab] = []
-                    times = filterDurations(days, 110)
-                    result[lab].append([course, faculty] + times)
+                    result[lab].append(_groupedRow(row, [course, faculty], 110))
 
         reoderedSchedules.append(result)
 
     return reoderedSchedules
 
 
-def parseMeeting(meeting):
-    try:
-        day, times = meeting.split()
-        times = times.replace("^", "")
-        startStr, endStr = times.split("-")
-        fmt = "%H:%M"
-        start = datetime.strptime(startStr, fmt)
-        end = datetime.strptime(endStr, fmt)
-        return day, start, end
-    except Exception:
+@lru_cache(maxsize=4096)
+def _parseMeetingCached(meeting):
+    meeting = parseMeetingText(meeting.replace("^", ""))
+    if meeting is None:
         return None, None, None
+    day, start, end, _ = meeting
+    # same datetimes strptime("%H:%M") gave us, without the parsing cost
+    return (
+        DAYS[day],
+        datetime(1900, 1, 1, start // 60, start % 60),
+        datetime(1900, 1, 1, end // 60, end % 60),
+    )
 
 
-def getTimeRange(data):
-    times = []
-    time_pattern = re.compile(r"(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})")
-    for _class in data:
-        for item in _class:
-            match = time_pattern.search(item)
-            if match:
-                start_h, start_m, end_h, end_m = map(int, match.groups())
-                start = start_h + start_m / 60
-                end = end_h + end_m / 60
-                times.append((start, end))
-
-    if not times:
-        return None
-
-    earliest_start = min(t[0] for t in times)
-    latest_end = max(t[1] for t in times)
-    rounded_latest_end = math.ceil(latest_end)
-
-    return (int(earliest_start), rounded_latest_end)
-
-
-def to12h(hour, minute):
-    suffix = "AM" if hour < 12 else "PM"
-    display_hour = hour % 12
-    if display_hour == 0:
-        display_hour = 12
-    return f"{display_hour}:{minute:02d} {suffix}"
+def parseMeeting(meeting):
+    if not isinstance(meeting, str):
+        return None, None, None
+    return _parseMeetingCached(meeting)
 
 
 def drawSchedulePagePDF(canvas, data):
@@ -136,25 +129,12 @@ def drawSchedulePagePDF(canvas, data):
     margin_top = 720
     day_width = 100
     hour_height = 50
-    days = ["MON", "TUE", "WED", "THU", "FRI"]
-    dayOrder = {d: i for i, d in enumerate(days)}
+    days = GRID_DAYS
     canvasPadding = 3
 
-    COLORLIST = [
-        "#6fa8dc",
-        "#93c47d",
-        "#f6b26b",
-        "#e06666",
-        "#8e7cc3",
-        "#d5b451",
-        "#76a5af",
-        "#c27ba0",
-        "#a4c2f4",
-        "#b6d7a8",
-    ]
-
-    # Time range
-    startHour, endHour = getTimeRange(classes)
+    # Time range and blocks, shared with the SVG and Tk views
+    layout = scheduleLayout(data)
+    startHour, endHour = layout.startHour, layout.endHour
 
     # ---- Title ----
     canvas.setFont("Helvetica-Bold", 18)
@@ -162,62 +142,63 @@ def drawSchedulePagePDF(canvas, data):
     text_width = canvas.stringWidth(text, "Helvetica-Bold", 18)
     canvas.drawString((page_width - text_width) / 2, margin_top + 40, text)
 
-    # ---- Day headers ----
-    canvas.setFont("Helvetica-Bold", 12)
-    for i, day in enumerate(days):
-        x = margin_left + i * day_width
-        canvas.drawString(x + day_width / 2 - 15, margin_top + 15, day)
-
-    # ---- Grid ----
-    canvas.setLineWidth(0.5)
-    for hour in range(startHour, endHour + 1):
-        y = margin_top - ((hour - startHour) * hour_height)
-
-        canvas.setFont("Helvetica", 10)
-        canvas.drawRightString(margin_left - 5, y, to12h(hour, 0))
-        canvas.line(margin_left, y, margin_left + day_width * 5, y)
+    # ---- Day headers and grid ----
+    # the same for every page with this hour range, so it is drawn once into
+    # a form (PDF XObject) and each page only references it
+    formName = f"ScheduleGrid_{startHour}_{endHour}"
+    if not canvas.hasForm(formName):
+        canvas.beginForm(formName)
+        canvas.setFont("Helvetica-Bold", 12)
+        for i, day in enumerate(days):
+            x = margin_left + i * day_width
+            canvas.drawString(x + day_width / 2 - 15, margin_top + 15, day)
+
+        canvas.setLineWidth(0.5)
+        for hour in range(startHour, endHour + 1):
+            y = margin_top - ((hour - startHour) * hour_height)
+
+            canvas.setFont("Helvetica", 10)
+            canvas.drawRightString(margin_left - 5, y, to12h(hour, 0))
+            canvas.line(margin_left, y, margin_left + day_width * 5, y)
+        canvas.endForm()
+    canvas.doForm(formName)
 
     # ---- Classes ----
-    colorIndex = 0
-    for cls in classes:
-        course, prof, *meetings = cls
-
-        for meeting in meetings:
-            day, start, end = parseMeeting(meeting)
-            if day not in dayOrder or start is None:
-                continue
+    for block in layout.blocks:
+        color_hex = COLORLIST[block.classIndex % len(COLORLIST)]
+        canvas.setFillColor(colors.HexColor(color_hex))
 
-            color_hex = COLORLIST[colorIndex % len(COLORLIST)]
-            canvas.setFillColor(colors.HexColor(color_hex))
+        x = margin_left + block.day * day_width + 2
+        y = margin_top - ((block.startHours - startHour) * hour_height)
+        height = (block.seconds / 3600) * hour_height - 2
 
-            x = margin_left + dayOrder[day] * day_width + 2
-            y = margin_top - (
-                (start.hour + start.minute / 60 - startHour) * hour_height
-            )
-            height = ((end - start).seconds / 3600) * hour_height - 2
-
-            # block
-            canvas.rect(x, y - height, day_width - 4, height, fill=1, stroke=0)
-
-            # text
-            canvas.setFillColor(colors.black)
-            canvas.setFont("Helvetica", 9)
-            block_text = f"{course}\n{prof}\n{to12h(start.hour, start.minute)} - {to12h(end.hour, end.minute)}"
+        # block
+        canvas.rect(x, y - height, day_width - 4, height, fill=1, stroke=0)
 
-            text_x = x + (day_width - 4) / 2
-            text_y = y - height / 2 - canvasPadding
+        # text
+        canvas.setFillColor(colors.black)
+        canvas.setFont("Helvetica", 9)
+        block_text = f"{block.course}\n{block.second}\n{blockTimes(block)}"
 
-            for idx, line in enumerate(block_text.split("\n")):
-                canvas.drawCentredString(text_x, text_y + (idx * 10) - 10, line)
+        text_x = x + (day_width - 4) / 2
+        text_y = y - height / 2 - canvasPadding
 
-        colorIndex += 1
+        for idx, line in enumerate(block_text.split("\n")):
+            canvas.drawCentredString(text_x, text_y + (idx * 10) - 10, line)
 
 
-def exportOneSchedulePDF(room_classes, output_dir):
+def exportOneSchedulePDF(room_classes, output_dir, force=False):
     room, classes = room_classes  # room_classes = [roomName(proffessro name), classes]
     os.makedirs(output_dir, exist_ok=True)
     filename = f"{output_dir}/{room}_schedule.pdf"
 
+    # nothing to do if this room was exported before with the same classes
+    manifest = ExportManifest(output_dir)
+    digest = contentHash("room-pdf", [room, schedulesToRows(classes)])
+    if not force and manifest.isCurrent(os.path.basename(filename), digest):
+        print(f"PDF unchanged: {filename}")
+        return
+
     # Canvas name does not work.... Don't do that pleae
     can = canvas.Canvas(filename, pagesize=letter)
 
@@ -225,13 +206,17 @@ def exportOneSchedulePDF(room_classes, output_dir):
 
     # Save the PDF
     can.save()
+    manifest.record(os.path.basename(filename), digest)
+    manifest.save()
     print(f"PDF saved: {filename}")
 
 
 def exportMultiPagePDF(schedule, output_dir, filename):
     filename = os.path.join(output_dir, filename)
     order_ways = ["Rooms & Labs", "Faculty"]
-    can = canvas.Canvas(filename, pagesize=letter)
+    # invariant: no timestamp or random document id, so the same schedule
+    # always gives the same bytes no matter which process wrote it
+    can = canvas.Canvas(filename, pagesize=letter, invariant=1)
     # Little messy :(
     for order in order_ways:
         orderedSch = orderedSchedules(schedule, order)
@@ -246,13 +231,147 @@ def exportMultiPagePDF(schedule, output_dir, filename):
     print(f"Multi-page PDF saved: {filename}")
 
 
-def drawScheduleSVG(room_classes):
-    name, classes = room_classes
+def _exportPDFJob(schedule, output_dir, filename):
+    # runs in a worker process
+    exportMultiPagePDF(schedule, output_dir, filename)
+    return filename
+
+
+_SCHEDULE_PDF = re.compile(r"Schedule_(\d+)\.pdf")
+
+
+def _stalePDFs(filenames, total):
+    # Schedule_{i}.pdf files numbered past the schedules being exported
+    stale = []
+    for filename in filenames:
+        match = _SCHEDULE_PDF.fullmatch(filename)
+        if match and int(match.group(1)) > total:
+            stale.append(filename)
+    return stale
+
+
+def exportSchedulesPDF(schedules, output_dir, workers=None, progress=None, force=False):
+    """
+    Write Schedule_{i}.pdf for every schedule into output_dir, spread over
+    `workers` processes (all cores by default). Files whose schedule did not
+    change since the last export are skipped unless force is set. Files an
+    earlier export wrote for schedules past the last one are removed.
+    progress(done, total) is called in this process after each file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = ExportManifest(output_dir)
+    jobs = []
+    digests = {}
+    total = 0
+    for i, schedule in enumerate(schedules):
+        total += 1
+        rows = schedulesToRows(schedule)
+        filename = f"Schedule_{i + 1}.pdf"
+        digest = contentHash("pdf", rows)
+        if not force and manifest.isCurrent(filename, digest):
+            continue
+        digests[filename] = digest
+        jobs.append((rows, output_dir, filename))
+
+    # a previous export with more schedules left files past the last one,
+    # only the ones it recorded are ours to remove
+    for filename in _stalePDFs(list(manifest.hashes), total):
+        path = os.path.join(output_dir, filename)
+        if os.path.exists(path):
+            os.remove(path)
+        manifest.forget(filename)
+
+    done = total - len(jobs)
+    if progress and done:
+        progress(done, total)
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+
+    try:
+        if workers <= 1:
+            for job in jobs:
+                filename = _exportPDFJob(*job)
+                manifest.record(filename, digests[filename])
+                done += 1
+                if progress:
+                    progress(done, total)
+            return total
+
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = [pool.submit(_exportPDFJob, *job) for job in jobs]
+            for future in as_completed(futures):
+                filename = future.result()
+                manifest.record(filename, digests[filename])
+                done += 1
+                if progress:
+                    progress(done, total)
+        return total
+    finally:
+        # files finished before an error are not written again next time
+        manifest.save()
+
+
+class PDFExportJob:
+    """
+    Runs exportSchedulesPDF on a worker thread so the GUI stays responsive,
+    like ScheduleGenerationJob. The worker puts (kind, payload) messages on
+    self.results:
+        ("progress", (done, total))
+        ("done", total)
+        ("error", exception)
+    The GUI drains them with poll() from an after() loop.
+    """
+
+    def __init__(self, schedules, output_dir, workers=None):
+        self.schedules = schedules
+        self.output_dir = output_dir
+        self.workers = workers
+        self.results = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError("Export job already started.")
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def poll(self):
+        """Return every message the worker has produced so far, without blocking."""
+        messages = []
+        while True:
+            try:
+                messages.append(self.results.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def _run(self):
+        try:
+            total = exportSchedulesPDF(
+                self.schedules,
+                self.output_dir,
+                self.workers,
+                progress=lambda done, total: self.results.put(
+                    ("progress", (done, total))
+                ),
+            )
+        except Exception as e:  # noqa: BLE001 any failure goes to the GUI
+            self.results.put(("error", e))
+            return
+        self.results.put(("done", total))
+
 
-    days = ["MON", "TUE", "WED", "THU", "FRI"]
-    day_positions = {d: i for i, d in enumerate(days)}
+def writeScheduleSVG(out, room_classes):
+    # writes the fragments straight to out (a file or StringIO)
+    name = room_classes[0]
+    write = out.write
 
-    startHour, endHour = getTimeRange(classes)
+    days = GRID_DAYS
+    layout = scheduleLayout(room_classes)
+    startHour, endHour = layout.startHour, layout.endHour
 
     left_margin = 55
     day_width = 125
@@ -261,61 +380,58 @@ def drawScheduleSVG(room_classes):
     svg_width = left_margin + day_width * 5 + 20
     svg_height = (endHour - startHour) * hour_height + 80
 
-    svg = f"<h2>{name}</h2>"
-    svg += f'<svg width="{svg_width}" height="{svg_height}">\n'
+    write(f"<h2>{name}</h2>")
+    write(f'<svg width="{svg_width}" height="{svg_height}">\n')
     for i, day in enumerate(days):
         x = left_margin + i * day_width + day_width / 2
-        svg += f'<text x="{x}" y="20" text-anchor="middle" font-size="13" font-weight="700">{day}</text>\n'
+        write(
+            f'<text x="{x}" y="20" text-anchor="middle" font-size="13" font-weight="700">{day}</text>\n'
+        )
 
     for h in range(startHour, endHour + 1):
         y = 40 + (h - startHour) * hour_height
-        svg += f'<line x1="{left_margin}" y1="{y}" x2="{svg_width}" y2="{y}" stroke="#ccc" stroke-width="1" />\n'
-        svg += f'<text x="5" y="{y + 5}" font-size="11">{to12h(h, 0)}</text>\n'
-
-    # Colors
-    COLORLIST = [
-        "#6fa8dc",
-        "#93c47d",
-        "#f6b26b",
-        "#e06666",
-        "#8e7cc3",
-        "#d5b451",
-        "#76a5af",
-        "#c27ba0",
-        "#a4c2f4",
-        "#b6d7a8",
-    ]
-    color_index = 0
-
-    for cls in classes:
-        course, prof, *meetings = cls
-        color = COLORLIST[color_index % len(COLORLIST)]
-
-        for meeting in meetings:
-            day, start, end = parseMeeting(meeting)
-            if day not in day_positions:
-                continue
-
-            x = left_margin + day_positions[day] * day_width + 2
-            y = 40 + ((start.hour + start.minute / 60 - startHour) * hour_height)
-            height = ((end - start).seconds / 3600) * hour_height
-
-            svg += f'<rect x="{x}" y="{y}" width="{day_width - 4}" height="{height}" fill="{color}" stroke="none" />\n'
-
-            svg += f'<text x="{x + 8}" y="{y + 15}" font-size="11" font-weight="700">{to12h(start.hour, start.minute)} - {to12h(end.hour, end.minute)}</text>\n'
-            svg += f'<text x="{x + 8}" y="{y + 30}" font-size="11">{prof}</text>\n'
-            svg += f'<text x="{x + 8}" y="{y + 45}" font-size="11">{course}</text>\n'
-
-        color_index += 1
-
-    svg += "</svg>"
-    return svg
-
-
-def exportOneScheduleHTML(room_classes, dir):
+        write(
+            f'<line x1="{left_margin}" y1="{y}" x2="{svg_width}" y2="{y}" stroke="#ccc" stroke-width="1" />\n'
+        )
+        write(f'<text x="5" y="{y + 5}" font-size="11">{to12h(h, 0)}</text>\n')
+
+    for block in layout.blocks:
+        color = COLORLIST[block.classIndex % len(COLORLIST)]
+
+        x = left_margin + block.day * day_width + 2
+        y = 40 + ((block.startHours - startHour) * hour_height)
+        height = (block.seconds / 3600) * hour_height
+
+        write(
+            f'<rect x="{x}" y="{y}" width="{day_width - 4}" height="{height}" fill="{color}" stroke="none" />\n'
+        )
+
+        write(
+            f'<text x="{x + 8}" y="{y + 15}" font-size="11" font-weight="700">{blockTimes(block)}</text>\n'
+        )
+        write(f'<text x="{x + 8}" y="{y + 30}" font-size="11">{block.second}</text>\n')
+        write(f'<text x="{x + 8}" y="{y + 45}" font-size="11">{block.course}</text>\n')
+
+    write("</svg>")
+
+
+def drawScheduleSVG(room_classes):
+    out = io.StringIO()
+    writeScheduleSVG(out, room_classes)
+    return out.getvalue()
+
+
+def exportOneScheduleHTML(room_classes, dir, force=False):
     room, classes = room_classes
     os.makedirs(dir, exist_ok=True)
     filename = f"{dir}/{room}_schedule.html"
+
+    manifest = ExportManifest(dir)
+    digest = contentHash("room-html", [room, schedulesToRows(classes)])
+    if not force and manifest.isCurrent(os.path.basename(filename), digest):
+        print("Unchanged:", filename)
+        return
+
     html = f"""<!DOCTYPE html>
         <html lang="en">
         <head>
@@ -354,13 +470,13 @@ def exportOneScheduleHTML(room_classes, dir):
         <div class="schedule-container">
     """
 
-    html += drawScheduleSVG(room_classes)
-
-    html += "</div></body></html>"
-
     with open(filename, "w") as f:
         f.write(html)
+        writeScheduleSVG(f, room_classes)
+        f.write("</div></body></html>")
 
+    manifest.record(os.path.basename(filename), digest)
+    manifest.save()
     print("Saved:", filename)
 
 
@@ -444,27 +560,34 @@ def exportMultiScheduleHTML(schedules, filepath):
     <div id="svg-container">
     """
 
-    page_number = 1
+    # streamed page by page, nothing but the current SVG is held in memory
+    with open(filepath, "w") as f:
+        f.write(html)
 
-    for sch in schedules:
-        page_html_parts = []
+        page_number = 1
 
-        for order in order_ways:
-            orderedSch = orderedSchedules(sch, order)
-            for ele in orderedSch:
-                for name, sche in ele.items():
-                    svg = drawScheduleSVG([name, sche])
-                    page_html_parts.append(f'<div class="single-svg">{svg}</div>')
+        for sch in schedules:
+            f.write(f'<div class="svg-page" id="p{page_number}">\n')
+            first = True
 
-        page_content = ('\n<div class="seperator"></div>\n').join(page_html_parts)
+            for order in order_ways:
+                orderedSch = orderedSchedules(sch, order)
+                for ele in orderedSch:
+                    for name, sche in ele.items():
+                        if not first:
+                            f.write('\n<div class="seperator"></div>\n')
+                        first = False
+                        f.write('<div class="single-svg">')
+                        writeScheduleSVG(f, [name, sche])
+                        f.write("</div>")
 
-        html += f'<div class="svg-page" id="p{page_number}">\n{page_content}\n</div>\n'
+            f.write("\n</div>\n")
 
-        page_number += 1
+            page_number += 1
 
-    max_pages = page_number - 1
+        max_pages = page_number - 1
 
-    html += f"""
+        f.write(f"""
     </div>  <!-- svg-container -->
     </div>  <!-- schedule-container -->
 
@@ -502,21 +625,36 @@ def exportMultiScheduleHTML(schedules, filepath):
 
     </body>
     </html>
-    """
-
-    with open(filepath, "w") as f:
-        f.write(html)
+    """)
 
     print("Saved:", filepath)
 
 
-def exportSchedulesBTN(data, pathEntaryVar):
+def _showPDFExport(job, pathEntaryVar, filePath):
+    # show the job's messages, True once it finished
+    for kind, payload in job.poll():
+        if kind == "progress":
+            done, total = payload
+            pathEntaryVar.set(f"Exporting PDFs: {done}/{total}")
+        elif kind == "done":
+            pathEntaryVar.set(f"Schedules have been saved to: {filePath}")
+            return True
+        elif kind == "error":
+            pathEntaryVar.set(f"Error exporting PDFs: {payload}")
+            return True
+    return False
+
+
+def exportSchedulesBTN(data, pathEntaryVar, widget=None):
     filePath = filedialog.asksaveasfilename(
         defaultextension=".json",
         filetypes=[
             ("JSON files", "*.json"),
             ("PDF files", "*.pdf"),
             ("HTML files", "*.html"),
+            ("Compact HTML viewer", "*.htm"),
+            ("Schedule archives", "*.sched"),
+            ("SQLite databases", "*.db"),
         ],
     )
 
@@ -530,16 +668,46 @@ def exportSchedulesBTN(data, pathEntaryVar):
         import json
 
         with open(filePathSaved, "w") as f:
-            json.dump(data, f, indent=4)
+            json.dump(schedulesToRows(data), f, indent=4)
+
+    elif ext == "sched":
+        from .schedule_archive import ArchiveWriter
+
+        with ArchiveWriter(filePathSaved) as writer:
+            for schedule in data:
+                writer.write(schedule)
+
+    elif ext == "db":
+        from .schedule_db import SqliteWriter
+
+        with SqliteWriter(filePathSaved) as writer:
+            for schedule in data:
+                writer.write(schedule)
 
     elif ext == "pdf":
         # directory with same base name
         output_dir = filePathSaved[:-4]
-        os.makedirs(output_dir, exist_ok=True)
-
-        for i, schedule_dict in enumerate(data):
-            filename = f"Schedule_{i + 1}.pdf"
-            exportMultiPagePDF(schedule_dict, output_dir, filename)
+        # rendered on a worker thread, progress is shown from widget.after()
+        # so the window keeps drawing while the PDFs are written
+        job = PDFExportJob(data, output_dir)
+        job.start()
+        if widget is None:
+            job.join()
+            _showPDFExport(job, pathEntaryVar, filePath)
+            return job
+
+        def pollJob():
+            if not _showPDFExport(job, pathEntaryVar, filePath):
+                widget.after(100, pollJob)
+
+        widget.after(100, pollJob)
+        return job
+
+    elif ext == "htm":
+        # schedules embedded as json, drawn by the browser
+        from .compact_html import exportCompactScheduleHTML
+
+        exportCompactScheduleHTML(data, filePathSaved)
 
     elif ext == "html":
         # exportMultiScheduleHTML(data, filePath)
@@ -0,0 +1,205 @@
+# File Name: decomposition.py
+#
+# Splits a config into independent sub-problems.
+#
+# Two courses depend on each other when they can share a faculty member, a
+# room or a lab, list each other as conflicts, or are sections of the same
+# course. A union-find over those links gives groups of courses that never
+# interact, so each group is solved on its own (in its own process) and a full
+# schedule is any combination of one schedule per group. That makes the solver
+# work roughly the sum of the groups instead of their product.
+
+import copy
+import itertools
+import os
+
+from .parallel_generation import EnumerationWorkers, _courseFacultyChoices
+
+# merged groups are searched as a product again, so only merge past this many
+MIN_GROUP_CAP = 8
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, x):
+        self.parent.setdefault(x, x)
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # path compression
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+
+    def union(self, a, b):
+        rootA, rootB = self.find(a), self.find(b)
+        if rootA != rootB:
+            self.parent[rootB] = rootA
+
+
+def findComponents(data):
+    """
+    Return lists of course indices that can be scheduled independently,
+    ordered by their first course.
+    """
+    config = (data or {}).get("config") or {}
+    courses = config.get("courses") or []
+    uf = _UnionFind()
+
+    for idx, course in enumerate(courses):
+        node = ("course", idx)
+        uf.union(node, ("course_id", course.get("course_id")))
+        for room in course.get("room") or []:
+            uf.union(node, ("room", room))
+        for lab in course.get("lab") or []:
+            uf.union(node, ("lab", lab))
+        for name in _courseFacultyChoices(data, course):
+            uf.union(node, ("faculty", name))
+        for other in course.get("conflicts") or []:
+            uf.union(node, ("course_id", other))
+
+    # a preference ties the faculty member to the course even when the course
+    # has an explicit faculty list, the config validation needs both together
+    for f in config.get("faculty") or []:
+        for course_id in f.get("course_preferences") or {}:
+            uf.union(("faculty", f.get("name")), ("course_id", course_id))
+
+    groups = {}
+    for idx in range(len(courses)):
+        groups.setdefault(uf.find(("course", idx)), []).append(idx)
+    return list(groups.values())
+
+
+def mergeComponents(components, maxParts):
+    """
+    Pack components into at most maxParts groups, biggest first into the
+    group with the fewest courses. Returned groups keep course order.
+    """
+    if len(components) <= maxParts:
+        return components
+    bins = [[] for _ in range(maxParts)]
+    for comp in sorted(components, key=len, reverse=True):
+        min(bins, key=len).extend(comp)
+    return [sorted(b) for b in bins if b]
+
+
+def subConfig(data, courseIdxs):
+    """Copy of the config data limited to the given courses."""
+    data = copy.deepcopy(data)
+    config = data.get("config") or {}
+    courses = config.get("courses") or []
+    config.pop("class_patterns", None)
+
+    picked = [courses[i] for i in courseIdxs]
+    courseIds = {c.get("course_id") for c in picked}
+    rooms = {r for c in picked for r in c.get("room") or []}
+    labs = {lab for c in picked for lab in c.get("lab") or []}
+    names = set()
+    for c in picked:
+        names.update(_courseFacultyChoices(data, c))
+
+    faculty = []
+    for f in config.get("faculty") or []:
+        prefs = f.get("course_preferences") or {}
+        if f.get("name") not in names and not courseIds.intersection(prefs):
+            continue
+        f["course_preferences"] = {k: v for k, v in prefs.items() if k in courseIds}
+        if "room_preferences" in f:
+            f["room_preferences"] = {
+                k: v for k, v in f["room_preferences"].items() if k in rooms
+            }
+        if "lab_preferences" in f:
+            f["lab_preferences"] = {
+                k: v for k, v in f["lab_preferences"].items() if k in labs
+            }
+        faculty.append(f)
+
+    config["courses"] = picked
+    config["faculty"] = faculty
+    config["rooms"] = [r for r in config.get("rooms") or [] if r in rooms]
+    config["labs"] = [lab for lab in config.get("labs") or [] if lab in labs]
+    return data
+
+
+def _layer(lengths, m):
+    # index combos whose largest index is exactly m, so every combo shows up
+    # in exactly one layer and early layers only need a few schedules per part
+    ranges = [range(min(m, n - 1) + 1) for n in lengths]
+    for combo in itertools.product(*ranges):
+        if m in combo:
+            yield combo
+
+
+def iterDecomposedSchedules(data, limit, groups):
+    """
+    Yield up to `limit` schedules (lists of csv rows) by solving every group
+    of courses in its own process and combining their schedules lazily.
+    Rows come back in the original course order.
+    """
+    pool = EnumerationWorkers([subConfig(data, g) for g in groups], limit)
+    messages = iter(pool)
+    buffers = [[] for _ in groups]
+    finished = [False] * len(groups)
+
+    def fill(m):
+        # pull until every group has schedule m or has run out
+        while any(
+            len(buf) <= m and not done
+            for buf, done in zip(buffers, finished, strict=True)
+        ):
+            try:
+                kind, part, payload = next(messages)
+            except StopIteration:
+                finished[:] = [True] * len(groups)
+                return
+            if kind == "schedule":
+                buffers[part].append(payload)
+            elif kind == "done":
+                finished[part] = True
+
+    produced = 0
+    try:
+        m = 0
+        while produced < limit:
+            fill(m)
+            lengths = [len(buf) for buf in buffers]
+            if min(lengths) == 0 or max(lengths) <= m:
+                return
+            for combo in _layer(lengths, m):
+                rows = [None] * sum(len(g) for g in groups)
+                for part, i in enumerate(combo):
+                    for courseIdx, row in zip(
+                        groups[part], buffers[part][i], strict=True
+                    ):
+                        rows[courseIdx] = row
+                yield rows
+                produced += 1
+                if produced >= limit:
+                    return
+            m += 1
+    finally:
+        pool.stop()
+
+
+def decomposedGroups(data, workers=None):
+    """
+    Independent course groups for the config, at most one per worker
+    process. workers=1 keeps everything in one group (one process), None
+    allows one group per cpu.
+    """
+    if workers is None:
+        maxParts = max(os.cpu_count() or 1, MIN_GROUP_CAP)
+    else:
+        maxParts = max(workers, 1)
+    return mergeComponents(findComponents(data), maxParts)
+
+
+def generationMode(groups, workers):
+    """How a run with these groups and workers generates its schedules."""
+    if len(groups) > 1:
+        return "decomposed"
+    if workers > 1:
+        return "parallel"
+    return "single"
@@ -0,0 +1,94 @@
+# File Name: export_manifest.py
+#
+# Content hashes of exported files, so re-exports skip what did not change.
+#
+# Every export directory gets a small json manifest mapping each output file
+# to a hash of what it was rendered from (the schedule rows plus the kind of
+# export and RENDER_VERSION). A file is only written again when that hash
+# changes or the file is gone.
+#
+# Exports run on the export worker thread and on the Tk thread, so saving
+# merges this manifest's own changes into what is on disk under a lock, and
+# every save writes through its own temp file.
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+MANIFEST_NAME = ".export_manifest.json"
+
+# bump when the PDF/HTML renderers change what they draw
+RENDER_VERSION = 1
+
+# one manifest save at a time per process
+_SAVE_LOCK = threading.Lock()
+
+
+def contentHash(kind, content):
+    """Hash of one output file's input, content must be json serializable."""
+    data = json.dumps([RENDER_VERSION, kind, content], separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class ExportManifest:
+    """Hashes of the files in one export directory, loaded from and saved to it."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, MANIFEST_NAME)
+        self.hashes = self._load()
+        # entries recorded (or forgotten, None) since loading, the only
+        # ones save() writes
+        self._updates = {}
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                hashes = json.load(f)
+        except (OSError, ValueError):
+            # no manifest yet (or a broken one), everything gets written
+            return {}
+        return hashes if isinstance(hashes, dict) else {}
+
+    def isCurrent(self, filename, digest):
+        return self.hashes.get(filename) == digest and os.path.exists(
+            os.path.join(self.directory, filename)
+        )
+
+    def record(self, filename, digest):
+        if self.hashes.get(filename) != digest:
+            self.hashes[filename] = digest
+            self._updates[filename] = digest
+
+    def forget(self, filename):
+        """Drop the entry of a file that is no longer exported."""
+        if filename in self.hashes:
+            del self.hashes[filename]
+            self._updates[filename] = None
+
+    def save(self):
+        if not self._updates:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with _SAVE_LOCK:
+            # another export may have saved since this one loaded
+            hashes = self._load()
+            for filename, digest in self._updates.items():
+                if digest is None:
+                    hashes.pop(filename, None)
+                else:
+                    hashes[filename] = digest
+            fd, tmp = tempfile.mkstemp(
+                dir=self.directory, prefix=MANIFEST_NAME, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(hashes, f, indent=1, sort_keys=True)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.remove(tmp)
+                raise
+        self.hashes = hashes
+        self._updates = {}
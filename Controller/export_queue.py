@@ -0,0 +1,97 @@
+# File Name: export_queue.py
+#
+# Background queue for the per-room Export PDF / Export HTML buttons.
+#
+# Exports run one at a time on a worker thread so the Tk thread never waits
+# on reportlab or the disk. Jobs with the same key that are still waiting are
+# coalesced into one (the newest arguments win), so clicking a button several
+# times only exports once. Like ScheduleGenerationJob, the worker only puts
+# messages on a queue and the GUI drains them with poll() from after().
+
+import queue
+import threading
+
+
+class ExportQueue:
+    """
+    Runs export jobs in submit order on one worker thread. Messages from
+    poll() are (kind, label, pending) tuples, kind is one of
+        "queued"     the job was added
+        "coalesced"  a job with the same key was already waiting
+        "started"    the worker began the job
+        "done"       the job finished
+        "error"      the job raised, label is (label, exception)
+    and pending is how many jobs are still waiting or running.
+    """
+
+    def __init__(self):
+        self.results = queue.Queue()
+        self._lock = threading.Lock()
+        self._order = queue.Queue()
+        # key -> (func, args, kwargs, label) for jobs not started yet
+        self._waiting = {}
+        self._running = 0
+        self._thread = None
+
+    def submit(self, key, func, *args, label=None, **kwargs):
+        """Queue func(*args, **kwargs), returns False if it was coalesced."""
+        label = label or str(key)
+        with self._lock:
+            coalesced = key in self._waiting
+            self._waiting[key] = (func, args, kwargs, label)
+            if not coalesced:
+                self._order.put(key)
+            pending = self._pendingLocked()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        self.results.put(("coalesced" if coalesced else "queued", label, pending))
+        return not coalesced
+
+    def _pendingLocked(self):
+        return len(self._waiting) + self._running
+
+    def pending(self):
+        with self._lock:
+            return self._pendingLocked()
+
+    def poll(self):
+        """Return every message produced so far, without blocking."""
+        messages = []
+        while True:
+            try:
+                messages.append(self.results.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def _run(self):
+        while True:
+            key = self._order.get()
+            if key is None:
+                return
+            with self._lock:
+                func, args, kwargs, label = self._waiting.pop(key)
+                self._running += 1
+                pending = self._pendingLocked()
+            self.results.put(("started", label, pending))
+
+            try:
+                func(*args, **kwargs)
+                message = ("done", label)
+            except Exception as e:  # noqa: BLE001 any failure goes to the GUI
+                message = ("error", (label, e))
+
+            with self._lock:
+                # under the lock, so pending() == 0 means the message is queued
+                self._running -= 1
+                self.results.put((*message, self._pendingLocked()))
+
+    def close(self):
+        """Stop the worker after the jobs already queued."""
+        if self._thread is not None:
+            self._order.put(None)
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -0,0 +1,188 @@
+# File Name: feasibility.py
+#
+# Quick checks that a config can produce at least one schedule.
+#
+# The solver can search for a long time before it gives up on an impossible
+# config. These checks only look at necessary conditions (credits, faculty,
+# rooms, time slots and room capacity) in one pass over the data, so they run
+# in a blink and point at the exact problem.
+
+DAYS = ["MON", "TUE", "WED", "THU", "FRI"]
+
+
+def _minutes(hhmm):
+    hour, minute = map(int, str(hhmm).split(":"))
+    return hour * 60 + minute
+
+
+def _dayBlocks(timeSlotConfig):
+    # {day: [(start, end), ...]} in minutes
+    blocks = {}
+    for day, dayBlocks in (timeSlotConfig.get("times") or {}).items():
+        blocks[day] = [
+            (_minutes(b["start"]), _minutes(b["end"]))
+            for b in dayBlocks or []
+            if "start" in b and "end" in b
+        ]
+    return blocks
+
+
+def _dayMinutes(blocks):
+    # minutes a room is open on one day, overlapping blocks counted once
+    total, reach = 0, None
+    for start, end in sorted(blocks):
+        if reach is not None and start < reach:
+            start = reach
+        if end > start:
+            total += end - start
+            reach = end
+    return total
+
+
+def _meetingFits(meeting, blocks, startTime):
+    duration = int(meeting.get("duration", 0))
+    for blockStart, blockEnd in blocks.get(meeting.get("day"), []):
+        if startTime is not None:
+            if blockStart <= startTime and startTime + duration <= blockEnd:
+                return True
+        elif blockEnd - blockStart >= duration:
+            return True
+    return False
+
+
+def _usablePatterns(timeSlotConfig, blocks):
+    # {credits: [pattern, ...]} for enabled patterns whose meetings all fit
+    usable = {}
+    for pattern in timeSlotConfig.get("classes") or []:
+        if pattern.get("disabled"):
+            continue
+        meetings = pattern.get("meetings") or []
+        startTime = pattern.get("start_time")
+        startTime = _minutes(startTime) if startTime else None
+        if meetings and all(_meetingFits(m, blocks, startTime) for m in meetings):
+            usable.setdefault(pattern.get("credits"), []).append(pattern)
+    return usable
+
+
+def _label(course, idx):
+    return f"{course.get('course_id', '?')} (course #{idx + 1})"
+
+
+def checkFeasibility(data):
+    """
+    Return a list of problems that make the config impossible to schedule.
+    An empty list does not promise a schedule exists, it just means none of
+    the necessary conditions failed.
+    """
+    issues = []
+    data = data or {}
+    config = data.get("config") or {}
+    courses = config.get("courses") or []
+    faculty = config.get("faculty") or []
+    if not courses:
+        return issues
+
+    facultyNames = {f.get("name") for f in faculty}
+    preferred = {}
+    for f in faculty:
+        for course_id in f.get("course_preferences") or {}:
+            preferred.setdefault(course_id, []).append(f.get("name"))
+
+    # ---- Faculty and rooms per course ----
+    teachable = {name: 0 for name in facultyNames}
+    # the solver only holds faculty with candidate courses to their minimum
+    candidateCourses = {name: 0 for name in facultyNames}
+    for idx, c in enumerate(courses):
+        if c.get("faculty"):
+            candidates = [f for f in c["faculty"] if f in facultyNames]
+            if not candidates:
+                issues.append(
+                    f"{_label(c, idx)} lists faculty {c['faculty']} but none of them exist."
+                )
+        else:
+            candidates = preferred.get(c.get("course_id"), [])
+            if not candidates:
+                issues.append(
+                    f"{_label(c, idx)} has no faculty list and no faculty has it in course_preferences."
+                )
+        for name in candidates:
+            teachable[name] += int(c.get("credits", 0))
+            candidateCourses[name] += 1
+
+        if not c.get("room"):
+            issues.append(f"{_label(c, idx)} has no rooms to be scheduled in.")
+
+    bound = [f for f in faculty if candidateCourses.get(f.get("name"))]
+    for f in bound:
+        name = f.get("name")
+        if int(f.get("minimum_credits", 0)) > teachable.get(name, 0):
+            issues.append(
+                f"Faculty '{name}' needs at least {f.get('minimum_credits')} credits but can only teach {teachable.get(name, 0)}."
+            )
+
+    # ---- Credits ----
+    totalCredits = sum(int(c.get("credits", 0)) for c in courses)
+    maxCredits = sum(int(f.get("maximum_credits", 0)) for f in faculty)
+    minCredits = sum(int(f.get("minimum_credits", 0)) for f in bound)
+    if maxCredits < totalCredits:
+        issues.append(
+            f"Courses need {totalCredits} credits but faculty maximum_credits only add up to {maxCredits}."
+        )
+    if minCredits > totalCredits:
+        issues.append(
+            f"Faculty minimum_credits add up to {minCredits} but courses only have {totalCredits} credits."
+        )
+
+    # ---- Time slots ----
+    timeSlotConfig = data.get("time_slot_config") or {}
+    blocks = _dayBlocks(timeSlotConfig)
+    usable = _usablePatterns(timeSlotConfig, blocks)
+    byCredits = {}
+    for idx, c in enumerate(courses):
+        byCredits.setdefault(int(c.get("credits", 0)), []).append(_label(c, idx))
+    for credits, labels in sorted(byCredits.items()):
+        if credits not in usable:
+            issues.append(
+                f"No enabled class pattern with time slots for {credits}-credit courses: {', '.join(labels)}."
+            )
+
+    # ---- Room capacity ----
+    # every course needs at least its shortest usable pattern in a room
+    rooms = {r for c in courses for r in c.get("room") or []}
+    weekNeeded = 0
+    dayNeeded = {day: 0 for day in DAYS}
+    for c in courses:
+        patterns = usable.get(int(c.get("credits", 0)))
+        if not patterns:
+            continue
+        weekNeeded += min(
+            sum(int(m.get("duration", 0)) for m in p["meetings"]) for p in patterns
+        )
+        # days every usable pattern meets on are days the course must use a room
+        for day in DAYS:
+            perPattern = [
+                sum(int(m["duration"]) for m in p["meetings"] if m.get("day") == day)
+                for p in patterns
+            ]
+            dayNeeded[day] += min(perPattern)
+
+    openMinutes = {day: _dayMinutes(blocks.get(day, [])) for day in DAYS}
+    weekAvailable = len(rooms) * sum(openMinutes.values())
+    if weekNeeded > weekAvailable:
+        issues.append(
+            f"Courses need {weekNeeded} room-minutes a week but {len(rooms)} rooms only have {weekAvailable}."
+        )
+    for day in DAYS:
+        available = len(rooms) * openMinutes[day]
+        if dayNeeded[day] > available:
+            issues.append(
+                f"Courses need {dayNeeded[day]} room-minutes on {day} but {len(rooms)} rooms only have {available}."
+            )
+
+    return issues
+
+
+def feasibilityReport(issues):
+    """One message listing every problem, used by the GUI and CLI."""
+    lines = "\n".join(f"  - {issue}" for issue in issues)
+    return f"This config cannot produce any schedule:\n{lines}"
@@ -1,19 +1,33 @@
 from tkinter import filedialog
 from Models.Data_manager import DataManager
+from Models.Schedule import Schedule
 from scheduler import Scheduler, CombinedConfig
-import os
 import json
-import csv
+import os
+import queue
+import threading
+import time
 
 # from reportlab.pdfgen import canvas
 # from reportlab.lib.pagesizes import letter
 from .controllerUtils import exportSchedulesBTN
+from .decomposition import (
+    decomposedGroups,
+    generationMode,
+    iterDecomposedSchedules,
+)
+from .feasibility import checkFeasibility, feasibilityReport
+from .parallel_generation import iterParallelSchedules
+from .schedule_archive import ARCHIVE_EXTENSION
+from .schedule_cache import ScheduleCache, cacheDirFor, cachedSchedules
+from .schedule_source import LazyScheduleSource
 
 # from scheduler.config import CombinedConfig
 
 # Lets Create 1 DataManager for all the classes
 # this should make things easier
-DM = DataManager()
+# Edits are journaled beside the loaded config, so a crash does not lose them
+DM = DataManager(journal=True)
 
 
 # Import button form the tabs view rooms and others.
@@ -31,6 +45,29 @@ def configImportBTN(pathVar, refresh=None):
         refresh("ConfigPage")
 
 
+# Import button of the courses list, adds the courses of another config file
+# (or of a json list of courses) to the loaded one.
+def coursesImportBTN(refresh=None):
+    filePath = filedialog.askopenfilename(
+        title="Select a JSON file", filetypes=[("JSON files", "*.json")]
+    )
+    if not filePath:
+        return None
+    try:
+        with open(filePath, "r") as f:
+            courses = json.load(f)
+    except (OSError, ValueError) as e:
+        return f"Could not read {filePath}: {e}"
+    if isinstance(courses, dict):
+        config = courses.get("config", courses)
+        courses = config.get("courses", []) if isinstance(config, dict) else None
+    if not isinstance(courses, list) or not all(
+        isinstance(course, dict) for course in courses
+    ):
+        return f"{filePath} does not hold a list of courses."
+    return CourseController().importCourses(courses, refresh)
+
+
 def configExportBTN(pathVar):
     global DM
 
@@ -42,76 +79,157 @@ def configExportBTN(pathVar):
         pathVar.set(f"Config File saved to Path: {file_path}.")
 
 
-def generateSchedulesBtn(limit, optimize, progressCallback):
-    global DM
+def _applyGenerationSettings(limit, optimize):
+    # stored in the config before a run. These are DataManager edits, so the
+    # listeners (the GUI) run: call it on the GUI thread, not from a worker.
     DM.updateLimit(limit)
     DM.updateOptimizerFlags(optimize)
 
+
+def _prepareScheduler():
+    # builds the solver for the single process stream
+    global DM
     if DM.data and "config" in DM.data:
         DM.data["config"].pop("class_patterns", None)
 
     config = CombinedConfig(**(DM.data or {}))
 
-    scheduler = Scheduler(config)
-    all_schedules = []
-
-    total_steps = limit + (1 if optimize else 0)  # optimization counts as one step
-    current_step = 0
-    if optimize:
-        # Add optimization logic here if needed
-        current_step += 1
-        if progressCallback:
-            progressCallback(current_step, total_steps)
-
-    for i, schedule in enumerate(scheduler.get_models()):
-        if i >= limit:
-            break
-        schedule_list = [course.as_csv().split(",") for course in schedule]
-        all_schedules.append(schedule_list)
-
-        current_step += 1
-        if progressCallback:
-            progressCallback(current_step, total_steps)
-
-    return all_schedules
-
-
-def checkFileContent(data, pathEntaryVar):
-    if not isinstance(data, list):
-        # cheaks if data is a list or not
-        pathEntaryVar.set("Please open a valid file!")
-        return False
-
-    # we look at each schedule in the list
-    for idx, sch in enumerate(data):
-        # checks if the whole data schedule is a list or not
-        if not isinstance(sch, list):
-            pathEntaryVar.set(f"Invalid: schedule {idx} is not a list.")
-            return False
-
-        # chesi if we have empty schedule
-        if len(sch) == 0:
-            pathEntaryVar.set(f"Invalid: schedule {idx} is empty.")
-            return False
+    return Scheduler(config)
+
+
+def _scheduleStream(limit, optimize, workers=1):
+    # Generator of schedules as lists of csv rows.
+    # With more than one worker independent groups of courses are solved in
+    # separate processes, otherwise the search is split across processes.
+    # One worker runs the scheduler in this process.
+    groups = decomposedGroups(DM.data, workers)
+    mode = generationMode(groups, workers)
+
+    def produce():
+        # fail fast on configs the solver could never satisfy
+        issues = checkFeasibility(DM.data)
+        if issues:
+            raise ValueError(feasibilityReport(issues))
+
+        if mode == "decomposed":
+            return iterDecomposedSchedules(DM.data, limit, groups)
+        if mode == "parallel":
+            return iterParallelSchedules(DM.data or {}, limit, workers)
+
+        scheduler = _prepareScheduler()
+        return (
+            [course.as_csv().split(",") for course in schedule]
+            for schedule in scheduler.get_models()
+        )
+
+    # results are cached beside the loaded config file
+    if isinstance(DM.filePath, str) and DM.filePath:
+        cache = ScheduleCache(cacheDirFor(DM.filePath))
+        return cachedSchedules(cache, DM.data, limit, optimize, produce, mode)
+    return produce()
+
+
+class ScheduleGenerationJob:
+    """
+    Runs the scheduler on a worker thread so the GUI stays responsive.
+
+    The worker puts (kind, payload) messages on self.results:
+        ("schedule", (index, schedule, seconds_since_start))
+        ("done", number_of_schedules)
+        ("cancelled", number_of_schedules)
+        ("error", exception)
+    The GUI drains them with poll() from an after() loop. Schedules are
+    turned into Models.Schedule.Schedule objects as they arrive.
+    """
+
+    def __init__(self, limit, optimize, workers=1):
+        self.limit = limit
+        self.optimize = optimize
+        self.workers = workers
+        self.results = queue.Queue()
+        self.schedules = []
+        # seconds since start() when each schedule came out of the solver
+        self.timestamps = []
+        self._thread = None
+        self._startedAt = None
+        self._cancelEvent = threading.Event()
+        self._resumeEvent = threading.Event()
+        self._resumeEvent.set()
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError("Generation job already started.")
+        _applyGenerationSettings(self.limit, self.optimize)
+        self._startedAt = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        # The solver can't be interrupted mid-search, we stop before the next schedule
+        self._cancelEvent.set()
+        self._resumeEvent.set()
+
+    def pause(self):
+        self._resumeEvent.clear()
+
+    def resume(self):
+        self._resumeEvent.set()
+
+    @property
+    def paused(self):
+        return not self._resumeEvent.is_set()
+
+    @property
+    def cancelled(self):
+        return self._cancelEvent.is_set()
+
+    def isRunning(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def poll(self):
+        """Return every message the worker has produced so far, without blocking."""
+        messages = []
+        while True:
+            try:
+                messages.append(self.results.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def _run(self):
+        models = None
+        try:
+            models = _scheduleStream(self.limit, self.optimize, self.workers)
+            while len(self.schedules) < self.limit:
+                self._resumeEvent.wait()
+                if self._cancelEvent.is_set():
+                    break
 
-        # checking each schedule
-        for ridx, row in enumerate(sch):
-            # check if the row is a list or not
-            if not isinstance(row, list):
-                pathEntaryVar.set(
-                    f"Invalid: row {ridx} in schedule {ridx} is not a list."
-                )
-                return False
+                schedule_list = next(models, None)
+                if schedule_list is None:
+                    break
 
-            # to check if we have atleat 5 things in the row
-            # at least calss, facult, room, lab ,1 time
-            if len(row) < 5:
-                pathEntaryVar.set(
-                    f"Invalid: row {ridx} in schedule {ridx} has too few elements."
+                elapsed = time.perf_counter() - self._startedAt
+                schedule = Schedule.fromRows(schedule_list)
+                self.schedules.append(schedule)
+                self.timestamps.append(elapsed)
+                self.results.put(
+                    ("schedule", (len(self.schedules) - 1, schedule, elapsed))
                 )
-                return False
-
-    return True
+        except Exception as e:  # noqa: BLE001 any failure goes to the GUI
+            self.results.put(("error", e))
+            return
+        finally:
+            if models is not None:
+                models.close()
+
+        if self._cancelEvent.is_set():
+            self.results.put(("cancelled", len(self.schedules)))
+        else:
+            self.results.put(("done", len(self.schedules)))
 
 
 # stupid
@@ -124,65 +242,37 @@ def stupid():
     exportSchedulesBTN("s", "s")
 
 
-def csvToJson(data):
-    # turn CSV data to json
-    schedules = []
-    current_schedule = []
-
-    for row in data:
-        if not row:
-            if current_schedule:
-                schedules.append(current_schedule)
-                current_schedule = []
-            continue
-
-        current_schedule.append(row)
-
-    # Add last schedule if it exists
-    if current_schedule:
-        schedules.append(current_schedule)
-
-    return schedules
-
-
-def importSchedulesBTN(pathEntaryVar):
-    # This will work for both the csv and json files now
+def importScheduleSourceBTN(pathEntaryVar):
+    # The file is only indexed here, each schedule is parsed when the
+    # viewer shows it, so large files open quickly and in little memory
     filePath = filedialog.askopenfilename(
-        title="Select a JSON file",
-        filetypes=[("JSON files", "*.json"), ("CSV files", "*.csv")],
+        title="Select a schedules file",
+        filetypes=[
+            ("JSON files", "*.json"),
+            ("CSV files", "*.csv"),
+            ("JSON lines files", "*.jsonl"),
+            ("Schedule archives", f"*{ARCHIVE_EXTENSION}"),
+            ("SQLite databases", "*.db"),
+        ],
     )
 
-    if filePath and os.path.exists(filePath):
-        sch = None
-        ext = os.path.splitext(filePath)[1].lower()
-        if ext == ".json":
-            with open(filePath, "r") as file:
-                sch = json.load(file)
-                # If wrapped like {"schedules": [...]}, unwrap it
-                if isinstance(sch, dict) and "schedules" in sch:
-                    # if value is a list of lists, validate it; otherwise return the full dict
-                    val = sch["schedules"]
-                    if isinstance(val, list) and all(isinstance(x, list) for x in val):
-                        if not checkFileContent(val, pathEntaryVar):
-                            return None
-                        sch = val
-                    else:
-                        pathEntaryVar.set(filePath)
-                        return sch  # return original dict for simple test-style JSONs
-        elif ext == ".csv":
-            with open(filePath, "r") as file:
-                reader = csv.reader(file)
-                sch = list(reader)
-                sch = csvToJson(sch)
-                # print(sch)
-                if not checkFileContent(sch, pathEntaryVar):
-                    return None
-    else:
+    if not filePath or not os.path.exists(filePath):
         pathEntaryVar.set(f"Please open a valid file, Unable to open: {filePath}.")
         return None
 
+    try:
+        source = LazyScheduleSource(filePath)
+    except ValueError as e:
+        pathEntaryVar.set(str(e))
+        return None
+
+    if len(source) == 0:
+        source.close()
+        pathEntaryVar.set("Invalid: the file has no schedules.")
+        return None
+
     pathEntaryVar.set(filePath)
-    return sch
+    return source
 
 
 # room controller
@@ -259,8 +349,10 @@ class FacultyController:
             refresh("ConfigPage")
 
     def editFaculty(self, newFaculty, oldName, refresh=None):  # Make refresh optional
-        DM.removeFaculty(oldName)
-        DM.addFaculty(newFaculty)
+        # one change, the old entry comes back if the new one is rejected
+        with DM.batch():
+            DM.removeFaculty(oldName)
+            DM.addFaculty(newFaculty)
         if refresh:  # Only refresh if requested
             refresh("ConfigPage")
 
@@ -309,6 +401,18 @@ class CourseController:
         except Exception as e:
             return str(e)
 
+    def importCourses(self, courses, refresh=None):
+        """Add many courses at once, either all of them or none."""
+        try:
+            with DM.batch():
+                for course in courses:
+                    DM.addCourse(course)
+            if refresh:
+                refresh("ConfigPage")
+            return None
+        except (ValueError, TypeError, KeyError) as e:
+            return str(e)
+
 
 class ClassPatternController:
     global DM
@@ -364,23 +468,25 @@ class ClassPatternController:
     def savePatterns(self, patterns):
         """Save patterns list to the data store (for undo/redo support)."""
         try:
-            # Clear all existing patterns
-            # Keep removing the first pattern until none are left
-            while True:
-                current_patterns = DM.getClassPatterns()
-                if not current_patterns or len(current_patterns) == 0:
-                    break
-                try:
-                    DM.removeClassPattern(0)
-                except Exception as e:
-                    # If we can't remove (maybe index out of bounds), break
-                    print(f"Warning: Could not remove pattern: {e}")
-                    break
-
-            # Add all new patterns
-            if patterns:
-                for pattern in patterns:
-                    DM.addClassPattern(pattern)
+            # one batch, listeners see a single change
+            with DM.batch():
+                # Clear all existing patterns
+                # Keep removing the first pattern until none are left
+                while True:
+                    current_patterns = DM.getClassPatterns()
+                    if not current_patterns or len(current_patterns) == 0:
+                        break
+                    try:
+                        DM.removeClassPattern(0)
+                    except (IndexError, ValueError) as e:
+                        # If we can't remove (maybe index out of bounds), break
+                        print(f"Warning: Could not remove pattern: {e}")
+                        break
+
+                # Add all new patterns
+                if patterns:
+                    for pattern in patterns:
+                        DM.addClassPattern(pattern)
 
             return True
         except Exception as e:
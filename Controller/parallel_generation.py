@@ -0,0 +1,166 @@
+# File Name: parallel_generation.py
+#
+# Splits one scheduler run across several worker processes.
+#
+# The search space is partitioned by pinning a course with many choices
+# (rooms, faculty or labs) to a different subset of those choices in each
+# worker, so every worker explores a disjoint part of the solutions.
+# The parent merges the streams and removes duplicates until the limit is hit.
+
+import copy
+import multiprocessing
+import queue
+
+from scheduler import CombinedConfig, Scheduler
+
+# how long the parent waits on the result queue before checking on workers
+POLL_SECONDS = 0.5
+
+
+def _courseFacultyChoices(data, course):
+    # empty faculty list means any faculty with a preference for the course
+    if course.get("faculty"):
+        return list(course["faculty"])
+    return [
+        f.get("name")
+        for f in data.get("config", {}).get("faculty", [])
+        if course.get("course_id") in f.get("course_preferences", {})
+    ]
+
+
+def _branches(data):
+    # every (course index, field, choices) we could pin, most choices first
+    branches = []
+    for idx, course in enumerate(data.get("config", {}).get("courses", [])):
+        choices = {
+            "room": list(course.get("room", [])),
+            "faculty": _courseFacultyChoices(data, course),
+            "lab": list(course.get("lab", [])),
+        }
+        for field, options in choices.items():
+            if len(options) > 1:
+                branches.append((idx, field, options))
+    branches.sort(key=lambda b: len(b[2]), reverse=True)
+    return branches
+
+
+def _chunks(options, k):
+    # round robin so every chunk gets a similar number of choices
+    return [options[i::k] for i in range(k)]
+
+
+def splitSearchSpace(data, workers):
+    """
+    Return up to `workers` copies of the config data whose solution sets
+    are disjoint and together cover every solution of the original config.
+    """
+    parts = [data]
+    if workers <= 1:
+        return parts
+
+    for idx, field, options in _branches(data):
+        k = min(len(options), workers // len(parts))
+        if k < 2:
+            break
+
+        newParts = []
+        for part in parts:
+            for chunk in _chunks(options, k):
+                pinned = copy.deepcopy(part)
+                pinned["config"]["courses"][idx][field] = chunk
+                newParts.append(pinned)
+        parts = newParts
+
+    return parts
+
+
+def _enumerateWorker(workerId, data, limit, results, stopEvent):
+    # Runs in the child process, results are plain lists so they pickle cheaply
+    try:
+        scheduler = Scheduler(CombinedConfig(**data))
+        for count, schedule in enumerate(scheduler.get_models()):
+            if stopEvent.is_set() or count >= limit:
+                break
+            results.put(
+                ("schedule", workerId, [c.as_csv().split(",") for c in schedule])
+            )
+    except Exception as e:  # noqa: BLE001 reported to the parent process
+        results.put(("error", workerId, str(e)))
+        return
+    results.put(("done", workerId, None))
+
+
+class EnumerationWorkers:
+    """
+    One spawned process per config part, all reporting to one queue.
+
+    Iterating gives ("schedule", workerId, rows) and ("done", workerId, None)
+    messages until every worker has finished. stop() ends all of them.
+    """
+
+    def __init__(self, parts, limit):
+        ctx = multiprocessing.get_context("spawn")
+        self._results = ctx.Queue()
+        self._stopEvent = ctx.Event()
+        self._procs = [
+            ctx.Process(
+                target=_enumerateWorker,
+                args=(i, part, limit, self._results, self._stopEvent),
+                daemon=True,
+            )
+            for i, part in enumerate(parts)
+        ]
+        for p in self._procs:
+            p.start()
+
+    def __iter__(self):
+        running = len(self._procs)
+        while running:
+            try:
+                kind, workerId, payload = self._results.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                # a worker that died without reporting still counts as finished
+                if not any(p.is_alive() for p in self._procs):
+                    return
+                continue
+
+            if kind == "error":
+                raise ValueError(f"Worker {workerId} failed: {payload}")
+            if kind == "done":
+                running -= 1
+            yield kind, workerId, payload
+
+    def stop(self):
+        self._stopEvent.set()
+        for p in self._procs:
+            p.terminate()
+        for p in self._procs:
+            p.join()
+        self._results.close()
+
+
+def iterParallelSchedules(data, limit, workers):
+    """
+    Yield up to `limit` unique schedules (lists of csv rows) generated by
+    up to `workers` processes working on disjoint parts of the search.
+    """
+    data = copy.deepcopy(data)
+    data.get("config", {}).pop("class_patterns", None)
+    pool = EnumerationWorkers(splitSearchSpace(data, workers), limit)
+
+    seen = set()
+    produced = 0
+    try:
+        for kind, _, payload in pool:
+            if kind != "schedule":
+                continue
+            key = tuple(tuple(row) for row in payload)
+            if key in seen:
+                continue
+            seen.add(key)
+            produced += 1
+            yield payload
+            if produced >= limit:
+                break
+    finally:
+        pool.stop()
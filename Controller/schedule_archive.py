@@ -0,0 +1,192 @@
+# File Name: schedule_archive.py
+#
+# Compact binary archive for generated schedules (.sched files).
+#
+# Layout, all little endian:
+#   header   magic, version, record size, schedule count, string count and
+#            the byte offsets of the three sections below
+#   records  one fixed-width record per meeting:
+#            row, course, faculty, room, lab (string ids), day, lab flag,
+#            start and end minute
+#   index    schedule count + 1 record numbers, schedule k is
+#            records index[k]:index[k + 1]
+#   strings  every course/faculty/room/lab name once, length prefixed utf-8
+#
+# The reader maps the file with mmap, so opening only reads the header and the
+# string table, and schedule k is decoded on its own in O(1).
+
+import mmap
+import struct
+
+from Models.Schedule import Schedule, ScheduledCourse
+from Models.ScheduleSet import NO_MEETING
+
+from .schedule_io import ScheduleWriter
+
+MAGIC = b"SCHEDARC"
+VERSION = 1
+ARCHIVE_EXTENSION = ".sched"
+
+HEADER = struct.Struct("<8sHHIIQQQ")
+RECORD = struct.Struct("<IIIIIbBHH")
+_OFFSET = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+
+
+class ArchiveWriter(ScheduleWriter):
+    """Streams schedules into a .sched archive, the header is written on close."""
+
+    fileMode = "wb"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._file.write(b"\0" * HEADER.size)
+        self._strings = []
+        self._lookup = {}
+        self._index = [0]
+        self._records = 0
+
+    def _stringId(self, value):
+        if value not in self._lookup:
+            self._lookup[value] = len(self._strings)
+            self._strings.append(value)
+        return self._lookup[value]
+
+    def _writeSchedule(self, schedule):
+        buf = bytearray()
+        for rowIdx, row in enumerate(schedule):
+            if not isinstance(row, ScheduledCourse):
+                row = ScheduledCourse.fromRow(row)
+            ids = [
+                self._stringId(v) for v in (row.course, row.faculty, row.room, row.lab)
+            ]
+            for day, start, end, isLab in row.meetings or [(NO_MEETING, 0, 0, False)]:
+                buf += RECORD.pack(rowIdx, *ids, day, int(isLab), start, end)
+                self._records += 1
+        self._file.write(buf)
+        self._index.append(self._records)
+
+    def _finish(self):
+        recordsOffset = HEADER.size
+        indexOffset = self._file.tell()
+        self._file.write(struct.pack(f"<{len(self._index)}Q", *self._index))
+
+        stringsOffset = self._file.tell()
+        for value in self._strings:
+            data = value.encode("utf-8")
+            self._file.write(_LENGTH.pack(len(data)) + data)
+
+        self._file.seek(0)
+        self._file.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                RECORD.size,
+                self.count,
+                len(self._strings),
+                stringsOffset,
+                indexOffset,
+                recordsOffset,
+            )
+        )
+
+
+class ScheduleArchive:
+    """
+    Read only view of a .sched file. archive[k] is schedule k as a Schedule,
+    archive.rows(k) the same schedule as plain csv rows.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")  # noqa: SIM115 closed by close()
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files
+            self._file.close()
+            raise ValueError(f"{path} is not a schedule archive.") from None
+
+        try:
+            self._readHeader()
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def _readHeader(self):
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{self.path} is not a schedule archive.")
+        (
+            magic,
+            version,
+            recordSize,
+            self._count,
+            stringCount,
+            stringsOffset,
+            self._indexOffset,
+            self._recordsOffset,
+        ) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a schedule archive.")
+        if version != VERSION or recordSize != RECORD.size:
+            raise ValueError(f"Unsupported schedule archive version {version}.")
+
+        self.strings = []
+        pos = stringsOffset
+        for _ in range(stringCount):
+            (length,) = _LENGTH.unpack_from(self._map, pos)
+            pos += _LENGTH.size
+            self.strings.append(self._map[pos : pos + length].decode("utf-8"))
+            pos += length
+
+    def __len__(self):
+        return self._count
+
+    def _courses(self, k):
+        if k < 0:
+            k += self._count
+        if not 0 <= k < self._count:
+            raise IndexError(f"Schedule {k} out of range")
+
+        first = _OFFSET.unpack_from(self._map, self._indexOffset + k * 8)[0]
+        last = _OFFSET.unpack_from(self._map, self._indexOffset + (k + 1) * 8)[0]
+        start = self._recordsOffset + first * RECORD.size
+        end = self._recordsOffset + last * RECORD.size
+
+        courses = []
+        lastRow = None
+        strings = self.strings
+        for rowIdx, c, f, r, lab, day, isLab, s, e in RECORD.iter_unpack(
+            self._map[start:end]
+        ):
+            if rowIdx != lastRow:
+                lastRow = rowIdx
+                courses.append((strings[c], strings[f], strings[r], strings[lab], []))
+            if day != NO_MEETING:
+                courses[-1][4].append((day, s, e, bool(isLab)))
+        return courses
+
+    def __getitem__(self, k):
+        return Schedule(ScheduledCourse(*course) for course in self._courses(k))
+
+    def rows(self, k):
+        return self[k].toRows()
+
+    def toRows(self):
+        return [self.rows(k) for k in range(self._count)]
+
+    def __iter__(self):
+        for k in range(self._count):
+            yield self[k]
+
+    def close(self):
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.close()
+        return False
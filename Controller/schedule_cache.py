@@ -0,0 +1,127 @@
+# File Name: schedule_cache.py
+#
+# On-disk cache of generated schedules.
+#
+# Entries are keyed by a hash of the config (canonical json), the optimizer
+# flags and the generation mode (single, parallel or decomposed), since each
+# mode finds the schedules in its own order. The limit is stored in the entry instead of the key, so a
+# run asking for more schedules than are cached starts from the cached prefix.
+
+import hashlib
+import json
+import os
+
+CACHE_DIRNAME = ".cache"
+
+# config lists where order does not change the problem
+_UNORDERED_LISTS = {"rooms", "labs", "room", "lab", "conflicts", "faculty"}
+
+
+def cacheDirFor(configPath):
+    """Cache directory that sits beside the given config file."""
+    return os.path.join(os.path.dirname(os.path.abspath(configPath)), CACHE_DIRNAME)
+
+
+def _normalize(value, key=None):
+    if isinstance(value, dict):
+        return {k: _normalize(v, k) for k, v in sorted(value.items())}
+    if isinstance(value, list):
+        items = [_normalize(v) for v in value]
+        if key in _UNORDERED_LISTS and all(isinstance(v, str) for v in items):
+            return sorted(items)
+        return items
+    return value
+
+
+def configFingerprint(data, optimize, mode="single"):
+    """
+    Hash of the config, optimizer flags and generation mode, ignoring key
+    and list order.
+    """
+    data = {
+        k: v for k, v in (data or {}).items() if k not in ("limit", "optimizer_flags")
+    }
+    config = data.get("config")
+    if isinstance(config, dict) and "class_patterns" in config:
+        # generation drops these before building the scheduler config
+        data["config"] = {k: v for k, v in config.items() if k != "class_patterns"}
+
+    canonical = json.dumps(
+        {
+            "data": _normalize(data),
+            "optimizer_flags": sorted(optimize or []),
+            "mode": mode,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ScheduleCache:
+    def __init__(self, cacheDir):
+        self.cacheDir = cacheDir
+
+    def _path(self, key):
+        return os.path.join(self.cacheDir, f"{key}.json")
+
+    def load(self, key):
+        """Return {"complete": bool, "schedules": [...]} or None on a miss."""
+        try:
+            with open(self._path(key), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("schedules"), list):
+            return None
+        return entry
+
+    def store(self, key, schedules, complete):
+        os.makedirs(self.cacheDir, exist_ok=True)
+        path = self._path(key)
+        tmpPath = path + ".tmp"
+        # write then rename so a crash never leaves half an entry behind
+        with open(tmpPath, "w") as f:
+            json.dump({"complete": complete, "schedules": schedules}, f)
+        os.replace(tmpPath, path)
+
+
+def cachedSchedules(cache, data, limit, optimize, produce, mode="single"):
+    """
+    Yield up to `limit` schedules, serving what the cache already has first.
+
+    produce() must return a fresh generator of schedules (lists of csv rows).
+    It is only called when the cached prefix is too short. Schedules that were
+    already served from the cache are skipped, then new ones are added to the
+    cache entry when the generator finishes or is closed.
+    """
+    key = configFingerprint(data, optimize, mode)
+    entry = cache.load(key) or {"complete": False, "schedules": []}
+    cached = entry["schedules"]
+
+    for schedule in cached[:limit]:
+        yield schedule
+    if len(cached) >= limit or entry["complete"]:
+        return
+
+    seen = {json.dumps(sch) for sch in cached}
+    found = list(cached)
+    complete = False
+    stream = produce()
+    try:
+        for schedule in stream:
+            schedule_key = json.dumps(schedule)
+            if schedule_key in seen:
+                continue
+            seen.add(schedule_key)
+            found.append(schedule)
+            yield schedule
+            if len(found) >= limit:
+                break
+        else:
+            # solver ran out, no larger limit can give more
+            complete = True
+    finally:
+        stream.close()
+        if len(found) > len(cached) or complete:
+            cache.store(key, found, complete)
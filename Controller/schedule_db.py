@@ -0,0 +1,246 @@
+# File Name: schedule_db.py
+#
+# SQLite export of generated schedules (.db files) and queries across them.
+#
+# Tables:
+#   schedules    id                          (0 based, same as the viewer)
+#   assignments  id, schedule_id, row, course, faculty, room, lab
+#   meetings     assignment_id, schedule_id, day, start_min, end_min, is_lab
+# Days are 0 for MON like Models.Schedule, times are minutes since midnight.
+#
+# Questions like "which schedules put CMSC 140 in Roddy 136 before 10:00"
+# become one indexed query instead of loading every schedule into Python.
+
+import os
+import pathlib
+import sqlite3
+
+from Models.Schedule import DAY_INDEX, Schedule, ScheduledCourse
+
+from .schedule_io import ScheduleWriter
+
+# commit every this many schedules while writing
+COMMIT_EVERY = 500
+
+_SCHEMA = """
+CREATE TABLE schedules (id INTEGER PRIMARY KEY);
+CREATE TABLE assignments (
+    id INTEGER PRIMARY KEY,
+    schedule_id INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    course TEXT NOT NULL,
+    faculty TEXT NOT NULL,
+    room TEXT NOT NULL,
+    lab TEXT NOT NULL
+);
+CREATE TABLE meetings (
+    assignment_id INTEGER NOT NULL,
+    schedule_id INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    start_min INTEGER NOT NULL,
+    end_min INTEGER NOT NULL,
+    is_lab INTEGER NOT NULL
+);
+"""
+
+# built after the bulk insert, which is faster than keeping them up to date
+_INDEXES = """
+CREATE INDEX assignments_schedule ON assignments (schedule_id, row);
+CREATE INDEX assignments_course ON assignments (course, room);
+CREATE INDEX assignments_faculty ON assignments (faculty);
+CREATE INDEX assignments_room ON assignments (room);
+CREATE INDEX assignments_lab ON assignments (lab);
+CREATE INDEX meetings_assignment ON meetings (assignment_id);
+CREATE INDEX meetings_schedule ON meetings (schedule_id);
+CREATE INDEX meetings_time ON meetings (day, start_min);
+"""
+
+
+class SqliteWriter(ScheduleWriter):
+    """Streams schedules into a new SQLite file, indexes are built on close."""
+
+    # sqlite opens the file itself
+    fileMode = None
+
+    def __init__(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+        super().__init__(path)
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode = MEMORY")
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.executescript(_SCHEMA)
+        self._nextAssignment = 0
+
+    def _writeSchedule(self, schedule):
+        scheduleId = self.count
+        assignments = []
+        meetings = []
+        for rowIdx, row in enumerate(schedule):
+            if not isinstance(row, ScheduledCourse):
+                row = ScheduledCourse.fromRow(row)
+            assignmentId = self._nextAssignment
+            self._nextAssignment += 1
+            assignments.append(
+                (
+                    assignmentId,
+                    scheduleId,
+                    rowIdx,
+                    row.course,
+                    row.faculty,
+                    row.room,
+                    row.lab,
+                )
+            )
+            meetings.extend(
+                (assignmentId, scheduleId, day, start, end, int(isLab))
+                for day, start, end, isLab in row.meetings
+            )
+
+        self._db.execute("INSERT INTO schedules (id) VALUES (?)", (scheduleId,))
+        self._db.executemany(
+            "INSERT INTO assignments VALUES (?, ?, ?, ?, ?, ?, ?)", assignments
+        )
+        self._db.executemany("INSERT INTO meetings VALUES (?, ?, ?, ?, ?, ?)", meetings)
+
+    def _flush(self):
+        if self.count % COMMIT_EVERY == 0:
+            self._db.commit()
+
+    def _finish(self):
+        self._db.executescript(_INDEXES)
+        self._db.commit()
+        self._db.close()
+        self._db = None
+
+
+def _minutes(value):
+    # "10:00" or minutes since midnight
+    if isinstance(value, str):
+        hours, _, minutes = value.partition(":")
+        if not (hours.isdigit() and minutes.isdigit()):
+            raise ValueError(f"Invalid time: {value}, expected HH:MM.")
+        return int(hours) * 60 + int(minutes)
+    return int(value)
+
+
+class ScheduleDatabase:
+    """
+    Read only view of a .db file. db[k] is schedule k as a Schedule and
+    db.schedulesWhere(...) finds schedules without loading them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        if not os.path.exists(path):
+            raise ValueError(f"Unable to open: {path}.")
+        # the viewer reads from its prefetch thread too, it holds a lock
+        uri = pathlib.Path(path).resolve().as_uri() + "?mode=ro"
+        self._db = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        try:
+            (self._count,) = self._db.execute(
+                "SELECT COUNT(*) FROM schedules"
+            ).fetchone()
+        except sqlite3.DatabaseError:
+            self._db.close()
+            raise ValueError(f"{path} is not a schedule database.") from None
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self._count
+        if not 0 <= k < self._count:
+            raise IndexError(f"Schedule {k} out of range")
+
+        courses = {}
+        for assignmentId, course, faculty, room, lab in self._db.execute(
+            "SELECT id, course, faculty, room, lab FROM assignments "
+            "WHERE schedule_id = ? ORDER BY row",
+            (k,),
+        ):
+            courses[assignmentId] = (course, faculty, room, lab, [])
+        for assignmentId, day, start, end, isLab in self._db.execute(
+            "SELECT assignment_id, day, start_min, end_min, is_lab FROM meetings "
+            "WHERE schedule_id = ? ORDER BY rowid",
+            (k,),
+        ):
+            courses[assignmentId][4].append((day, start, end, bool(isLab)))
+        return Schedule(ScheduledCourse(*course) for course in courses.values())
+
+    def rows(self, k):
+        return self[k].toRows()
+
+    def toRows(self):
+        return [self.rows(k) for k in range(self._count)]
+
+    def __iter__(self):
+        for k in range(self._count):
+            yield self[k]
+
+    def schedulesWhere(
+        self,
+        course=None,
+        faculty=None,
+        room=None,
+        lab=None,
+        day=None,
+        is_lab=None,
+        startsBefore=None,
+        startsAfter=None,
+    ):
+        """
+        Sorted ids of the schedules with one course matching every condition
+        given. course "CMSC 140" also matches its sections ("CMSC 140.01"),
+        day is "MON" or 0, times are "HH:MM" or minutes.
+        """
+        where = []
+        params = []
+        if course is not None:
+            # the section suffix starts with ".", and "/" sorts right after it
+            where.append("(a.course = ? OR (a.course >= ? AND a.course < ?))")
+            params += [course, course + ".", course + "/"]
+        for column, value in (("faculty", faculty), ("room", room), ("lab", lab)):
+            if value is not None:
+                where.append(f"a.{column} = ?")
+                params.append(value)
+
+        meetingWhere = []
+        if day is not None:
+            if isinstance(day, str):
+                if day.upper() not in DAY_INDEX:
+                    raise ValueError(f"Unknown day: {day}")
+                day = DAY_INDEX[day.upper()]
+            meetingWhere.append("m.day = ?")
+            params.append(day)
+        if is_lab is not None:
+            meetingWhere.append("m.is_lab = ?")
+            params.append(int(bool(is_lab)))
+        if startsBefore is not None:
+            meetingWhere.append("m.start_min < ?")
+            params.append(_minutes(startsBefore))
+        if startsAfter is not None:
+            meetingWhere.append("m.start_min >= ?")
+            params.append(_minutes(startsAfter))
+
+        query = "SELECT DISTINCT a.schedule_id FROM assignments a"
+        if meetingWhere:
+            query += " JOIN meetings m ON m.assignment_id = a.id"
+        conditions = where + meetingWhere
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY a.schedule_id"
+        return [scheduleId for (scheduleId,) in self._db.execute(query, params)]
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,367 @@
+# File Name: schedule_io.py
+#
+# Streaming writers (and readers) for generated schedules.
+#
+# Each writer writes and flushes one schedule at a time, so long runs use
+# constant memory and whatever was written survives a crash.
+# A schedule is a list of csv rows: [course, faculty, room, lab, *meetings]
+# The binary "sched" format lives in schedule_archive.py.
+
+import abc
+import csv
+import json
+import os
+
+from Models.Schedule import parseMeetingText
+
+SCHEDULE_FORMATS = ("json", "jsonl", "csv", "sched", "db")
+
+
+class ScheduleWriter(abc.ABC):
+    """
+    Base class, subclasses implement _writeSchedule (and maybe _finish).
+    The base opens path as self._file in fileMode, "w" for text, "wb" for
+    binary, or not at all when fileMode is None.
+    """
+
+    fileMode = "w"
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._closed = False
+        self._file = None
+        if self.fileMode is not None:
+            # text files get newline="" so csv rows end in \r\n everywhere
+            newline = "" if "b" not in self.fileMode else None
+            self._file = open(path, self.fileMode, newline=newline)  # noqa: SIM115 closed by close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        self.close()
+        return False
+
+    def write(self, schedule):
+        self._writeSchedule(schedule)
+        self.count += 1
+        self._flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._finish()
+        finally:
+            if self._file is not None:
+                self._file.close()
+
+    @abc.abstractmethod
+    def _writeSchedule(self, schedule):
+        """Write one schedule, a list of csv rows or a Schedule."""
+
+    def _flush(self):
+        # after every schedule
+        if self._file is not None:
+            self._file.flush()
+
+    def _finish(self):  # noqa: B027 optional hook, most writers need nothing
+        pass
+
+
+class JsonArrayWriter(ScheduleWriter):
+    # Same bytes as json.dump(all_schedules, f, indent=4), written piece by piece.
+    # An interrupted file is only missing the closing bracket.
+
+    def _writeSchedule(self, schedule):
+        body = json.dumps(schedule, indent=4).replace("\n", "\n    ")
+        self._file.write(("[\n    " if self.count == 0 else ",\n    ") + body)
+
+    def _finish(self):
+        self._file.write("\n]" if self.count else "[]")
+
+
+class JsonLinesWriter(ScheduleWriter):
+    # one schedule per line, every line is valid on its own
+
+    def _writeSchedule(self, schedule):
+        self._file.write(json.dumps(schedule) + "\n")
+
+
+class CsvScheduleWriter(ScheduleWriter):
+    # schedules are separated by an empty row, same as the old CLI export
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._writer = csv.writer(self._file)
+
+    def _writeSchedule(self, schedule):
+        self._writer.writerow([])
+        self._writer.writerows(schedule)
+
+
+def openScheduleWriter(path, fmt):
+    """Return the streaming writer for fmt, one of SCHEDULE_FORMATS."""
+    # imported here, both build on ScheduleWriter
+    from .schedule_archive import ArchiveWriter
+    from .schedule_db import SqliteWriter
+
+    writers = {
+        "json": JsonArrayWriter,
+        "jsonl": JsonLinesWriter,
+        "csv": CsvScheduleWriter,
+        "sched": ArchiveWriter,
+        "db": SqliteWriter,
+    }
+    if fmt not in writers:
+        raise ValueError(f"Unsupported schedule format: {fmt}")
+    return writers[fmt](path)
+
+
+def formatFromPath(path):
+    """Schedule format of a file name, from its extension."""
+    fmt = os.path.splitext(path)[1].lower().lstrip(".")
+    if fmt not in SCHEDULE_FORMATS:
+        raise ValueError(f"Unsupported schedule format: {path}")
+    return fmt
+
+
+def _checkCsvRow(row, line, ridx, idx):
+    where = f"line {line} (row {ridx} in schedule {idx})"
+    # at least course, faculty, room, lab and one time
+    if len(row) < 5:
+        raise ValueError(f"Invalid: {where} has too few elements.")
+    for cell in row[4:]:
+        if parseMeetingText(cell) is None:
+            raise ValueError(
+                f"Invalid: {where} has a bad meeting time {cell!r}, "
+                "expected DAY HH:MM-HH:MM."
+            )
+
+
+def iterCsvRows(lines):
+    """
+    Yield (line, row) for the csv rows of an iterable of text lines, line is
+    the (1 based) line the row ends on. Empty trailing cells are dropped, so
+    a blank row, which spreadsheets save as ",,,,", comes out as [].
+    Blank rows separate schedules.
+    """
+    reader = csv.reader(lines)
+    for row in reader:
+        end = len(row)
+        while end and not row[end - 1].strip():
+            end -= 1
+        yield reader.line_num, row[:end]
+
+
+def iterCsvSchedules(path, validate=False):
+    """
+    Yield the schedules of a csv file, schedules are split by blank rows.
+    With validate every row is checked as it is read and errors name the
+    line of the file, so a large export is read once in constant memory.
+    """
+    with open(path, "r", newline="") as f:
+        current = []
+        idx = 0
+        for line, row in iterCsvRows(f):
+            if not row:
+                if current:
+                    yield current
+                    current = []
+                    idx += 1
+                continue
+            if validate:
+                _checkCsvRow(row, line, len(current), idx)
+            current.append(row)
+        if current:
+            yield current
+
+
+class NotScheduleListError(ValueError):
+    """The json is valid but is not a list of schedules."""
+
+
+def checkSchedule(idx, schedule):
+    """Raise ValueError if one schedule is not a list of csv-style rows."""
+    if not isinstance(schedule, list):
+        raise NotScheduleListError(f"Invalid: schedule {idx} is not a list.")
+    if len(schedule) == 0:
+        raise ValueError(f"Invalid: schedule {idx} is empty.")
+    for ridx, row in enumerate(schedule):
+        if not isinstance(row, list):
+            raise ValueError(f"Invalid: row {ridx} in schedule {idx} is not a list.")
+        # at least course, faculty, room, lab and one time
+        if len(row) < 5:
+            raise ValueError(
+                f"Invalid: row {ridx} in schedule {idx} has too few elements."
+            )
+    return schedule
+
+
+class _JsonStream:
+    # Decodes one json value at a time from a file. The buffer only holds
+    # what is not consumed yet plus one chunk, so memory is bounded by the
+    # largest single value.
+
+    def __init__(self, f, chunkSize):
+        self._file = f
+        self._chunkSize = chunkSize
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        # characters already dropped from the front of the buffer
+        self._dropped = 0
+        self._eof = False
+
+    def _more(self, size=None):
+        chunk = self._file.read(size or self._chunkSize)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._dropped += self._pos
+        self._pos = 0
+        return True
+
+    def offset(self):
+        """Position in the file, in characters."""
+        return self._dropped + self._pos
+
+    def peek(self):
+        """Next non whitespace character, "" at the end of the file."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._more():
+                return ""
+
+    def take(self, expected):
+        char = self.peek()
+        if char not in expected:
+            found = repr(char) if char else "end of file"
+            raise ValueError(
+                f"Invalid json: expected one of {expected!r}, found {found}."
+            )
+        self._pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                # probably cut off by the chunk, read more (doubling) and retry
+                if self._eof or not self._more(max(self._chunkSize, len(self._buf))):
+                    raise ValueError(f"Invalid json: {e}") from None
+                continue
+            # a number can end exactly at the buffer end and still go on
+            if (
+                end == len(self._buf)
+                and not self._eof
+                and self._more(max(self._chunkSize, len(self._buf)))
+            ):
+                continue
+            self._pos = end
+            return value
+
+
+def _findSchedulesArray(stream):
+    # walk {"key": value, ...} until "schedules", skipping the other values
+    stream.take("{")
+    if stream.peek() == "}":
+        return False
+    while True:
+        key = stream.value()
+        stream.take(":")
+        if key == "schedules":
+            return stream.peek() == "["
+        stream.value()
+        if stream.take(",}") == "}":
+            return False
+
+
+def _iterSchedulesArray(f, path, chunkSize):
+    # yields (start, end, schedule), start and end are offsets in f
+    stream = _JsonStream(f, chunkSize)
+    first = stream.peek()
+    if first == "{":
+        if not _findSchedulesArray(stream):
+            raise NotScheduleListError(f"{path} does not hold a list of schedules.")
+    elif first != "[":
+        raise NotScheduleListError(f"{path} does not hold a list of schedules.")
+
+    stream.take("[")
+    if stream.peek() == "]":
+        stream.take("]")
+        return
+    while True:
+        stream.peek()
+        start = stream.offset()
+        schedule = stream.value()
+        yield start, stream.offset(), schedule
+        if stream.take(",]") == "]":
+            return
+
+
+def iterJsonSchedules(path, chunkSize=1 << 16, validate=True):
+    """
+    Yield the schedules of a json file one at a time, checked as they are
+    read unless validate is False. Works on a plain list and on
+    {"schedules": [...]}. Raises NotScheduleListError when the json holds
+    something else.
+    """
+    with open(path, "r") as f:
+        for idx, (_, _, schedule) in enumerate(_iterSchedulesArray(f, path, chunkSize)):
+            yield checkSchedule(idx, schedule) if validate else schedule
+
+
+def iterJsonScheduleSpans(path, chunkSize=1 << 16):
+    """
+    Yield the (start, end) byte span of every schedule in a json file, read
+    the same way as iterJsonSchedules. Nothing is checked, json.loads of a
+    span gives the schedule back.
+    """
+    # latin-1 keeps one character per byte, json syntax is plain ascii and
+    # the bytes of a utf-8 character never look like it
+    with open(path, "r", encoding="latin-1", newline="") as f:
+        for start, end, _ in _iterSchedulesArray(f, path, chunkSize):
+            yield start, end
+
+
+def iterScheduleFile(path):
+    """Yield every schedule (list of csv rows) stored in a file of any format."""
+    fmt = formatFromPath(path)
+    if fmt == "sched":
+        from .schedule_archive import ScheduleArchive
+
+        with ScheduleArchive(path) as archive:
+            for k in range(len(archive)):
+                yield archive.rows(k)
+    elif fmt == "db":
+        from .schedule_db import ScheduleDatabase
+
+        with ScheduleDatabase(path) as db:
+            for k in range(len(db)):
+                yield db.rows(k)
+    elif fmt == "csv":
+        yield from iterCsvSchedules(path)
+    elif fmt == "jsonl":
+        with open(path, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        yield from iterJsonSchedules(path, validate=False)
+
+
+def convertSchedules(src, dst):
+    """Copy every schedule from src into dst, formats come from the extensions."""
+    with openScheduleWriter(dst, formatFromPath(dst)) as writer:
+        for schedule in iterScheduleFile(src):
+            writer.write(schedule)
+    return writer.count
@@ -0,0 +1,205 @@
+# File Name: schedule_layout.py
+#
+# Week grid layout shared by the PDF, SVG and Tk schedule renderers.
+#
+# scheduleLayout turns one room's (or faculty member's) classes into the hour
+# range of the grid and a list of positioned blocks, once. The result is
+# cached per (name, classes), so switching views or exporting the same
+# schedule again reuses it. Each backend only scales the layout to its own
+# page size and draws it.
+#
+# sortSchedulesByTime lives here too, so every renderer (including the
+# compact .htm viewer, which has no reportlab) orders classes the same way.
+
+import math
+import re
+from functools import lru_cache
+
+from Models.Schedule import ScheduledCourse, formatMeeting, parseMeetingText
+
+GRID_DAYS = ["MON", "TUE", "WED", "THU", "FRI"]
+
+COLORLIST = [
+    "#6fa8dc",
+    "#93c47d",
+    "#f6b26b",
+    "#e06666",
+    "#8e7cc3",
+    "#d5b451",
+    "#76a5af",
+    "#c27ba0",
+    "#a4c2f4",
+    "#b6d7a8",
+]
+
+_TIME_PATTERN = re.compile(r"(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})")
+
+
+@lru_cache(maxsize=4096)
+def _timeSpan(item):
+    match = _TIME_PATTERN.search(item)
+    if not match:
+        return None
+    start_h, start_m, end_h, end_m = map(int, match.groups())
+    return (start_h + start_m / 60, end_h + end_m / 60)
+
+
+def _hourRange(times):
+    # (first hour, last hour rounded up) of (start, end) hour spans
+    if not times:
+        return None
+
+    earliest_start = min(t[0] for t in times)
+    latest_end = max(t[1] for t in times)
+    rounded_latest_end = math.ceil(latest_end)
+
+    return (int(earliest_start), rounded_latest_end)
+
+
+def getTimeRange(data):
+    times = []
+    for _class in data:
+        if hasattr(_class, "meetings"):
+            times.extend((s / 60, e / 60) for _, s, e, _ in _class.meetings)
+            continue
+        for item in _class:
+            span = _timeSpan(item) if isinstance(item, str) else None
+            if span:
+                times.append(span)
+    return _hourRange(times)
+
+
+def _meetingsOf(row):
+    # int meetings of a row, ScheduledCourse already has them
+    if isinstance(row, ScheduledCourse):
+        return row.meetings
+    meetings = []
+    for entry in row[4:]:
+        meeting = parseMeetingText(entry) if isinstance(entry, str) else None
+        if meeting is not None:
+            meetings.append(meeting)
+    return meetings
+
+
+def sortSchedulesByTime(data):
+    # Priority for the days, no classes on SAT, SUN but who knows..
+    # (anything past FRI is ignored like before)
+    def getEarliestMeeting(schedule):
+        times = [(day, start) for day, start, _, _ in _meetingsOf(schedule) if day <= 4]
+        return min(times) if times else (float("inf"), float("inf"))
+
+    # sort using the funciton we give it, usingt he times
+    return sorted(data, key=getEarliestMeeting)
+
+
+class Block:
+    """One meeting placed on the grid, times are minutes since midnight."""
+
+    __slots__ = (
+        "classIndex",
+        "course",
+        "day",
+        "end",
+        "meeting",
+        "second",
+        "seconds",
+        "start",
+        "startHours",
+    )
+
+    def __init__(self, day, start, end, classIndex, course, second, meeting):
+        self.day = day
+        self.start = start
+        self.end = end
+        # hours from midnight and length in seconds, computed the way the
+        # renderers always did so the drawings come out the same
+        self.startHours = start // 60 + (start % 60) / 60
+        self.seconds = (end - start) % (24 * 60) * 60
+        self.classIndex = classIndex
+        self.course = course
+        # professor when grouped by room, room when grouped by faculty
+        self.second = second
+        self.meeting = meeting
+
+    def __repr__(self):
+        return f"Block({self.course!r}, {GRID_DAYS[self.day]} {self.start}-{self.end})"
+
+
+class Layout:
+    __slots__ = ("blocks", "endHour", "name", "startHour")
+
+    def __init__(self, name, startHour, endHour, blocks):
+        self.name = name
+        self.startHour = startHour
+        self.endHour = endHour
+        self.blocks = blocks
+
+    def __repr__(self):
+        return f"Layout({self.name!r}, {self.startHour}-{self.endHour}, {len(self.blocks)} blocks)"
+
+
+@lru_cache(maxsize=1024)
+def _layout(name, classes):
+    # classes is a tuple of (course, second, *meetings) tuples of text
+    startHour, endHour = getTimeRange(classes)
+
+    blocks = []
+    for classIndex, (course, second, *meetings) in enumerate(classes):
+        for meeting in meetings:
+            parsed = (
+                parseMeetingText(meeting.replace("^", ""))
+                if isinstance(meeting, str)
+                else None
+            )
+            if parsed is None or parsed[0] >= len(GRID_DAYS):
+                continue
+            day, start, end, _ = parsed
+            blocks.append(Block(day, start, end, classIndex, course, second, meeting))
+    return Layout(name, startHour, endHour, tuple(blocks))
+
+
+@lru_cache(maxsize=1024)
+def _typedLayout(name, classes):
+    # classes is a tuple of (course, second, meetings), meetings being the
+    # int tuples of a ClassRow, so nothing is parsed
+    times = [(s / 60, e / 60) for _, _, meetings in classes for _, s, e, _ in meetings]
+    startHour, endHour = _hourRange(times)
+
+    blocks = []
+    for classIndex, (course, second, meetings) in enumerate(classes):
+        for meeting in meetings:
+            day, start, end, _ = meeting
+            if day >= len(GRID_DAYS):
+                continue
+            blocks.append(
+                Block(
+                    day, start, end, classIndex, course, second, formatMeeting(meeting)
+                )
+            )
+    return Layout(name, startHour, endHour, tuple(blocks))
+
+
+def scheduleLayout(room_classes):
+    """Layout for [name, classes] as produced by orderedSchedules."""
+    name, classes = room_classes
+    if classes and all(hasattr(cls, "meetings") for cls in classes):
+        return _typedLayout(
+            name, tuple((cls[0], cls[1], cls.meetings) for cls in classes)
+        )
+    return _layout(name, tuple(tuple(cls) for cls in classes))
+
+
+def to12h(hour, minute):
+    suffix = "AM" if hour < 12 else "PM"
+    display_hour = hour % 12
+    if display_hour == 0:
+        display_hour = 12
+    return f"{display_hour}:{minute:02d} {suffix}"
+
+
+def blockTimes(block):
+    """Start and end of a block, like 9:00 AM - 9:50 AM."""
+    return (
+        f"{to12h(block.start // 60, block.start % 60)} - "
+        f"{to12h(block.end // 60, block.end % 60)}"
+    )
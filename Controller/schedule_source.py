@@ -0,0 +1,278 @@
+# File Name: schedule_source.py
+#
+# Lazy, read-on-demand access to a schedules file for the viewer.
+#
+# Opening only builds an index of where each schedule starts and ends in the
+# file (one scan, nothing is parsed). A schedule is parsed the first time it
+# is shown and kept in a small LRU window, and a background thread parses the
+# neighbours the user is likely to look at next.
+
+import io
+import json
+import mmap
+import queue
+import re
+import threading
+from collections import OrderedDict
+
+from Models.Schedule import Schedule
+
+from .schedule_archive import ScheduleArchive
+from .schedule_db import ScheduleDatabase
+from .schedule_io import (
+    NotScheduleListError,
+    _checkCsvRow,
+    checkSchedule,
+    formatFromPath,
+    iterCsvRows,
+    iterJsonScheduleSpans,
+)
+
+# one whole schedule, a list of rows of strings. Matching a schedule at a
+# time keeps the scan in C for the files we write ourselves.
+_JSON_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_JSON_ROW = rb"\[(?:\s*+" + _JSON_STRING + rb"\s*+,?)*+\s*+\]"
+_JSON_SCHEDULE = re.compile(rb"\[(?:\s*+" + _JSON_ROW + rb"\s*+,?)*+\s*+\]")
+_SEPARATOR = re.compile(rb"[\s,]*")
+_END = re.compile(rb"\s*\]\s*")
+
+
+def _indexJsonSchedules(buf, start):
+    # fast path, None when the file has some other shape
+    spans = []
+    pos = start
+    for match in _JSON_SCHEDULE.finditer(buf, start):
+        if not _SEPARATOR.fullmatch(buf, pos, match.start()):
+            return None
+        spans.append(match.span())
+        pos = match.end()
+    if not _END.fullmatch(buf, pos):
+        return None
+    return spans
+
+
+def _indexJsonArray(path, buf):
+    """(start, end) byte spans of every schedule in a json file."""
+    first = re.match(rb"\s*\[", buf)
+    if first:
+        spans = _indexJsonSchedules(buf, first.end())
+        if spans is not None:
+            return spans
+
+    # any other layout, like {"schedules": [...]}, is walked by the
+    # streaming reader, one schedule in memory at a time
+    try:
+        return list(iterJsonScheduleSpans(path))
+    except NotScheduleListError:
+        raise
+    except ValueError as e:
+        raise ValueError(f"{path} is not valid json: {e}") from None
+
+
+def _indexLines(buf):
+    # jsonl, one schedule per non blank line
+    spans = []
+    pos = 0
+    for match in re.finditer(rb"\n", buf):
+        if buf[pos : match.start()].strip():
+            spans.append((pos, match.start()))
+        pos = match.end()
+    if buf[pos:].strip():
+        spans.append((pos, len(buf)))
+    return spans
+
+
+def _indexCsv(buf):
+    """
+    (start, end) byte spans of the schedules in a csv file and the line
+    each one starts on. Rows are read with iterCsvRows, like
+    iterCsvSchedules, so both split schedules on the same blank rows.
+    """
+    ends = []
+
+    def lines():
+        pos = 0
+        for match in re.finditer(rb"\n", buf):
+            ends.append(match.end())
+            yield buf[pos : match.end()].decode("utf-8")
+            pos = match.end()
+        if pos < len(buf):
+            ends.append(len(buf))
+            yield buf[pos:].decode("utf-8")
+
+    spans = []
+    firstLines = []
+    start = None
+    end = rowStart = 0
+    prevLine = 0
+    for line, row in iterCsvRows(lines()):
+        if not row:
+            if start is not None:
+                spans.append((start, end))
+                start = None
+        else:
+            if start is None:
+                start = rowStart
+                firstLines.append(prevLine + 1)
+            end = ends[-1]
+        # the reader has read up to the end of this row
+        rowStart = ends[-1]
+        prevLine = line
+    if start is not None:
+        spans.append((start, end))
+    return spans, firstLines
+
+
+def _checkSchedule(k, data):
+    # a non empty list of rows with at least 5 cells each
+    return Schedule.fromRows(checkSchedule(k, data))
+
+
+class LazyScheduleSource:
+    """
+    Sequence of Schedule objects backed by a json, jsonl, csv, sched or db file.
+    source[k] parses schedule k on first use, prefetch(k) warms up the
+    schedules around k on a background thread.
+    """
+
+    WINDOW = 16
+    PREFETCH_RADIUS = 2
+
+    def __init__(self, path):
+        self.path = path
+        self._fmt = formatFromPath(path)
+        # guards the cache, never held while parsing
+        self._lock = threading.Lock()
+        self._archiveLock = threading.Lock()
+        self._cache = OrderedDict()
+        self._archive = None
+        self._file = None
+        self._map = None
+        self._spans = []
+        # csv only, the file line each schedule starts on
+        self._firstLines = []
+        self._prefetchQueue = None
+
+        if self._fmt in ("sched", "db"):
+            # both already give random access to single schedules
+            if self._fmt == "sched":
+                self._archive = ScheduleArchive(path)
+            else:
+                self._archive = ScheduleDatabase(path)
+            self._count = len(self._archive)
+            return
+
+        self._file = open(path, "rb")  # noqa: SIM115 closed by close()
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty.") from None
+
+        if self._fmt == "csv":
+            self._spans, self._firstLines = _indexCsv(self._map)
+        elif self._fmt == "jsonl":
+            self._spans = _indexLines(self._map)
+        else:
+            try:
+                self._spans = _indexJsonArray(path, self._map)
+            except ValueError:
+                self.close()
+                raise
+        self._count = len(self._spans)
+
+    def __len__(self):
+        return self._count
+
+    def _parse(self, k):
+        if self._archive is not None:
+            # one sqlite connection, shared by both threads
+            with self._archiveLock:
+                return self._archive[k]
+        start, end = self._spans[k]
+        raw = self._map[start:end]
+        if self._fmt == "csv":
+            # checked row by row, errors name the line in the file
+            data = []
+            offset = self._firstLines[k] - 1
+            lines = io.StringIO(raw.decode("utf-8"), newline="")
+            for line, row in iterCsvRows(lines):
+                _checkCsvRow(row, offset + line, len(data), k)
+                data.append(row)
+        else:
+            try:
+                data = json.loads(raw)
+            except ValueError as e:
+                raise ValueError(
+                    f"Invalid: schedule {k} is not valid json ({e})."
+                ) from None
+        return _checkSchedule(k, data)
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self._count
+        if not 0 <= k < self._count:
+            raise IndexError(f"Schedule {k} out of range")
+
+        with self._lock:
+            if k in self._cache:
+                self._cache.move_to_end(k)
+                return self._cache[k]
+
+        # parsed without holding the lock, so the viewer can read cached
+        # schedules while the prefetch thread parses another one
+        schedule = self._parse(k)
+
+        with self._lock:
+            if k in self._cache:
+                # the other thread parsed it meanwhile, keep one copy
+                self._cache.move_to_end(k)
+                return self._cache[k]
+            self._cache[k] = schedule
+            while len(self._cache) > self.WINDOW:
+                self._cache.popitem(last=False)
+            return schedule
+
+    def isCached(self, k):
+        with self._lock:
+            return k in self._cache
+
+    def __iter__(self):
+        for k in range(self._count):
+            yield self[k]
+
+    def toRows(self):
+        # export needs everything, so this does parse the whole file
+        return [self[k].toRows() for k in range(self._count)]
+
+    # ---- Background prefetch ----
+    def prefetch(self, k):
+        """Parse the schedules around k in the background."""
+        if self._prefetchQueue is None:
+            self._prefetchQueue = queue.Queue()
+            threading.Thread(target=self._prefetchWorker, daemon=True).start()
+        for i in range(k - self.PREFETCH_RADIUS, k + self.PREFETCH_RADIUS + 1):
+            if 0 <= i < self._count:
+                self._prefetchQueue.put(i)
+
+    def _prefetchWorker(self):
+        while True:
+            k = self._prefetchQueue.get()
+            if k is None:
+                return
+            try:
+                self[k]
+            except (ValueError, IndexError):
+                # shown to the user when they actually open that schedule
+                continue
+
+    def close(self):
+        if self._prefetchQueue is not None:
+            self._prefetchQueue.put(None)
+        with self._lock, self._archiveLock:
+            if self._archive is not None:
+                self._archive.close()
+            if self._map is not None and not self._map.closed:
+                self._map.close()
+            if self._file is not None:
+                self._file.close()
@@ -0,0 +1,127 @@
+# File Name: Config_journal.py
+#
+# Append-only journal of DataManager edits, kept beside the config file.
+#
+# Saving a big config after every small edit rewrites the whole file. With a
+# journal each edit appends one json line instead ("mainConfig.json.journal"),
+# and loading the config replays those lines over it. Compaction saves the
+# config and starts an empty journal.
+#
+# Layout, one json object per line:
+#   {"base": "<sha256 of the config file the edits apply to>"}
+#   {"op": "addRoom", "args": ["Roddy 140"], "kwargs": {}}
+#   ...
+# If the config file no longer matches base (it was saved, but the app died
+# before the journal was cleared, or someone replaced it) the journal is
+# stale and is not replayed.
+
+import hashlib
+import json
+import os
+
+JOURNAL_SUFFIX = ".journal"
+
+
+def fileHash(path):
+    """sha256 of a file's bytes, None if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class ConfigJournal:
+    def __init__(self, configPath, base):
+        self.path = configPath + JOURNAL_SUFFIX
+        # hash of the config file the next edits apply to
+        self.base = base
+        # offset of a torn last line found by read()
+        self.torn = None
+
+    def read(self):
+        """
+        (base, [(op, args, kwargs)]) stored in the journal, (None, []) if
+        there is none. A torn last line (the app died mid-append) is skipped
+        and its offset kept in self.torn, see dropTorn().
+        """
+        self.torn = None
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None, []
+
+        base = None
+        entries = []
+        offset = 0
+        lines = data.split(b"\n")
+        for lineNumber, line in enumerate(lines):
+            last = lineNumber == len(lines) - 1
+            if last and not line:
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if last:
+                    self.torn = offset
+                    break
+                raise ValueError(
+                    f"{self.path} line {lineNumber + 1} is not json."
+                ) from None
+            if lineNumber == 0:
+                base = record.get("base")
+            else:
+                entries.append((record["op"], record["args"], record["kwargs"]))
+            offset += len(line) + 1
+        if data and not data.endswith(b"\n") and self.torn is None:
+            # a whole record, but the newline after it never made it
+            self.torn = len(data)
+        return base, entries
+
+    def dropTorn(self):
+        """Cut off the torn line read() found, so appends start on a new line."""
+        if self.torn is None:
+            return
+        if self.torn == 0:
+            # not even the header survived
+            os.remove(self.path)
+        else:
+            with open(self.path, "r+b") as f:
+                f.truncate(self.torn)
+                f.seek(self.torn - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+        self.torn = None
+
+    def append(self, changes):
+        """Write (op, args, kwargs) changes and return the journal size."""
+        lines = [
+            json.dumps({"op": op, "args": list(args), "kwargs": kwargs})
+            for op, args, kwargs in changes
+        ]
+        new = not os.path.exists(self.path)
+        with open(self.path, "a", encoding="utf-8") as f:
+            if new:
+                f.write(json.dumps({"base": self.base}) + "\n")
+            f.write("".join(line + "\n" for line in lines))
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
+
+    def size(self):
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def reset(self, base):
+        """Drop every entry, the next edits apply to the config with hash base."""
+        self.base = base
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -36,6 +36,29 @@ def _find_course_indexes(courses_list, course_id):
     return idxs
 
 
+def membership_lookups(config_obj):
+    """
+    Names a course may refer to, as (list, set) pairs. Built once so many
+    courses can be checked without scanning the config for each one.
+    """
+    rooms = list(config_obj.get("rooms", []) or [])
+    labs = list(config_obj.get("labs", []) or [])
+    courses = [str(c.get("course_id", "")) for c in config_obj.get("courses", []) or []]
+    faculty = [
+        f["name"] if isinstance(f, dict) and "name" in f else str(f)
+        for f in config_obj.get("faculty", []) or []
+    ]
+    return {
+        name: (values, {str(v) for v in values})
+        for name, values in (
+            ("rooms", rooms),
+            ("labs", labs),
+            ("courses", courses),
+            ("faculty", faculty),
+        )
+    }
+
+
 class Course:
     def __init__(
         self, course_id, credits, room=None, lab=None, conflicts=None, faculty=None
@@ -143,6 +166,25 @@ class Course:
     def remove_faculty(self, faculty):
         self.faculty = [x for x in self.faculty if x not in set(_clean_list(faculty))]
 
+    def membership_errors(self, lookups):
+        """Messages for rooms, labs, conflicts and faculty not in lookups."""
+        msgs = []
+        for attr, key, label, plural in (
+            ("room", "rooms", "room(s)", "rooms"),
+            ("lab", "labs", "lab(s)", "labs"),
+            ("conflicts", "courses", "conflict course(s)", "courses"),
+            ("faculty", "faculty", "faculty member(s)", "faculty"),
+        ):
+            names, known = lookups[key]
+            bad = [str(x) for x in getattr(self, attr) if str(x) not in known]
+            if bad:
+                available = ", ".join(names) if names else "None defined"
+                msgs.append(
+                    f"Unknown {label}: {', '.join(bad)}\n"
+                    f"Available {plural}: {available}"
+                )
+        return msgs
+
     # Validation function (used for create & modify)
     def validate(
         self,
@@ -162,60 +204,7 @@ class Course:
 
         # --- Membership validation (Rooms, Labs, Conflicts, Faculty) ---
         if isinstance(config_obj, dict):
-            cfg_rooms = list(config_obj.get("rooms", []) or [])
-            cfg_labs = list(config_obj.get("labs", []) or [])
-            cfg_courses = list(config_obj.get("courses", []) or [])
-            cfg_faculty = list(config_obj.get("faculty", []) or [])
-
-            msgs = []
-
-            # Rooms
-            bad_rooms = [r for r in self.room if r not in cfg_rooms]
-            if bad_rooms:
-                available = ", ".join(cfg_rooms) if cfg_rooms else "None defined"
-                msgs.append(
-                    f"Unknown room(s): {', '.join(bad_rooms)}\n"
-                    f"Available rooms: {available}"
-                )
-
-            # Labs
-            bad_labs = [lab for lab in self.lab if lab not in cfg_labs]
-            if bad_labs:
-                available = ", ".join(cfg_labs) if cfg_labs else "None defined"
-                msgs.append(
-                    f"Unknown lab(s): {', '.join(bad_labs)}\n"
-                    f"Available labs: {available}"
-                )
-
-            # Conflicts (check against other course_ids)
-            available_conflicts = [str(c.get("course_id", "")) for c in cfg_courses]
-            bad_conflicts = [c for c in self.conflicts if c not in available_conflicts]
-            if bad_conflicts:
-                available = (
-                    ", ".join(available_conflicts)
-                    if available_conflicts
-                    else "None defined"
-                )
-                msgs.append(
-                    f"Unknown conflict course(s): {', '.join(bad_conflicts)}\n"
-                    f"Available courses: {available}"
-                )
-
-            # Faculty
-            cfg_faculty_raw = list(config_obj.get("faculty", []) or [])
-            cfg_faculty = [
-                f["name"] if isinstance(f, dict) and "name" in f else str(f)
-                for f in cfg_faculty_raw
-            ]
-
-            bad_faculty = [str(f) for f in self.faculty if str(f) not in cfg_faculty]
-
-            if bad_faculty:
-                available = ", ".join(cfg_faculty) if cfg_faculty else "None defined"
-                msgs.append(
-                    f"Unknown faculty member(s): {', '.join(bad_faculty)}\n"
-                    f"Available faculty: {available}"
-                )
+            msgs = self.membership_errors(membership_lookups(config_obj))
 
             # Raise combined message if validation errors found
             if strict_membership and msgs:
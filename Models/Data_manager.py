@@ -1,12 +1,23 @@
+import bisect
+import copy
+import functools
+import hashlib
 import json
+import os
+from collections import Counter
+from contextlib import contextmanager
+
 import Models.Faculty_model as FacultyModel
+from Models.Config_journal import ConfigJournal, fileHash
 
 
 # This will manage all of the data for the whole config file.
 
 from Models.Course_model import (
+    Course,
     add_course_to_config,
     delete_course_from_config,
+    membership_lookups,
 )
 
 from Models.ClassPattern_model import (
@@ -16,13 +27,195 @@ from Models.ClassPattern_model import (
 )
 
 
+# the journal is folded into the config once it is bigger than the config
+# file, but never below this many bytes
+JOURNAL_COMPACT_MIN = 64 * 1024
+
+# names of the DataManager methods that edit data, the only ones a journal
+# may replay
+CHANGE_METHODS = set()
+
+# course fields that name rooms, labs, faculty or other courses
+REFERENCE_FIELDS = ("room", "lab", "faculty", "conflicts")
+
+
+class ConfigIndex:
+    """
+    Lookup tables over one config so DataManager does not scan its lists:
+      courses  course_id -> sorted positions in config["courses"]
+      faculty  casefolded name -> faculty records with that name
+      refs     field -> value -> {id(course): course} for every course whose
+               room/lab/faculty/conflicts list contains value
+    DataManager keeps them up to date on each CRUD call and builds new ones
+    when the data is replaced or its lists change size behind its back.
+    """
+
+    def __init__(self, data):
+        self.key = self.keyOf(data)
+        config = self._config(data)
+        self.courses = {}
+        self.faculty = {}
+        self.refs = {field: {} for field in REFERENCE_FIELDS}
+        for pos, course in enumerate(config.get("courses") or []):
+            self.addCourse(course, pos)
+        for record in config.get("faculty") or []:
+            self.addFaculty(record)
+
+    @staticmethod
+    def _config(data):
+        config = data.get("config") if isinstance(data, dict) else None
+        return config if isinstance(config, dict) else {}
+
+    @classmethod
+    def keyOf(cls, data):
+        config = cls._config(data)
+        courses = config.get("courses")
+        faculty = config.get("faculty")
+        sizes = tuple(len(x) if isinstance(x, list) else -1 for x in (courses, faculty))
+        return (data, config, courses, faculty, *sizes)
+
+    def isFor(self, data):
+        # objects are compared by identity, a new dict means new tables
+        key = self.keyOf(data)
+        return all(a is b for a, b in zip(key[:4], self.key[:4], strict=True)) and (
+            key[4:] == self.key[4:]
+        )
+
+    # courses
+    def addCourse(self, course, pos):
+        if not isinstance(course, dict):
+            return
+        positions = self.courses.setdefault(course.get("course_id"), [])
+        bisect.insort(positions, pos)
+        self._addRefs(course)
+
+    def _addRefs(self, course):
+        for field in REFERENCE_FIELDS:
+            values = course.get(field)
+            if isinstance(values, list):
+                for value in values:
+                    if isinstance(value, str):
+                        self.refs[field].setdefault(value, {})[id(course)] = course
+
+    def _removeRefs(self, course):
+        for field in REFERENCE_FIELDS:
+            values = course.get(field)
+            if isinstance(values, list):
+                for value in values:
+                    users = (
+                        self.refs[field].get(value) if isinstance(value, str) else None
+                    )
+                    if users is not None:
+                        users.pop(id(course), None)
+                        if not users:
+                            del self.refs[field][value]
+
+    def replaceCourse(self, pos, old, new):
+        self._removeRefs(old)
+        positions = self.courses.get(old.get("course_id"), [])
+        if pos in positions:
+            positions.remove(pos)
+            if not positions:
+                del self.courses[old.get("course_id")]
+        self.addCourse(new, pos)
+
+    def setReferences(self, course, field, values):
+        """Replace course[field], which names other config entries."""
+        self._removeRefs(course)
+        course[field] = values
+        self._addRefs(course)
+
+    def removeCourse(self, course, courses):
+        # later positions all move, so those are rebuilt from the list
+        self._removeRefs(course)
+        self.courses = {}
+        for pos, c in enumerate(courses):
+            if isinstance(c, dict):
+                self.courses.setdefault(c.get("course_id"), []).append(pos)
+
+    def coursePositions(self, course_id):
+        return self.courses.get(course_id, [])
+
+    def users(self, field, value):
+        """Courses whose field list contains value, in the order they were indexed."""
+        users = self.refs[field].get(value, {})
+        return [c for c in users.values() if value in c.get(field, [])]
+
+    # faculty
+    def addFaculty(self, record):
+        name = record.get("name") if isinstance(record, dict) else None
+        if isinstance(name, str):
+            self.faculty.setdefault(name.casefold(), []).append(record)
+
+    def removeFaculty(self, record):
+        name = record.get("name") if isinstance(record, dict) else None
+        records = self.faculty.get(name.casefold(), []) if isinstance(name, str) else []
+        records[:] = [r for r in records if r is not record]
+        if isinstance(name, str) and not records:
+            self.faculty.pop(name.casefold(), None)
+
+    def facultyByName(self, name):
+        records = self.faculty.get(name.casefold()) if isinstance(name, str) else None
+        return records[0] if records else None
+
+
+def _fileStamp(path):
+    # size and mtime, to notice the file was changed by someone else
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _syncDirectory(path):
+    # make the rename itself durable, where directories can be opened
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class _Batch:
+    # state of one DataManager.batch(): the data to roll back to, the changes
+    # made so far and the courses whose cross checks wait for the commit
+    def __init__(self, data):
+        self.snapshot = copy.deepcopy(data)
+        self.changes = []
+        self.courses = {}  # id(course) -> (course, strict_membership)
+
+    def check(self, course, strict):
+        _, wasStrict = self.courses.get(id(course), (None, False))
+        self.courses[id(course)] = (course, strict or wasStrict)
+
+
 # We will need to give a config filePath or it will start will an empty file
 # note: empty file only inclues,
 class DataManager:
-    def __init__(self, filePath=None):
+    def __init__(self, filePath=None, journal=False):
         self.new = True
         self.filePath = filePath
         self.data = None
+        self._configIndex = None
+        # courses whose references may be stale, repaired on the next read.
+        # Everything is checked once after data is loaded or replaced.
+        self._dirty = {}
+        self._dirtyAll = True
+        self._batch = None
+        self._listeners = []
+        # absolute path -> (hash, file stamp) of the last save there
+        self._saved = {}
+        # with journal=True every edit is appended to <filePath>.journal
+        self.journaling = journal
+        self._journal = None
         if filePath:
             self.loadFile(filePath)
         else:
@@ -38,6 +231,162 @@ class DataManager:
 
         return wrapper
 
+    @staticmethod
+    def changesData(func):
+        # Tells the listeners (or the open batch) about each successful edit
+        CHANGE_METHODS.add(func.__name__)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            result = func(self, *args, **kwargs)
+            if self._listeners or self._batch is not None:
+                # copied, callers may reuse the dicts they passed in
+                self._changed(
+                    (func.__name__, copy.deepcopy(args), copy.deepcopy(kwargs))
+                )
+            return result
+
+        return wrapper
+
+    # Change notification
+    def addListener(self, listener):
+        """
+        Call listener(changes) after every edit, or once after a batch.
+        changes is a list of (method name, args, kwargs) tuples.
+        """
+        self._listeners.append(listener)
+
+    def removeListener(self, listener):
+        self._listeners.remove(listener)
+
+    def _changed(self, change):
+        if self._batch is not None:
+            self._batch.changes.append(change)
+        else:
+            self._notify([change])
+
+    def _notify(self, changes):
+        for listener in list(self._listeners):
+            listener(changes)
+
+    def _log(self, message):
+        # a batch prints one summary instead of a line per edit
+        if self._batch is None:
+            print(message)
+
+    @contextmanager
+    def batch(self):
+        """
+        Apply many edits as one:
+            with DM.batch():
+                for course in imported:
+                    DM.addCourse(course)
+        Course cross checks (duplicates, unknown rooms/labs/faculty/conflicts)
+        run once at the end against lookups built once. If anything raises,
+        the data goes back to how it was before the batch. Listeners are
+        called once with every change. Nested batches join the outer one.
+        """
+        if self._batch is not None:
+            yield self
+            return
+        if self.data is None:
+            raise ValueError("Cannot call 'batch' — data is not loaded.")
+
+        original = self.data
+        self._batch = _Batch(original)
+        try:
+            yield self
+            self._checkBatch()
+        except BaseException:
+            # put the same dict back so other holders of DM.data see it too
+            snapshot = self._batch.snapshot
+            self._batch = None
+            original.clear()
+            original.update(snapshot)
+            self.data = original
+            self.reindex()
+            raise
+
+        changes = self._batch.changes
+        self._batch = None
+        if changes:
+            print(f"Applied {len(changes)} changes.")
+            self._notify(changes)
+
+    def _checkBatch(self):
+        # the checks addCourse/editCourse skipped, against the final config
+        pending = self._batch.courses
+        if not pending:
+            return
+        config = self.data["config"]
+        courses = config.get("courses", [])
+        present = {id(c) for c in courses}
+        lookups = membership_lookups(config)
+        counts = Counter(str(c.get("course_id", "")).strip() for c in courses)
+
+        for course, strict in pending.values():
+            if id(course) not in present:
+                continue
+            candidate = Course.from_dict(course)
+            if counts[candidate.course_id] > 1:
+                i = next(
+                    i
+                    for i, c in enumerate(courses)
+                    if c is not course
+                    and str(c.get("course_id", "")).strip() == candidate.course_id
+                )
+                raise ValueError(
+                    f"Duplicate course ID '{candidate.course_id}' already exists (index {i})."
+                )
+            if strict:
+                msgs = candidate.membership_errors(lookups)
+                if msgs:
+                    raise ValueError("\n\n".join(msgs))
+
+    def _index(self):
+        # the lookup tables for self.data, rebuilt if it was replaced or changed
+        if self._configIndex is None or not self._configIndex.isFor(self.data):
+            self._configIndex = ConfigIndex(self.data)
+            self._dirty = {}
+            self._dirtyAll = True
+        return self._configIndex
+
+    def _indexSynced(self):
+        # after our own edit the tables are current, only the key moved
+        self._configIndex.key = ConfigIndex.keyOf(self.data)
+
+    def reindex(self):
+        """Forget the lookup tables, for code that edits self.data in place."""
+        self._configIndex = None
+
+    def _markDirty(self, courses):
+        for course in courses:
+            self._dirty[id(course)] = course
+
+    def _repairReferences(self):
+        # drop references to missing rooms/labs/faculty/courses, but only in
+        # the courses a remove or add could have broken
+        self._index()
+        if self._dirtyAll:
+            courses = None
+        elif self._dirty:
+            courses = list(self._dirty.values())
+        else:
+            return False
+        self._dirty = {}
+        self._dirtyAll = False
+        return self._clean_invalid_references(courses)
+
+    def _renameReferences(self, field, names, oldName, newName):
+        # courses follow a renamed room/lab, unless another entry keeps the name
+        if oldName == newName or oldName in names:
+            return
+        index = self._index()
+        for course in index.users(field, oldName):
+            index.setReferences(
+                course, field, [newName if x == oldName else x for x in course[field]]
+            )
+
     # we want to load if we have a file path
     def loadFile(self, filePath):
         self.filePath = filePath
@@ -48,6 +397,75 @@ class DataManager:
 
             # self.data = load_config_from_file(CombinedConfig, self.filePath)
             # print(self.data)
+            if self.journaling:
+                self._openJournal()
+
+    # Journal
+    def _openJournal(self):
+        # replay the journal beside filePath, then append every edit to it
+        if self._journal is not None:
+            self.removeListener(self._journalChanges)
+        base = fileHash(self.filePath)
+        self._journal = ConfigJournal(self.filePath, base)
+        try:
+            journalBase, entries = self._journal.read()
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"[WARN] Could not read {self._journal.path}: {e}")
+            self._journal = None
+            return
+
+        if entries and journalBase == base:
+            if not self._replay(entries):
+                return
+            # later appends must not land on the end of a torn line
+            self._journal.dropTorn()
+        elif entries:
+            print(
+                f"[WARN] Ignoring {self._journal.path}, "
+                f"{self.filePath} changed since it was written."
+            )
+            self._journal.reset(base)
+        else:
+            # nothing to keep, the next edit starts it with the current base
+            self._journal.reset(base)
+        self.addListener(self._journalChanges)
+
+    def _replay(self, entries):
+        try:
+            with self.batch():
+                for op, args, kwargs in entries:
+                    if op not in CHANGE_METHODS:
+                        raise ValueError(f"Unknown journal operation: {op}")
+                    getattr(self, op)(*args, **kwargs)
+        except (ValueError, IndexError, KeyError, TypeError) as e:
+            # the data stays as loaded and this file is not journaled, so
+            # the journal is kept as it is for a closer look
+            print(f"[WARN] Could not replay {self._journal.path}: {e}")
+            self._journal = None
+            return False
+        return True
+
+    def _journalChanges(self, changes):
+        try:
+            size = self._journal.append(changes)
+        except (OSError, TypeError, ValueError) as e:
+            # the edit can't be journaled, so save everything instead
+            print(f"[WARN] Could not write {self._journal.path}: {e}")
+            self.compactJournal()
+            return
+        if size > max(JOURNAL_COMPACT_MIN, self._configSize()):
+            self.compactJournal()
+
+    def _configSize(self):
+        try:
+            return os.path.getsize(self.filePath)
+        except OSError:
+            return 0
+
+    def compactJournal(self):
+        """Fold the journal into the config file and start an empty one."""
+        if self._journal is not None:
+            self.saveData(self.filePath)
 
     def deafultData(self):
         # deafult data if the file path is empty.
@@ -58,24 +476,74 @@ class DataManager:
         # config = load_config_from_file(CombinedConfig, "template/ConfigTemplate.json")
         return config
 
-    def saveData(self, path=None):
-        """Save data to the current or given path."""
+    def saveData(self, path=None, compact=False):
+        """
+        Save data to the current or given path, compact=True leaves out the
+        indentation (much smaller for big configs).
+        Nothing is written when the file still holds what the last save wrote.
+        Otherwise the json goes to a temp file that is renamed over the target,
+        so a crash mid-save never leaves a half written config.
+        Returns True if the file was written.
+        """
         if path is None:
             path = self.filePath
         if not path:
             print("No path specified for saveData()")
-            return
-        with open(path, "w") as f:
-            json.dump(self.data, f, indent=4)
+            return False
+
+        if compact:
+            text = json.dumps(self.data, separators=(",", ":"))
+        else:
+            text = json.dumps(self.data, indent=4)
+        # bytes, so the hash is also the hash of the file (see Config_journal)
+        content = text.encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()
+        key = os.path.abspath(path)
+        last = self._saved.get(key)
+        written = last is None or last != (digest, _fileStamp(path))
+
+        if written:
+            tmp = path + ".tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, path)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+            _syncDirectory(path)
+            self._saved[key] = (digest, _fileStamp(path))
+
+        if self._journal is not None and key == os.path.abspath(self.filePath):
+            # the file now holds every journaled edit
+            self._journal.reset(digest)
+        return written
 
     @requireData
+    @changesData
     def updateLimit(self, limit):
         self.data["limit"] = limit
 
     @requireData
+    @changesData
     def updateOptimizerFlags(self, flags):
         self.data["optimizer_flags"] = flags
 
+    @requireData
+    @changesData
+    def updateValue(self, keyPath, value):
+        """Set any value by a dotted path, like "config.rooms"."""
+        ref = self.data
+        keys = keyPath.split(".")
+        for k in keys[:-1]:
+            ref = ref[k]
+        ref[keys[-1]] = value
+        # anything may have changed, the lookup tables start over
+        self.reindex()
+
     # each method below will get the data from file:
     # Rooms CRUD(Create, Read, Update, Delete)
     @requireData
@@ -83,27 +551,29 @@ class DataManager:
         return self.data["config"]["rooms"]
 
     @requireData
+    @changesData
     def addRoom(self, newRoom):
         self.data["config"]["rooms"].append(newRoom)
         # actally saves the data in file
         # self.saveData(outPath = self.filePath)
 
     @requireData
+    @changesData
     def editRoom(self, oldName, newName):
         rooms = self.data["config"]["rooms"]
         idx = rooms.index(oldName)
         rooms[idx] = newName
+        self._renameReferences("room", rooms, oldName, newName)
         # self.saveData(outPath = self.filePath)
 
     @requireData
+    @changesData
     def removeRoom(self, roomName):
         # Prevent removing a room that's in use by any course
-        courses = self.data["config"].get("courses", [])
-        for course in courses:
-            if roomName in course.get("room", []):
-                raise ValueError(
-                    f"Cannot remove room '{roomName}' as it is used by course '{course['course_id']}'"
-                )
+        for course in self._index().users("room", roomName)[:1]:
+            raise ValueError(
+                f"Cannot remove room '{roomName}' as it is used by course '{course['course_id']}'"
+            )
 
         rooms = self.data["config"]["rooms"]
         rooms.remove(roomName)
@@ -115,26 +585,28 @@ class DataManager:
         return self.data["config"]["labs"]
 
     @requireData
+    @changesData
     def addLab(self, newLab):
         self.data["config"]["labs"].append(newLab)
         # self.saveData(outPath = self.filePath)
 
     @requireData
+    @changesData
     def editLabs(self, oldName, newName):
         labs = self.data["config"]["labs"]
         idx = labs.index(oldName)
         labs[idx] = newName
+        self._renameReferences("lab", labs, oldName, newName)
         # self.saveData(outPath = self.filePath)
 
     @requireData
+    @changesData
     def removeLabs(self, labName):
         # Prevent removing a lab that's in use by any course
-        courses = self.data["config"].get("courses", [])
-        for course in courses:
-            if labName in course.get("lab", []):
-                raise ValueError(
-                    f"Cannot remove lab '{labName}' as it is used by course '{course['course_id']}'"
-                )
+        for course in self._index().users("lab", labName)[:1]:
+            raise ValueError(
+                f"Cannot remove lab '{labName}' as it is used by course '{course['course_id']}'"
+            )
 
         labs = self.data["config"]["labs"]
         labs.remove(labName)
@@ -143,69 +615,89 @@ class DataManager:
     # Course CRUD
     @requireData
     def getCourses(self):
-        """Return the list of all valid courses, auto-cleaning invalid references."""
-        self._clean_invalid_references()
+        """Return the list of all valid courses, repairing any stale references."""
+        self._repairReferences()
         return self.data["config"].get("courses", [])
 
     @requireData
+    @changesData
     def addCourse(self, course_dict):
         config_obj = self.data["config"]
+        index = self._index()
         try:
-            # Allow forward references / circular conflicts when adding courses
-            add_course_to_config(config_obj, course_dict, strict_membership=False)
-            print(f"Added course: {course_dict['course_id']}")
+            if self._batch is not None:
+                # only the course itself now, the config checks at the end
+                course = Course.build_and_validate(course_dict).to_dict()
+                config_obj.setdefault("courses", []).append(course)
+                self._batch.check(course, strict=False)
+            else:
+                # Allow forward references / circular conflicts when adding courses
+                add_course_to_config(config_obj, course_dict, strict_membership=False)
+            self._log(f"Added course: {course_dict['course_id']}")
         except Exception as e:
             raise ValueError(str(e))
 
+        courses = config_obj["courses"]
+        index.addCourse(courses[-1], len(courses) - 1)
+        self._indexSynced()
+        # may name things that are not added yet, checked on the next read
+        self._markDirty(courses[-1:])
+
     @requireData
+    @changesData
     def editCourse(self, old_course_id, updates, target_index=None):
         config_obj = self.data["config"]
+        index = self._index()
 
         try:
             courses = config_obj.get("courses", [])
-            matching = [c for c in courses if c.get("course_id") == old_course_id]
+            matching = index.coursePositions(old_course_id)
             if not matching:
                 raise ValueError(f"Course not found: {old_course_id}")
 
-            idx = (
-                target_index if target_index is not None else courses.index(matching[0])
-            )
+            idx = target_index if target_index is not None else matching[0]
             current = courses[idx]
 
             # Merge updates into a fresh dict
             new_data = current.copy()
             new_data.update(updates)
 
-            from Models.Course_model import Course
-
             candidate = Course.from_dict(new_data)
 
-            candidate.validate(
-                config_obj=config_obj,
-                existing_courses=courses,
-                strict_membership=True,
-                ignore_index=idx,
-            )
+            if self._batch is None:
+                candidate.validate(
+                    config_obj=config_obj,
+                    existing_courses=courses,
+                    strict_membership=True,
+                    ignore_index=idx,
+                )
 
             # Replace course only if validation passes
             courses[idx] = candidate.to_dict()
+            index.replaceCourse(idx, current, courses[idx])
+            if self._batch is not None:
+                self._batch.check(courses[idx], strict=True)
 
             # Cascade rename: update any conflicts that referenced the old id
             if old_course_id != candidate.course_id:
-                for course in courses:
-                    if "conflicts" in course and old_course_id in course["conflicts"]:
-                        # replace occurrences of old id with the new id
-                        course["conflicts"] = [
+                for course in index.users("conflicts", old_course_id):
+                    # replace occurrences of old id with the new id
+                    index.setReferences(
+                        course,
+                        "conflicts",
+                        [
                             candidate.course_id if x == old_course_id else x
                             for x in course.get("conflicts", [])
-                        ]
+                        ],
+                    )
 
-            print(f"Updated course: {old_course_id} → {candidate.course_id}")
+            self._log(f"Updated course: {old_course_id} → {candidate.course_id}")
 
         except Exception as e:
             raise ValueError(str(e))
 
     @requireData
+    @changesData
     def removeCourse(self, course):
         cfg = self.data.get("config", {})
         try:
@@ -214,63 +706,54 @@ class DataManager:
             else:
                 course_id = str(course)
 
+            index = self._index()
             deleted = delete_course_from_config(cfg, course_id)
             self.data["config"] = cfg
-            print(f"Removed course: {course_id}")
+            index.removeCourse(deleted, cfg["courses"])
+            self._indexSynced()
+            self._dirty.pop(id(deleted), None)
+            self._markDirty(index.users("conflicts", deleted.get("course_id")))
+            self._repairReferences()
+            self._log(f"Removed course: {course_id}")
             return deleted
         except Exception as e:
             raise ValueError(str(e))
 
     @requireData
-    def _clean_invalid_references(self):
+    def _clean_invalid_references(self, courses=None):
         """
-        Cleans all invalid references in course lists:
+        Cleans invalid references in course lists (all courses by default):
           - Removes missing rooms, labs, faculty, and conflicts.
         Returns True if any data was changed.
         """
         config = self.data.get("config", {})
-        courses = config.get("courses", [])
+        index = self._index()
+        if courses is None:
+            courses = config.get("courses", [])
 
         existing_rooms = set(config.get("rooms", []))
         existing_labs = set(config.get("labs", []))
-        existing_courses = {c.get("course_id") for c in courses if "course_id" in c}
         existing_faculty = {
             f["name"] if isinstance(f, dict) and "name" in f else str(f)
             for f in config.get("faculty", [])
         }
+        existing = {
+            "room": existing_rooms,
+            "lab": existing_labs,
+            # course ids come from the index instead of a scan of every course
+            "conflicts": index.courses,
+            "faculty": existing_faculty,
+        }
 
         changed = False
 
         for c in courses:
-            # Rooms
-            if "room" in c:
-                valid_rooms = [r for r in c["room"] if r in existing_rooms]
-                if len(valid_rooms) != len(c["room"]):
-                    c["room"] = valid_rooms
-                    changed = True
-
-            # Labs
-            if "lab" in c:
-                valid_labs = [labs for labs in c["lab"] if labs in existing_labs]
-                if len(valid_labs) != len(c["lab"]):
-                    c["lab"] = valid_labs
-                    changed = True
-
-            # Conflicts
-            if "conflicts" in c:
-                valid_conflicts = [
-                    conf for conf in c["conflicts"] if conf in existing_courses
-                ]
-                if len(valid_conflicts) != len(c["conflicts"]):
-                    c["conflicts"] = valid_conflicts
-                    changed = True
-
-            # Faculty
-            if "faculty" in c:
-                valid_faculty = [f for f in c["faculty"] if f in existing_faculty]
-                if len(valid_faculty) != len(c["faculty"]):
-                    c["faculty"] = valid_faculty
-                    changed = True
+            for field in REFERENCE_FIELDS:
+                if field in c:
+                    valid = [x for x in c[field] if x in existing[field]]
+                    if len(valid) != len(c[field]):
+                        index.setReferences(c, field, valid)
+                        changed = True
 
         return changed
 
@@ -282,17 +765,12 @@ class DataManager:
     @requireData
     def getFacultyByName(self, name: str):
         """Return a single faculty entry by name (case-insensitive), or None if not found."""
-        faculty_list = self.data.get("config", {}).get("faculty", [])
         if not name or not isinstance(name, str):
             return None
-
-        name_lower = name.strip().lower()
-        for f in faculty_list:
-            if isinstance(f, dict) and f.get("name", "").lower() == name_lower:
-                return f
-        return None
+        return self._index().facultyByName(name.strip())
 
     @requireData
+    @changesData
     def addFaculty(self, newFaculty):
         """
         Safely add a new faculty record.
@@ -351,26 +829,41 @@ class DataManager:
         clean_fac.setdefault("unique_course_limit", 1)
 
         # Append safely
+        index = self._index()
         self.data["config"]["faculty"].append(clean_fac)
-        print(f"Added faculty: {clean_fac['name']}")
+        index.addFaculty(clean_fac)
+        self._indexSynced()
+        self._log(f"Added faculty: {clean_fac['name']}")
 
     @requireData
+    @changesData
     def removeFaculty(self, facName):
         # Prevent removing faculty that's assigned to any course
-        courses = self.data["config"].get("courses", [])
-        for course in courses:
-            if facName in course.get("faculty", []):
-                raise ValueError(
-                    f"Cannot remove faculty '{facName}' as they are teaching course '{course['course_id']}'"
-                )
+        index = self._index()
+        for course in index.users("faculty", facName)[:1]:
+            raise ValueError(
+                f"Cannot remove faculty '{facName}' as they are teaching course '{course['course_id']}'"
+            )
 
         conFaculty = self.data["config"]["faculty"]
-        result = FacultyModel.Faculty.removeFaculty(conFaculty, facName)
+        record = index.facultyByName(facName)
+        if record is not None and record.get("name") == facName:
+            # exact name, no need to search the list
+            conFaculty.remove(record)
+            result = record
+        else:
+            result = FacultyModel.Faculty.removeFaculty(conFaculty, facName)
         if result is None:
             raise ValueError(f"Faculty member '{facName}' not found")
+        index.removeFaculty(result)
+        self._indexSynced()
+        # the substring match may have removed someone else
+        self._markDirty(index.users("faculty", result.get("name")))
+        self._repairReferences()
         # self.saveData(outPath = self.filePath)
 
     @requireData
+    @changesData
     def editFaculty(self, name: str, updates: dict):
         """
         Safely update an existing faculty member.
@@ -394,18 +887,11 @@ class DataManager:
             raise ValueError("No faculty data found.")
 
         # Find faculty by name (case-insensitive)
-        idx = next(
-            (
-                i
-                for i, f in enumerate(faculty_list)
-                if f.get("name", "").lower() == name.lower()
-            ),
-            None,
-        )
-        if idx is None:
+        index = self._index()
+        current = index.facultyByName(name)
+        if current is None:
             raise ValueError(f"Faculty '{name}' not found.")
 
-        current = faculty_list[idx]
         updated = current.copy()
 
         for key, val in (updates or {}).items():
@@ -453,14 +939,19 @@ class DataManager:
         old_name = current.get("name")
         new_name = updated.get("name", old_name)
         if new_name != old_name:
-            for course in self.data["config"].get("courses", []):
-                if old_name in course.get("faculty", []):
-                    course["faculty"] = [
-                        new_name if x == old_name else x for x in course["faculty"]
-                    ]
+            for course in index.users("faculty", old_name):
+                index.setReferences(
+                    course,
+                    "faculty",
+                    [new_name if x == old_name else x for x in course["faculty"]],
+                )
 
-        faculty_list[idx] = updated
-        print(f"Updated faculty: {old_name} → {new_name}")
+        # updated in place, the record keeps its position in faculty_list
+        index.removeFaculty(current)
+        current.clear()
+        current.update(updated)
+        index.addFaculty(current)
+        self._log(f"Updated faculty: {old_name} → {new_name}")
 
     @requireData
     def getClassPatterns(self):
@@ -468,22 +959,25 @@ class DataManager:
         return cfg.setdefault("classes", [])
 
     @requireData
+    @changesData
     def addClassPattern(self, pattern_dict):
         cfg = self.data.setdefault("time_slot_config", {})
         added = add_class_pattern_to_config(cfg, pattern_dict)
-        print(f"Added class pattern (credits={added['credits']})")
+        self._log(f"Added class pattern (credits={added['credits']})")
         return added
 
     @requireData
+    @changesData
     def editClassPattern(self, index, updates):
         cfg = self.data.setdefault("time_slot_config", {})
         updated = modify_class_pattern_in_config(cfg, index, updates)
-        print(f"Updated class pattern at index {index}.")
+        self._log(f"Updated class pattern at index {index}.")
         return updated
 
     @requireData
+    @changesData
     def removeClassPattern(self, index):
         cfg = self.data.setdefault("time_slot_config", {})
         removed = delete_class_pattern_from_config(cfg, index)
-        print(f"Removed class pattern at index {index}.")
+        self._log(f"Removed class pattern at index {index}.")
         return removed
@@ -1,16 +1,19 @@
 import os
 import csv
+import re
+import sys
+from functools import lru_cache
 
 SCHEDULES_DIR = "output"  # directory where all schedule CSVs are stored
 
 
-# List all saved schedule CSV files
+# List all saved schedule CSV files and SQLite exports
 def list_schedules():
     if not os.path.exists(SCHEDULES_DIR):  # check if folder exists
         return []
     return [
-        f for f in os.listdir(SCHEDULES_DIR) if f.endswith(".csv")
-    ]  # filter only CSV files
+        f for f in os.listdir(SCHEDULES_DIR) if f.endswith((".csv", ".db"))
+    ]  # filter only CSV and db files
 
 
 # Read a schedule from a CSV file
@@ -19,3 +22,185 @@ def read_schedule(filename):
     with open(filepath, newline="") as csvfile:
         reader = csv.reader(csvfile)  # csv.reader turns file into list of rows
         return list(reader)
+
+
+# ---- Typed schedules ----
+# The scheduler hands us rows like
+#   ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50", "WED 14:00-15:50^"]
+# Parsing "MON 09:00-09:50" again every time something is drawn adds up, so
+# schedules are turned into these objects once. Meetings are stored as
+# (day, start_minute, end_minute, is_lab) int tuples, day 0 is MON.
+
+DAYS = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+DAY_INDEX = {day: i for i, day in enumerate(DAYS)}
+
+_MEETING_RE = re.compile(
+    r"^\s*([A-Z]{3})\s+(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})(\^?)\s*$"
+)
+
+
+@lru_cache(maxsize=4096)
+def parseMeetingText(text):
+    """Return (day, start, end, is_lab) for "MON 09:00-09:50^", or None."""
+    match = _MEETING_RE.match(text)
+    if not match:
+        return None
+    day, sh, sm, eh, em, lab = match.groups()
+    sh, sm, eh, em = int(sh), int(sm), int(eh), int(em)
+    if day not in DAY_INDEX or sh > 23 or eh > 23 or sm > 59 or em > 59:
+        return None
+    return (DAY_INDEX[day], sh * 60 + sm, eh * 60 + em, lab == "^")
+
+
+@lru_cache(maxsize=4096)
+def formatMeeting(meeting):
+    """Inverse of parseMeetingText."""
+    day, start, end, isLab = meeting
+    text = (
+        f"{DAYS[day]} {start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}"
+    )
+    return text + "^" if isLab else text
+
+
+def _meetingsFromText(items):
+    meetings = []
+    for item in items:
+        meeting = parseMeetingText(item)
+        if meeting is None:
+            raise ValueError(f"Invalid meeting time: {item!r}")
+        meetings.append(meeting)
+    return tuple(meetings)
+
+
+class ScheduledCourse:
+    """
+    One course in a schedule. Also behaves like the old csv row
+    (course, faculty, room, lab, *meetings), so code that unpacks or slices
+    rows keeps working.
+    """
+
+    __slots__ = ("course", "faculty", "lab", "meetings", "room")
+
+    def __init__(self, course, faculty, room, lab, meetings=()):
+        # interned so the same names across schedules share one string
+        self.course = sys.intern(str(course))
+        self.faculty = sys.intern(str(faculty))
+        self.room = sys.intern(str(room))
+        self.lab = sys.intern(str(lab))
+        self.meetings = tuple(meetings)
+
+    @classmethod
+    def fromRow(cls, row):
+        course, faculty, room, lab, *times = row
+        return cls(course, faculty, room, lab, _meetingsFromText(times))
+
+    def toRow(self):
+        return [self.course, self.faculty, self.room, self.lab] + [
+            formatMeeting(m) for m in self.meetings
+        ]
+
+    def timesByDay(self):
+        """{"MON": "09:00-09:50", ...} like the viewers show it."""
+        return {DAYS[m[0]]: formatMeeting(m).split(" ", 1)[1] for m in self.meetings}
+
+    def __len__(self):
+        return 4 + len(self.meetings)
+
+    def __iter__(self):
+        yield self.course
+        yield self.faculty
+        yield self.room
+        yield self.lab
+        for meeting in self.meetings:
+            yield formatMeeting(meeting)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.toRow()[index]
+        if index < 0:
+            index += len(self)
+        if 0 <= index < 4:
+            return (self.course, self.faculty, self.room, self.lab)[index]
+        if 4 <= index < len(self):
+            return formatMeeting(self.meetings[index - 4])
+        raise IndexError("ScheduledCourse index out of range")
+
+    def __eq__(self, other):
+        if isinstance(other, ScheduledCourse):
+            return all(getattr(self, s) == getattr(other, s) for s in self.__slots__)
+        if isinstance(other, (list, tuple)):
+            return self.toRow() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ScheduledCourse({self.toRow()!r})"
+
+
+class ClassRow(list):
+    """
+    One class of a schedule grouped by room or by faculty, the plain list
+    [course, second, ..., *times] the views show, that also keeps its
+    meetings as int tuples so the layout does not parse the times again.
+    """
+
+    __slots__ = ("meetings",)
+
+    def __init__(self, fields, meetings):
+        super().__init__(list(fields) + [formatMeeting(m) for m in meetings])
+        self.meetings = tuple(meetings)
+
+
+class Schedule:
+    """A full schedule, a list of ScheduledCourse that compares equal to its rows."""
+
+    __slots__ = ("courses",)
+
+    def __init__(self, courses=()):
+        self.courses = list(courses)
+
+    @classmethod
+    def fromRows(cls, rows):
+        if isinstance(rows, Schedule):
+            return rows
+        return cls(
+            row if isinstance(row, ScheduledCourse) else ScheduledCourse.fromRow(row)
+            for row in rows
+        )
+
+    def toRows(self):
+        return [c.toRow() for c in self.courses]
+
+    def __len__(self):
+        return len(self.courses)
+
+    def __iter__(self):
+        return iter(self.courses)
+
+    def __getitem__(self, index):
+        return self.courses[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Schedule):
+            return self.courses == other.courses
+        if isinstance(other, (list, tuple)):
+            return self.courses == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Schedule({self.toRows()!r})"
+
+
+def schedulesToRows(value):
+    """Turn schedules (or lists of them) back into plain lists for json."""
+    if hasattr(value, "toRows"):
+        # Schedule, or a container of them like a schedule archive
+        return value.toRows()
+    if isinstance(value, ScheduledCourse):
+        return value.toRow()
+    if isinstance(value, (list, tuple)):
+        return [schedulesToRows(v) for v in value]
+    return value
@@ -0,0 +1,180 @@
+import itertools
+import operator
+from array import array
+
+from Models.Schedule import DAY_INDEX, DAYS, ScheduledCourse, formatMeeting
+
+# ScheduleSet keeps many schedules as parallel columns with one entry per
+# meeting, names are stored once in string tables and referenced by index.
+# Comparing hundreds of alternatives then means scanning a few flat arrays
+# instead of walking nested lists of strings.
+
+NAME_COLUMNS = ("course", "faculty", "room", "lab")
+COLUMNS = ("schedule", "row", *NAME_COLUMNS, "day", "start", "end", "is_lab")
+
+# day used for a row that has no meetings, so the row still round trips
+NO_MEETING = -1
+
+
+class ScheduleSet:
+    def __init__(self):
+        self.tables = {name: [] for name in NAME_COLUMNS}
+        self._lookup = {name: {} for name in NAME_COLUMNS}
+        self.columns = {
+            "schedule": array("i"),
+            "row": array("i"),
+            "course": array("i"),
+            "faculty": array("i"),
+            "room": array("i"),
+            "lab": array("i"),
+            "day": array("b"),
+            "start": array("h"),
+            "end": array("h"),
+            "is_lab": array("b"),
+        }
+        # records of schedule k are offsets[k]:offsets[k + 1]
+        self.offsets = array("q", [0])
+
+    # ---- Building ----
+    @classmethod
+    def fromRows(cls, schedules):
+        """Build from a list of schedules (lists of csv rows or Schedule objects)."""
+        scheduleSet = cls()
+        for schedule in schedules:
+            scheduleSet.add(schedule)
+        return scheduleSet
+
+    def _index(self, name, value):
+        lookup = self._lookup[name]
+        if value not in lookup:
+            lookup[value] = len(self.tables[name])
+            self.tables[name].append(value)
+        return lookup[value]
+
+    def add(self, schedule):
+        cols = self.columns
+        scheduleIdx = len(self)
+        for rowIdx, row in enumerate(schedule):
+            if not isinstance(row, ScheduledCourse):
+                row = ScheduledCourse.fromRow(row)
+            names = [self._index(n, getattr(row, n)) for n in NAME_COLUMNS]
+            for day, start, end, isLab in row.meetings or [(NO_MEETING, 0, 0, 0)]:
+                cols["schedule"].append(scheduleIdx)
+                cols["row"].append(rowIdx)
+                for name, idx in zip(NAME_COLUMNS, names, strict=True):
+                    cols[name].append(idx)
+                cols["day"].append(day)
+                cols["start"].append(start)
+                cols["end"].append(end)
+                cols["is_lab"].append(int(isLab))
+        self.offsets.append(len(cols["schedule"]))
+
+    # ---- Reading back ----
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def recordCount(self):
+        return len(self.columns["schedule"])
+
+    def schedule(self, k):
+        """Schedule k as a list of csv rows, same as the json export."""
+        if not 0 <= k < len(self):
+            raise IndexError(f"Schedule {k} out of range")
+        cols = self.columns
+        rows = []
+        lastRow = None
+        for i in range(self.offsets[k], self.offsets[k + 1]):
+            if cols["row"][i] != lastRow:
+                lastRow = cols["row"][i]
+                rows.append([self.tables[n][cols[n][i]] for n in NAME_COLUMNS])
+            if cols["day"][i] != NO_MEETING:
+                rows[-1].append(self.meetingText(i))
+        return rows
+
+    def toRows(self):
+        return [self.schedule(k) for k in range(len(self))]
+
+    def meetingText(self, record):
+        cols = self.columns
+        return formatMeeting(
+            (
+                cols["day"][record],
+                cols["start"][record],
+                cols["end"][record],
+                bool(cols["is_lab"][record]),
+            )
+        )
+
+    def value(self, column, record):
+        """Column value of a record, names come back as strings."""
+        raw = self.columns[column][record]
+        if column in NAME_COLUMNS:
+            return self.tables[column][raw]
+        if column == "day":
+            return DAYS[raw] if raw != NO_MEETING else None
+        return raw
+
+    # ---- Filtering and grouping ----
+    def _code(self, column, value):
+        # turn the value a caller gives into what the column stores
+        if column in NAME_COLUMNS:
+            return self._lookup[column].get(value)
+        if column == "day" and isinstance(value, str):
+            return DAY_INDEX.get(value)
+        if column == "is_lab":
+            return int(value)
+        return value
+
+    def where(self, **conditions):
+        """
+        Record indices matching every column=value condition, e.g.
+        where(room="Roddy 136", day="MON"). Each condition is one pass over
+        its column.
+        """
+        mask = None
+        for column, value in conditions.items():
+            if column not in self.columns:
+                raise ValueError(f"Unknown column: {column}")
+            code = self._code(column, value)
+            if code is None:
+                return []
+            hits = map(code.__eq__, self.columns[column])
+            mask = list(hits) if mask is None else list(map(operator.and_, mask, hits))
+        if mask is None:
+            return list(range(self.recordCount))
+        return list(itertools.compress(range(self.recordCount), mask))
+
+    def schedulesWhere(self, **conditions):
+        """Indices of schedules with at least one record matching conditions."""
+        column = self.columns["schedule"]
+        return sorted({column[i] for i in self.where(**conditions)})
+
+    def groupBy(self, column, perSchedule=True):
+        """
+        {(schedule index, value): [record, ...]} for every schedule in one
+        pass, or {value: [record, ...]} with perSchedule=False.
+        """
+        if column not in self.columns:
+            raise ValueError(f"Unknown column: {column}")
+        groups = {}
+        values = self.columns[column]
+        keys = (
+            zip(self.columns["schedule"], values, strict=True)
+            if perSchedule
+            else values
+        )
+        for record, key in enumerate(keys):
+            groups.setdefault(key, []).append(record)
+
+        if column not in NAME_COLUMNS:
+            return groups
+        table = self.tables[column]
+        if perSchedule:
+            return {(k, table[v]): recs for (k, v), recs in groups.items()}
+        return {table[v]: recs for v, recs in groups.items()}
+
+    def minutes(self, records):
+        """Total meeting minutes of the given records."""
+        start, end = self.columns["start"], self.columns["end"]
+        return sum(end[i] - start[i] for i in records)
@@ -3,27 +3,33 @@ from pathlib import Path
 import customtkinter as ctk
 from tkinter import StringVar
 from Controller.chatbot_agent import ChatbotAgent
+from Controller.export_queue import ExportQueue
 from Controller.main_controller import (
+    DM,
     RoomsController,
     LabsController,
     FacultyController,
     CourseController,
     configImportBTN,
     configExportBTN,
-    generateSchedulesBtn,
-    importSchedulesBTN,
+    coursesImportBTN,
+    ScheduleGenerationJob,
+    importScheduleSourceBTN,
     ClassPatternController,
 )
 from Controller.controllerUtils import (
     orderedSchedules,
-    parseMeeting,
-    getTimeRange,
     exportOneScheduleHTML,
     exportSchedulesBTN,
     exportOneSchedulePDF,
 )
+from Controller.schedule_layout import COLORLIST, GRID_DAYS, scheduleLayout
+from Models.Schedule import ScheduledCourse
 from typing import Optional, cast
 
+# DataManager edits the config page does not show
+RUN_SETTINGS = {"updateLimit", "updateOptimizerFlags"}
+
 # should create controllers for other things too
 roomCtr = RoomsController()
 facultyCtr = FacultyController()
@@ -1029,9 +1035,18 @@ def dataCoursesLeft(frame, controller, refresh, data=None, app_instance=None):
     def onAdd():
         refresh(target="ConfigPage")
 
+    # the page refreshes through the DataManager listener once they are in
+    def onImport():
+        error = coursesImportBTN()
+        if error:
+            print(f"[WARN] Could not import courses: {error}")
+
     ctk.CTkButton(
         container, text="Add", width=120, height=20, command=lambda: onAdd()
     ).pack(side="top", padx=5)
+    ctk.CTkButton(
+        container, text="Import", width=120, height=20, command=lambda: onImport()
+    ).pack(side="top", padx=5, pady=(5, 0))
 
     def onDelete(course):
         # Store course data for undo BEFORE deleting
@@ -1517,22 +1532,88 @@ def showErrorPopup(message="An error occurred during export!"):
     ctk.CTkButton(popup, text="OK", width=80, command=popup.destroy).pack(pady=10)
 
 
-def handleExportPDF(room, classes, output_dir="output"):
-    try:
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-        exportOneSchedulePDF([room, classes], output_dir)
-        showSuccessPopup("PDF exported successfully!")
-    except Exception as e:
-        showErrorPopup(f"Failed to export PDF:\n{e}")
+# per-room exports run here so the window stays usable while they run
+exportQueue = ExportQueue()
+_exportToast = {"frame": None, "label": None, "polling": False, "hide": None}
+
+
+def showExportToast(root, text, error=False):
+    # small status box at the bottom of the window, nothing to click away
+    if _exportToast["frame"] is None or not _exportToast["frame"].winfo_exists():
+        frame = ctk.CTkFrame(root, fg_color="#000000")
+        label = ctk.CTkLabel(
+            frame, text="", font=("Arial", 14, "bold"), text_color="white"
+        )
+        label.pack(padx=20, pady=10)
+        _exportToast["frame"], _exportToast["label"] = frame, label
+
+    _exportToast["label"].configure(
+        text=text, text_color="#ff6666" if error else "white"
+    )
+    _exportToast["frame"].place(relx=0.5, rely=0.95, anchor="s")
+    _exportToast["frame"].lift()
+
+    if _exportToast["hide"] is not None:
+        root.after_cancel(_exportToast["hide"])
+        _exportToast["hide"] = None
+
+
+def _hideExportToast():
+    _exportToast["hide"] = None
+    if _exportToast["frame"] is not None and _exportToast["frame"].winfo_exists():
+        _exportToast["frame"].place_forget()
+
+
+def _pollExports(root):
+    for kind, label, pending in exportQueue.poll():
+        more = f" ({pending - 1} more queued)" if pending > 1 else ""
+        if kind == "started":
+            showExportToast(root, f"Exporting {label}...{more}")
+        elif kind == "coalesced":
+            showExportToast(root, f"{label} is already queued{more}")
+        elif kind == "done":
+            showExportToast(root, f"Exported {label}{more}")
+        elif kind == "error":
+            name, error = label
+            showExportToast(root, f"Failed to export {name}: {error}", error=True)
+
+    if exportQueue.pending() or not exportQueue.results.empty():
+        root.after(100, _pollExports, root)
+    else:
+        _exportToast["polling"] = False
+        _exportToast["hide"] = root.after(3000, _hideExportToast)
+
+
+def _watchExports(root):
+    if not _exportToast["polling"]:
+        _exportToast["polling"] = True
+        root.after(100, _pollExports, root)
+
+
+def _queueExport(kind, func, room, classes, output_dir, widget):
+    exportQueue.submit(
+        (kind, output_dir, room),
+        _runExport,
+        func,
+        [room, classes],
+        output_dir,
+        label=f"{room} {kind.upper()}",
+    )
+    if widget is not None:
+        _watchExports(widget.winfo_toplevel())
+
+
+def _runExport(func, room_classes, output_dir):
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    func(room_classes, output_dir)
 
 
-def handleExportHTML(room, classes, output_dir="output"):
-    try:
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-        exportOneScheduleHTML([room, classes], output_dir)
-        showSuccessPopup("HTML exported successfully!")
-    except Exception as e:
-        showErrorPopup(f"Failed to export HTML:\n{e}")
+def handleExportPDF(room, classes, output_dir="output", widget=None):
+    _queueExport("pdf", exportOneSchedulePDF, room, classes, output_dir, widget)
+
+
+def handleExportHTML(room, classes, output_dir="output", widget=None):
+    _queueExport("html", exportOneScheduleHTML, room, classes, output_dir, widget)
 
 
 def defaultScheduleViewer(
@@ -1565,7 +1646,7 @@ def defaultScheduleViewer(
         text="Export",
         width=100,
         height=35,
-        command=lambda: exportSchedulesBTN(schedules, pathEntaryVar),
+        command=lambda: exportSchedulesBTN(schedules, pathEntaryVar, widget=schFrame),
     ).pack(side="left", padx=(0, 10), pady=(10, 0), fill="x", expand=False)
 
     # Create the table frame inside schFrame
@@ -1592,10 +1673,13 @@ def defaultScheduleViewer(
         rowFrame = ctk.CTkFrame(tableFrame)
         rowFrame.pack(fill="x", pady=1)
 
-        other = row[:4]
-        times = row[4:]
-
-        dayToTime = {t.split()[0]: t.split()[1] for t in times}
+        if isinstance(row, ScheduledCourse):
+            other = [row.course, row.faculty, row.room, row.lab]
+            dayToTime = row.timesByDay()
+        else:
+            other = row[:4]
+            times = row[4:]
+            dayToTime = {t.split()[0]: t.split()[1] for t in times}
         FixedTimes = [dayToTime.get(day, "") for day in days]
 
         row = other + FixedTimes
@@ -1637,7 +1721,9 @@ def roomLabsScheduleViewer(
         text="Export",
         width=100,
         height=35,
-        command=lambda: exportSchedulesBTN(schedulesInstance, pathEntaryVar),
+        command=lambda: exportSchedulesBTN(
+            schedulesInstance, pathEntaryVar, widget=schFrame
+        ),
     ).pack(side="left", padx=(0, 10), pady=(10, 0), fill="x", expand=False)
 
     tableFrame = ctk.CTkFrame(schFrame, fg_color="transparent", height=300)
@@ -1704,7 +1790,9 @@ def facultyScheduleViewer(
         text="Export",
         width=100,
         height=35,
-        command=lambda idx=1: exportSchedulesBTN(schedulesInstance, pathEntaryVar),
+        command=lambda idx=1: exportSchedulesBTN(
+            schedulesInstance, pathEntaryVar, widget=schFrame
+        ),
     ).pack(side="left", padx=(0, 10), pady=(10, 0), fill="x", expand=False)
 
     tableFrame = ctk.CTkFrame(schFrame, fg_color="transparent", height=300)
@@ -1747,8 +1835,7 @@ def facultyScheduleViewer(
 
 def plotWeeklyOrderSchedules(schedules, parentFrame, order):
     schedules = orderedSchedules(schedules, order)
-    days = ["MON", "TUE", "WED", "THU", "FRI"]
-    dayOrder = {d: i for i, d in enumerate(days)}
+    days = GRID_DAYS
     hourHeight = 70
     dayWidth = 170
     leftMargin = 50
@@ -1767,7 +1854,7 @@ def plotWeeklyOrderSchedules(schedules, parentFrame, order):
                 text="Export PDF",
                 width=120,
                 command=lambda room=room, classes=classes: handleExportPDF(
-                    room, classes
+                    room, classes, widget=parentFrame
                 ),
             ).pack(side="left", padx=5)
 
@@ -1777,11 +1864,13 @@ def plotWeeklyOrderSchedules(schedules, parentFrame, order):
                 text="Export HTML",
                 width=120,
                 command=lambda room=room, classes=classes: handleExportHTML(
-                    room, classes
+                    room, classes, widget=parentFrame
                 ),
             ).pack(side="left", padx=5)
 
-            startHour, endHour = getTimeRange(classes)
+            # same layout the PDF and HTML exports use, cached
+            layout = scheduleLayout([room, classes])
+            startHour, endHour = layout.startHour, layout.endHour
             canvasWidth = leftMargin + len(days) * dayWidth + 20
             canvasHeight = (endHour - startHour) * hourHeight + 100
 
@@ -1826,55 +1915,29 @@ def plotWeeklyOrderSchedules(schedules, parentFrame, order):
                     leftMargin, y, leftMargin + len(days) * dayWidth, y, fill="#cccccc"
                 )
 
-            COLORLIST = [
-                "#6fa8dc",
-                "#93c47d",
-                "#f6b26b",
-                "#e06666",
-                "#8e7cc3",
-                "#d5b451",
-                "#76a5af",
-                "#c27ba0",
-                "#a4c2f4",
-                "#b6d7a8",
-            ]
-            counter = 1
-            for cls in classes:
-                course = cls[0]
-                professor = cls[1]
-                meetings = cls[2:]
-                if counter + 1 < 10:
-                    counter += 1
-                else:
-                    counter = 0
-
-                PICKEDCOLOR = COLORLIST[counter]
-                for meeting in meetings:
-                    day, start, end = parseMeeting(meeting)
-                    if day not in dayOrder or not start or not end:
-                        continue
-
-                    x = leftMargin + dayOrder[day] * dayWidth + 5
-                    y = (
-                        start.hour + start.minute / 60 - startHour
-                    ) * hourHeight + offset
-                    height = (end - start).seconds / 3600 * hourHeight - 2
-
-                    # Rectangle for class
-                    canvas.create_rectangle(
-                        x, y, x + dayWidth - 10, y + height, fill=PICKEDCOLOR
-                    )
+            for block in layout.blocks:
+                # the canvas colors start two entries into the list
+                PICKEDCOLOR = COLORLIST[(block.classIndex + 2) % len(COLORLIST)]
 
-                    # Text inside class
-                    text = f"{course}\n{professor}\n{meeting.split()[1]}"
-                    canvas.create_text(
-                        x + (dayWidth - 10) / 2,
-                        y + height / 2,
-                        text=text,
-                        font=("Helvetica", 9),
-                        fill="black",
-                        justify="center",
-                    )
+                x = leftMargin + block.day * dayWidth + 5
+                y = (block.startHours - startHour) * hourHeight + offset
+                height = block.seconds / 3600 * hourHeight - 2
+
+                # Rectangle for class
+                canvas.create_rectangle(
+                    x, y, x + dayWidth - 10, y + height, fill=PICKEDCOLOR
+                )
+
+                # Text inside class
+                text = f"{block.course}\n{block.second}\n{block.meeting.split()[1]}"
+                canvas.create_text(
+                    x + (dayWidth - 10) / 2,
+                    y + height / 2,
+                    text=text,
+                    font=("Helvetica", 9),
+                    fill="black",
+                    justify="center",
+                )
 
 
 # this is the actual App
@@ -1914,6 +1977,8 @@ class SchedulerApp(ctk.CTk):
         self.schedulesImportedPath = StringVar()
 
         self.deafultSchedules = None
+        # running ScheduleGenerationJob, if any
+        self.generationJob = None
         self.schIndex = 0
         self.numOfSch = 0
 
@@ -1924,9 +1989,30 @@ class SchedulerApp(ctk.CTk):
         self.undo_stack = []  # Stores actions to undo
         self.redo_stack = []  # Stores undone actions to redo
 
+        # config edits (from any page, the chatbot or undo/redo) rebuild the
+        # config page once the event loop is idle again
+        self._configRefresh = None
+        DM.addListener(self.onConfigChanged)
+
         self.createMainPage()
         self.views["MainPage"].pack(expand=True, fill="both")
 
+    def onConfigChanged(self, changes):
+        """DataManager listener, a batch of edits refreshes the page once."""
+        if all(op in RUN_SETTINGS for op, _, _ in changes):
+            # set by each generation run, not shown on the config page
+            return
+        if self._configRefresh is None:
+            self._configRefresh = self.after_idle(self._refreshConfigPage)
+
+    def _refreshConfigPage(self):
+        self._configRefresh = None
+        self.refresh("ConfigPage")
+
+    def destroy(self):
+        DM.removeListener(self.onConfigChanged)
+        super().destroy()
+
     def record_action(self, action_type, data):
         """Record any action for undo/redo"""
         action = {"type": action_type, "data": data}
@@ -2190,64 +2276,54 @@ class SchedulerApp(ctk.CTk):
         pattern_controller = ClassPatternController()
         # Restore the entire list to its state before deletion
         pattern_controller.savePatterns(all_patterns_before)
-        self.refresh("ConfigPage")
 
     def _redo_pattern_deletion(self, action):
         """Redo a pattern deletion"""
         pattern_index = action["data"]["pattern_index"]
         pattern_controller = ClassPatternController()
         pattern_controller.removePattern(pattern_index, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_lab_addition(self, action):
         """Undo a lab addition"""
         lab_name = action["data"]["lab_name"]
         labCtr.removeLab(lab_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_lab_addition(self, action):
         """Redo a lab addition"""
         lab_name = action["data"]["lab_name"]
         labCtr.addLab(lab_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_lab_edit(self, action):
         """Undo a lab edit"""
         old_name = action["data"]["old_name"]
         new_name = action["data"]["new_name"]
         labCtr.editLab(new_name, old_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_lab_edit(self, action):
         """Redo a lab edit"""
         old_name = action["data"]["old_name"]
         new_name = action["data"]["new_name"]
         labCtr.editLab(old_name, new_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_lab_deletion(self, action):
         """Undo a lab deletion"""
         lab_name = action["data"]["lab_name"]
         labCtr.addLab(lab_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_lab_deletion(self, action):
         """Redo a lab deletion"""
         lab_name = action["data"]["lab_name"]
         labCtr.removeLab(lab_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_course_addition(self, action):
         """Undo a course addition"""
         course_data = action["data"]["course_data"]
         courseCtr.removeCourse(course_data["course_id"], refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_course_addition(self, action):
         """Redo a course addition"""
         course_data = action["data"]["course_data"]
         courseCtr.addCourse(course_data, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_course_edit(self, action):
         """Undo a course edit"""
@@ -2259,7 +2335,6 @@ class SchedulerApp(ctk.CTk):
             refresh=None,
             target_index=action["data"].get("target_index"),
         )
-        self.refresh("ConfigPage")
 
     def _redo_course_edit(self, action):
         """Redo a course edit"""
@@ -2271,98 +2346,81 @@ class SchedulerApp(ctk.CTk):
             refresh=None,
             target_index=action["data"].get("target_index"),
         )
-        self.refresh("ConfigPage")
 
     def _undo_course_deletion(self, action):
         """Undo a course deletion"""
         course_data = action["data"]["course_data"]
         courseCtr.addCourse(course_data, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_course_deletion(self, action):
         """Redo a course deletion"""
         course_data = action["data"]["course_data"]
         courseCtr.removeCourse(course_data["course_id"], refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_faculty_addition(self, action):
         """Undo a faculty addition"""
         faculty_data = action["data"]["faculty_data"]
         facultyCtr.removeFaculty(faculty_data["name"], refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_faculty_addition(self, action):
         """Redo a faculty addition"""
         faculty_data = action["data"]["faculty_data"]
         facultyCtr.addFaculty(faculty_data, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_faculty_edit(self, action):
         """Undo a faculty edit"""
         old_faculty_data = action["data"]["old_faculty_data"]
         # old_name = old_faculty_data['name']
         new_name = action["data"]["new_faculty_data"]["name"]
-        facultyCtr.removeFaculty(new_name, refresh=None)
-        facultyCtr.addFaculty(old_faculty_data, refresh=None)
-        self.refresh("ConfigPage")
+        facultyCtr.editFaculty(old_faculty_data, new_name)
 
     def _redo_faculty_edit(self, action):
         """Redo a faculty edit"""
         new_faculty_data = action["data"]["new_faculty_data"]
         old_name = action["data"]["old_faculty_data"]["name"]
-        facultyCtr.removeFaculty(old_name, refresh=None)
-        facultyCtr.addFaculty(new_faculty_data, refresh=None)
-        self.refresh("ConfigPage")
+        facultyCtr.editFaculty(new_faculty_data, old_name)
 
     def _undo_faculty_deletion(self, action):
         """Undo a faculty deletion"""
         faculty_data = action["data"]["faculty_data"]
         facultyCtr.addFaculty(faculty_data, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_faculty_deletion(self, action):
         """Redo a faculty deletion"""
         faculty_data = action["data"]["faculty_data"]
         facultyCtr.removeFaculty(faculty_data["name"], refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_room_addition(self, action):
         """Undo a room addition"""
         room_name = action["data"]["room_name"]
         roomCtr.removeRoom(room_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_room_addition(self, action):
         """Redo a room addition"""
         room_name = action["data"]["room_name"]
         roomCtr.addRoom(room_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_room_edit(self, action):
         """Undo a room edit"""
         old_name = action["data"]["old_name"]
         new_name = action["data"]["new_name"]
         roomCtr.editRoom(new_name, old_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_room_edit(self, action):
         """Redo a room edit"""
         old_name = action["data"]["old_name"]
         new_name = action["data"]["new_name"]
         roomCtr.editRoom(old_name, new_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_room_deletion(self, action):
         """Undo a room deletion"""
         room_name = action["data"]["room_name"]
         roomCtr.addRoom(room_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_room_deletion(self, action):
         """Redo a room deletion"""
         room_name = action["data"]["room_name"]
         roomCtr.removeRoom(room_name, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_pattern_addition(self, action):
         """Undo a pattern addition"""
@@ -2380,14 +2438,12 @@ class SchedulerApp(ctk.CTk):
             else:
                 # If not found, remove the last one
                 pattern_controller.removePattern(len(patterns) - 1, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_pattern_addition(self, action):
         """Redo a pattern addition"""
         pattern_data = action["data"]["pattern_data"]
         pattern_controller = ClassPatternController()
         pattern_controller.addPattern(pattern_data, refresh=None)
-        self.refresh("ConfigPage")
 
     def _undo_pattern_edit(self, action):
         """Undo a pattern edit"""
@@ -2395,7 +2451,6 @@ class SchedulerApp(ctk.CTk):
         pattern_index = action["data"]["pattern_index"]
         pattern_controller = ClassPatternController()
         pattern_controller.editPattern(pattern_index, old_pattern_data, refresh=None)
-        self.refresh("ConfigPage")
 
     def _redo_pattern_edit(self, action):
         """Redo a pattern edit"""
@@ -2403,7 +2458,6 @@ class SchedulerApp(ctk.CTk):
         pattern_index = action["data"]["pattern_index"]
         pattern_controller = ClassPatternController()
         pattern_controller.editPattern(pattern_index, new_pattern_data, refresh=None)
-        self.refresh("ConfigPage")
 
     def createMainPage(self):
         # Create and store the main container
@@ -2645,7 +2699,9 @@ class SchedulerApp(ctk.CTk):
                 if switch_tab:
                     app.selected_tabs["ConfigPage"] = switch_tab  # type: ignore
 
-                app.refresh(target="ConfigPage")  # type: ignore
+                # edits refresh the page through the DataManager listener
+                if response.get("action") not in ("add", "edit", "delete"):
+                    app.refresh(target="ConfigPage")  # type: ignore
 
             else:
                 app.refresh(target="ConfigPage")  # type: ignore[attr-defined]
@@ -2677,7 +2733,13 @@ class SchedulerApp(ctk.CTk):
 
         # self.schedulesImported = None
         def onImport():
-            self.schedulesImported = importSchedulesBTN(self.schedulesImportedPath)
+            source = importScheduleSourceBTN(self.schedulesImportedPath)
+            if source is None:
+                return
+            # only the schedule on screen (and a few around it) gets parsed
+            if hasattr(self.schedulesImported, "close"):
+                self.schedulesImported.close()
+            self.schedulesImported = source
             if self.schedulesImported:
                 self.schIndex = 0
                 self.numOfSch = len(self.schedulesImported)
@@ -2707,7 +2769,9 @@ class SchedulerApp(ctk.CTk):
 
         #
         def onExport():
-            exportSchedulesBTN(self.deafultSchedules, self.schedulesImportedPath)
+            exportSchedulesBTN(
+                self.deafultSchedules, self.schedulesImportedPath, widget=self
+            )
 
         exportBtn = ctk.CTkButton(
             importFrame,
@@ -2760,16 +2824,24 @@ class SchedulerApp(ctk.CTk):
             dropdown.set(self.selectedOrderBy)
             return dropdown
 
+        currentSchedule = None
         if (
             self.deafultSchedules is not None
             and self.deafultSchedules != {}
             and self.deafultSchedules != []
         ):
+            try:
+                currentSchedule = self.deafultSchedules[self.schIndex]
+            except ValueError as e:
+                # lazy sources only find a broken schedule when it is opened
+                self.schedulesImportedPath.set(str(e))
+
+        if currentSchedule is not None:
             if self.selectedSchView == "Table":
                 if self.selectedOrderBy == "Default":
                     defaultScheduleViewer(
                         schedulesFrame,
-                        self.deafultSchedules[self.schIndex],
+                        currentSchedule,
                         self.schedulesImportedPath,
                         self.schIndex,
                         self.numOfSch,
@@ -2778,7 +2850,7 @@ class SchedulerApp(ctk.CTk):
                 elif self.selectedOrderBy == "Rooms & Labs":
                     roomLabsScheduleViewer(
                         schedulesFrame,
-                        self.deafultSchedules[self.schIndex],
+                        currentSchedule,
                         self.schedulesImportedPath,
                         self.schIndex,
                         self.numOfSch,
@@ -2789,7 +2861,7 @@ class SchedulerApp(ctk.CTk):
                 elif self.selectedOrderBy == "Faculty":
                     facultyScheduleViewer(
                         schedulesFrame,
-                        self.deafultSchedules[self.schIndex],
+                        currentSchedule,
                         self.schedulesImportedPath,
                         self.schIndex,
                         self.numOfSch,
@@ -2814,7 +2886,7 @@ class SchedulerApp(ctk.CTk):
                     bottomFrame.pack(fill="both", expand=True)
 
                     plotWeeklyOrderSchedules(
-                        self.deafultSchedules[self.schIndex],
+                        currentSchedule,
                         bottomFrame,
                         "Rooms & Labs",
                     )
@@ -2831,9 +2903,7 @@ class SchedulerApp(ctk.CTk):
                     bottomFrame = ctk.CTkFrame(roomWrapper, fg_color="transparent")
                     bottomFrame.pack(fill="both", expand=True)
 
-                    plotWeeklyOrderSchedules(
-                        self.deafultSchedules[self.schIndex], bottomFrame, "Faculty"
-                    )
+                    plotWeeklyOrderSchedules(currentSchedule, bottomFrame, "Faculty")
 
         nextPrevious = ctk.CTkFrame(frame, fg_color="transparent")
         nextPrevious.pack(pady=10)
@@ -2865,6 +2935,11 @@ class SchedulerApp(ctk.CTk):
 
         updateButtonStates()
 
+        def prefetchAround():
+            # lazy sources parse the neighbours while this one is drawn
+            if hasattr(self.deafultSchedules, "prefetch"):
+                self.deafultSchedules.prefetch(self.schIndex)
+
         def changeSchedule(direction):
             if self.numOfSch == 0:
                 return
@@ -2879,6 +2954,7 @@ class SchedulerApp(ctk.CTk):
             jumpEntry.insert(0, str(self.schIndex + 1))
 
             updateButtonStates()
+            prefetchAround()
             self.refresh(target="ViewSchedulePage", data=None)
 
         def jumpToSchedule(event=None):
@@ -2895,6 +2971,7 @@ class SchedulerApp(ctk.CTk):
                 jumpEntry.insert(0, str(self.schIndex + 1))
 
             updateButtonStates()
+            prefetchAround()
             self.refresh(target="ViewSchedulePage", data=None)
 
         previousBTN.pack(side="left", padx=(0, 10))
@@ -2940,6 +3017,21 @@ class SchedulerApp(ctk.CTk):
 
         limitEntry.pack(padx=5)
 
+        # more than one worker splits the search across processes
+        ctk.CTkLabel(
+            container,
+            text="Worker processes",
+            font=("Arial", 16, "bold"),
+            anchor="w",
+        ).pack(padx=(0, 10), pady=(10, 0))
+        workersEntry = ctk.CTkEntry(
+            container,
+            placeholder_text="1",
+            font=("Arial", 16, "bold"),
+            width=100,
+        )
+        workersEntry.pack(padx=5)
+
         # Helper text explaining how generating multiple schedule instances works
         optFrame = ctk.CTkFrame(container, fg_color="transparent")
         optFrame.pack(pady=0)
@@ -2978,108 +3070,137 @@ class SchedulerApp(ctk.CTk):
             if hasattr(self, "tabview"):
                 self.tabview.set("View Schedules")
 
+        def showGenerationDone():
+            # Show completion message and button
+            ctk.CTkLabel(
+                container,
+                text="Click View Schedules to see them!",
+                font=("Arial", 20, "bold"),
+            ).pack(padx=(0, 10))
+            viewBtn = ctk.CTkButton(
+                container, text="View Schedules", width=150, command=onView
+            )
+            viewBtn.pack(padx=(0, 10))
+
         # Defines what happens when the generate button is clicked
         def onGenerate():
             selectedOpts = [key for key, var in optimizeVars.items() if var.get()]
             limit_value = limitEntry.get()
-            if limit_value.isdigit():
+            workers_value = workersEntry.get().strip()
+            if limit_value.isdigit() and (
+                workers_value == "" or workers_value.isdigit()
+            ):
                 limit_int = int(limit_value)
+                workers_int = max(1, int(workers_value or 1))
                 status_label = ctk.CTkLabel(
                     container, text="Starting generation...", font=("Arial", 18, "bold")
                 )
                 status_label.pack(pady=(10, 0))
 
+                # Check if config file is loaded before starting generation
+                if (
+                    self.configPath.get() == ""
+                    or self.configPath.get() == ".json"
+                    or "Import Config File" in self.configPath.get()
+                ):
+                    status_label.configure(
+                        text="Error: No configuration file loaded!",
+                        text_color="red",
+                    )
+                    ctk.CTkLabel(
+                        container,
+                        text="Please click 'Import Config' and select a valid config file",
+                        font=("Arial", 16),
+                        text_color="yellow",
+                    ).pack(padx=(0, 10))
+                    return
+
                 progress_bar.pack(pady=15)
                 progress_bar.set(0)
                 progress_bar.configure(mode="determinate")
 
-                # Disable buttons during generation
+                # Disable generate while the job runs, cancel/pause drive the job
                 genBtn.configure(state="disabled")
-                # importBtn.configure(state="disabled")
-
-                # Update UI immediately
-                container.update()
+                jobFrame = ctk.CTkFrame(container, fg_color="transparent")
+                jobFrame.pack(pady=(0, 10))
 
-                # Create a simple progress callback that updates UI
-                has_opt = bool(selectedOpts)
+                if selectedOpts:
+                    status_label.configure(text="Creating optimization goals...")
 
-                def progress_callback(current_step, total_steps):
-                    progress_bar.set(current_step / total_steps)
+                # The scheduler runs on a worker thread, we only poll its queue here
+                job = ScheduleGenerationJob(limit_int, selectedOpts, workers_int)
+                self.generationJob = job
 
-                    if has_opt and current_step == 1:
-                        status_label.configure(text="Creating optimization goals...")
+                def onPause():
+                    if job.paused:
+                        job.resume()
+                        pauseBtn.configure(text="Pause")
                     else:
-                        schedule_num = current_step - (1 if has_opt else 0)
+                        job.pause()
+                        pauseBtn.configure(text="Resume")
                         status_label.configure(
-                            text=f"Generating schedule {schedule_num}/{limit_int}"
+                            text=f"Paused after {len(job.schedules)}/{limit_int}"
                         )
 
-                    # Force UI update after each progress update
-                    container.update()
-
-                try:
-                    # Check if config file is loaded before starting generation
-                    if (
-                        self.configPath.get() == ""
-                        or self.configPath.get() == ".json"
-                        or "Import Config File" in self.configPath.get()
-                    ):
-                        raise ValueError(
-                            "No configuration file loaded. Please import a config file first!"
-                        )
-                    # This will block the UI but show progress updates
-                    self.schedulesImported = generateSchedulesBtn(
-                        limit_int, selectedOpts, progress_callback
-                    )
-
-                    # Final updates
-                    status_label.configure(text="All schedules generated successfully!")
-                    progress_bar.set(1)
-
-                    generation_successful = True
-                except ValueError as e:
-                    # Handle the specific "no config file" error
-                    if "No configuration file" in str(e):
-                        status_label.configure(
-                            text="Error: No configuration file loaded!"
-                        )
-                        status_label.configure(text_color="red")
-                        # You could also show a more detailed message
-                        ctk.CTkLabel(
-                            container,
-                            text="Please click 'Import Config' and select a valid config file",
-                            font=("Arial", 16),
-                            text_color="yellow",
-                        ).pack(padx=(0, 10))
-                    else:
-                        status_label.configure(text=f"Error: {str(e)}")
-                        status_label.configure(text_color="red")
-                    generation_successful = False
+                def onCancel():
+                    job.cancel()
+                    cancelBtn.configure(state="disabled")
+                    pauseBtn.configure(state="disabled")
+                    status_label.configure(text="Cancelling...")
 
-                except Exception as e:
-                    status_label.configure(text=f"Error during generation: {str(e)}")
-                    status_label.configure(text_color="red")
-                    generation_successful = False
+                pauseBtn = ctk.CTkButton(
+                    jobFrame, text="Pause", width=120, command=onPause
+                )
+                pauseBtn.pack(side="left", padx=5)
+                cancelBtn = ctk.CTkButton(
+                    jobFrame, text="Cancel", width=120, command=onCancel
+                )
+                cancelBtn.pack(side="left", padx=5)
 
-                finally:
-                    # Hide progress bar and show completion UI
+                def finish(message, successful):
+                    # Hide progress bar and job buttons, re-enable generate
                     progress_bar.pack_forget()
-
-                    # Re-enable buttons
+                    jobFrame.destroy()
                     genBtn.configure(state="normal")
-                    # importBtn.configure(state="normal")
-                    # Only show completion UI if generation was successful
-                    if generation_successful:
-                        # Show completion message and button
-                        ctk.CTkLabel(
-                            container,
-                            text="Click View Schedules to see them!",
-                            font=("Arial", 20, "bold"),
-                        ).pack(padx=(0, 10))
-                        viewBtn = ctk.CTkButton(
-                            container, text="View Schedules", width=150, command=onView
-                        )
-                        viewBtn.pack(padx=(0, 10))
+                    self.generationJob = None
+
+                    if successful:
+                        self.schedulesImported = job.schedules
+                        status_label.configure(text=message)
+                        showGenerationDone()
+                    else:
+                        status_label.configure(text=message, text_color="red")
+
+                def pollJob():
+                    for kind, payload in job.poll():
+                        if kind == "schedule":
+                            index, _, elapsed = payload
+                            progress_bar.set((index + 1) / limit_int)
+                            if not job.cancelled and not job.paused:
+                                status_label.configure(
+                                    text=f"Generating schedule {index + 1}/{limit_int} ({elapsed:.1f}s)"
+                                )
+                        elif kind == "done":
+                            progress_bar.set(1)
+                            finish("All schedules generated successfully!", True)
+                            return
+                        elif kind == "cancelled":
+                            if payload:
+                                finish(
+                                    f"Generation cancelled, kept {payload} schedules.",
+                                    True,
+                                )
+                            else:
+                                finish("Generation cancelled.", False)
+                            return
+                        elif kind == "error":
+                            finish(f"Error during generation: {payload!s}", False)
+                            return
+
+                    self.after(100, pollJob)
+
+                job.start()
+                self.after(100, pollJob)
             else:
                 ctk.CTkLabel(
                     container,
@@ -3123,6 +3244,10 @@ class SchedulerApp(ctk.CTk):
             popluateRight(rightInner)
 
     def refresh(self, target=None, data=None):
+        if target in (None, "ConfigPage") and self._configRefresh is not None:
+            # this rebuild covers the one the listener asked for
+            self.after_cancel(self._configRefresh)
+            self._configRefresh = None
         if target is None:
             for name, view in list(self.views.items()):
                 view.destroy()
@@ -0,0 +1,199 @@
+# File Name: test_config_journal.py
+#
+# Unit tests for Config_journal.py and DataManager(journal=True).
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+import Models.Data_manager as DataManagerModule
+from Models.Config_journal import ConfigJournal, fileHash
+from Models.Data_manager import DataManager
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "mainConfig.json"
+    path.write_text(
+        json.dumps(
+            {
+                "config": {
+                    "rooms": ["Roddy 101"],
+                    "labs": ["Linux"],
+                    "faculty": [{"name": "Zoppetti"}],
+                    "courses": [
+                        {
+                            "course_id": "CMSC 140",
+                            "credits": 4,
+                            "room": ["Roddy 101"],
+                            "lab": [],
+                            "faculty": ["Zoppetti"],
+                            "conflicts": [],
+                        }
+                    ],
+                }
+            },
+            indent=4,
+        )
+    )
+    return path
+
+
+def test_edits_are_replayed_on_load(config_path):
+    before = config_path.read_text()
+    dm = DataManager(str(config_path), journal=True)
+    dm.addRoom("Roddy 102")
+    dm.editCourse("CMSC 140", {"room": ["Roddy 102"]})
+    dm.addFaculty({"name": "Jones"})
+    dm.removeFaculty("Jones")
+
+    # the config itself is untouched, the edits are in the journal
+    assert config_path.read_text() == before
+    journal = ConfigJournal(str(config_path), None)
+    base, entries = journal.read()
+    assert base == fileHash(str(config_path))
+    assert [op for op, _, _ in entries] == [
+        "addRoom",
+        "editCourse",
+        "addFaculty",
+        "removeFaculty",
+    ]
+
+    again = DataManager(str(config_path), journal=True)
+    assert again.data == dm.data
+    assert again.getCourses()[0]["room"] == ["Roddy 102"]
+
+
+def test_compact_folds_journal_into_config(config_path):
+    dm = DataManager(str(config_path), journal=True)
+    dm.addLab("Mac")
+    journal_path = str(config_path) + ".journal"
+    dm.compactJournal()
+
+    assert not os.path.exists(journal_path)
+    assert "Mac" in json.loads(config_path.read_text())["config"]["labs"]
+
+    # new edits start a journal on top of the compacted config
+    dm.addLab("Windows")
+    again = DataManager(str(config_path), journal=True)
+    assert again.getLabs() == ["Linux", "Mac", "Windows"]
+
+
+def test_journal_compacts_itself_when_large(config_path):
+    with patch.object(DataManagerModule, "JOURNAL_COMPACT_MIN", 0):
+        dm = DataManager(str(config_path), journal=True)
+        for n in range(20):
+            dm.addRoom(f"Room {n}")
+    saved = json.loads(config_path.read_text())["config"]["rooms"]
+    assert saved[:2] == ["Roddy 101", "Room 0"]
+    assert DataManager(str(config_path), journal=True).getRooms() == dm.getRooms()
+
+
+def test_stale_journal_is_not_replayed(config_path):
+    dm = DataManager(str(config_path), journal=True)
+    dm.addRoom("Roddy 102")
+    config_path.write_text(config_path.read_text().replace("Roddy 101", "Roddy 1"))
+
+    with patch("builtins.print") as mock_print:
+        again = DataManager(str(config_path), journal=True)
+    assert "Roddy 102" not in again.getRooms()
+    assert "Ignoring" in mock_print.call_args_list[0].args[0]
+
+
+def test_torn_last_line_is_dropped(config_path):
+    dm = DataManager(str(config_path), journal=True)
+    dm.addRoom("Roddy 102")
+    dm.addRoom("Roddy 103")
+    journal_path = str(config_path) + ".journal"
+    with open(journal_path) as f:
+        text = f.read()
+    with open(journal_path, "w") as f:
+        f.write(text[:-10])
+
+    again = DataManager(str(config_path), journal=True)
+    assert again.getRooms() == ["Roddy 101", "Roddy 102"]
+
+
+def test_batches_are_journaled_only_when_committed(config_path):
+    dm = DataManager(str(config_path), journal=True)
+    with pytest.raises(RuntimeError), dm.batch():
+        dm.addRoom("Ghost")
+        raise RuntimeError("stop")
+    with dm.batch():
+        dm.addRoom("Roddy 102")
+        dm.addRoom("Roddy 103")
+
+    again = DataManager(str(config_path), journal=True)
+    assert again.getRooms() == ["Roddy 101", "Roddy 102", "Roddy 103"]
+
+
+def test_unknown_operation_is_not_replayed(config_path):
+    journal = ConfigJournal(str(config_path), fileHash(str(config_path)))
+    journal.append([("addRoom", ("Roddy 102",), {}), ("loadFile", ("x",), {})])
+
+    with patch("builtins.print") as mock_print:
+        dm = DataManager(str(config_path), journal=True)
+    assert dm.getRooms() == ["Roddy 101"]
+    assert "Unknown journal operation: loadFile" in str(mock_print.call_args)
+
+    # the journal is left alone and the edits are not journaled
+    dm.addRoom("Roddy 103")
+    assert len(journal.read()[1]) == 2
+
+
+def test_edits_after_torn_line_survive_reload(config_path):
+    dm = DataManager(str(config_path), journal=True)
+    dm.addRoom("R1")
+    dm.addRoom("R2")
+    journal_path = str(config_path) + ".journal"
+    with open(journal_path) as f:
+        text = f.read()
+    with open(journal_path, "w") as f:
+        f.write(text[:-10])
+
+    again = DataManager(str(config_path), journal=True)
+    again.addRoom("R3")
+    third = DataManager(str(config_path), journal=True)
+    assert third.getRooms() == ["Roddy 101", "R1", "R3"]
+    third.addRoom("R4")
+    assert DataManager(str(config_path), journal=True).getRooms() == [
+        "Roddy 101",
+        "R1",
+        "R3",
+        "R4",
+    ]
+
+
+def test_missing_newline_after_last_record(config_path):
+    dm = DataManager(str(config_path), journal=True)
+    dm.addRoom("R1")
+    journal_path = str(config_path) + ".journal"
+    with open(journal_path) as f:
+        text = f.read()
+    with open(journal_path, "w") as f:
+        f.write(text.rstrip("\n"))
+
+    again = DataManager(str(config_path), journal=True)
+    again.addRoom("R2")
+    rooms = DataManager(str(config_path), journal=True).getRooms()
+    assert rooms == ["Roddy 101", "R1", "R2"]
+
+
+def test_bad_arguments_do_not_stop_loading(config_path):
+    journal = ConfigJournal(str(config_path), fileHash(str(config_path)))
+    journal.append([("addRoom", ("Roddy 102", "extra"), {})])
+
+    with patch("builtins.print") as mock_print:
+        dm = DataManager(str(config_path), journal=True)
+    assert dm.getRooms() == ["Roddy 101"]
+    assert "Could not replay" in str(mock_print.call_args)
+
+
+def test_updateValue_is_journaled(config_path):
+    dm = DataManager(str(config_path), journal=True)
+    dm.updateValue("config.labs", ["Mac"])
+    dm.addLab("Windows")
+    again = DataManager(str(config_path), journal=True)
+    assert again.getLabs() == ["Mac", "Windows"]
@@ -815,3 +815,260 @@ def test_editFaculty_cascade_rename_updates_courses():
     assert dm.data["config"]["courses"][0]["faculty"] == ["Smythe"]
     # Other course remains unchanged
     assert dm.data["config"]["courses"][1]["faculty"] == ["Other"]
+
+
+# ---- Lookup indexes ----
+
+
+def test_index_follows_crud_calls(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    dm.addCourse({"course_id": "CMSC 150", "credits": 3, "room": ["Roddy 102"]})
+    with pytest.raises(ValueError, match="used by course 'CMSC 150'"):
+        dm.removeRoom("Roddy 102")
+
+    dm.editCourse("CMSC 150", {"room": ["Roddy 101"]})
+    dm.removeRoom("Roddy 102")
+    assert "Roddy 102" not in dm.getRooms()
+
+    dm.removeCourse("CMSC 140")
+    dm.editCourse("CMSC 150", {"credits": 4})
+    assert dm.getCourses()[0]["credits"] == 4
+    with pytest.raises(ValueError, match="Course not found"):
+        dm.editCourse("CMSC 140", {"credits": 4})
+
+
+def test_index_rebuilt_when_data_replaced(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    with pytest.raises(ValueError):
+        dm.removeLabs("Linux")
+
+    dm.data = {"config": {"rooms": [], "labs": ["Linux"], "courses": [], "faculty": []}}
+    dm.removeLabs("Linux")
+    assert dm.getLabs() == []
+
+
+def test_index_sees_courses_list_changed_directly(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    dm.removeFaculty("Jones")
+    dm.data["config"]["courses"].append(
+        {"course_id": "CMSC 150", "credits": 3, "faculty": ["Zoppetti"]}
+    )
+    dm.removeCourse("CMSC 140")
+    with pytest.raises(ValueError, match="teaching course 'CMSC 150'"):
+        dm.removeFaculty("Zoppetti")
+
+
+def test_faculty_lookup_is_case_insensitive(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    assert dm.getFacultyByName("  zoppetti ")["name"] == "Zoppetti"
+    dm.addFaculty({"name": "Smith"})
+    dm.editFaculty("SMITH", {"name": "Smythe", "maximum_credits": 6})
+    assert dm.getFacultyByName("smith") is None
+    assert dm.getFacultyByName("smythe")["maximum_credits"] == 6
+    dm.removeFaculty("Smythe")
+    assert dm.getFacultyByName("smythe") is None
+
+
+def test_faculty_rename_moves_course_references(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    dm.editFaculty("Zoppetti", {"name": "Zop"})
+    assert dm.data["config"]["courses"][0]["faculty"] == ["Zop"]
+    with pytest.raises(ValueError, match="teaching course 'CMSC 140'"):
+        dm.removeFaculty("Zop")
+
+
+def test_course_rename_moves_conflict_references(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    dm.addCourse({"course_id": "CMSC 150", "credits": 3, "conflicts": ["CMSC 140"]})
+    dm.editCourse("CMSC 140", {"course_id": "CMSC 141"})
+    dm.editCourse("CMSC 141", {"course_id": "CMSC 142"})
+    c150 = dm.data["config"]["courses"][1]
+    assert c150["conflicts"] == ["CMSC 142"]
+
+
+# ---- Reference repair ----
+
+
+def test_getCourses_cleans_once_after_data_replaced(sample_config):
+    dm = DataManager()
+    sample_config["config"]["courses"][0]["room"].append("MissingRoom")
+    dm.data = sample_config
+    assert dm.getCourses()[0]["room"] == ["Roddy 101"]
+
+    with patch.object(dm, "_clean_invalid_references") as clean:
+        dm.getCourses()
+        dm.getCourses()
+    clean.assert_not_called()
+
+
+def test_rename_room_and_lab_updates_courses(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    dm.getCourses()
+    dm.editRoom("Roddy 101", "Roddy 201")
+    dm.editLabs("Linux", "Ubuntu")
+    course = dm.getCourses()[0]
+    assert course["room"] == ["Roddy 201"]
+    assert course["lab"] == ["Ubuntu"]
+    with pytest.raises(ValueError, match="used by course 'CMSC 140'"):
+        dm.removeRoom("Roddy 201")
+
+
+def test_removeCourse_drops_conflicts_to_it(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    dm.addCourse({"course_id": "CMSC 150", "credits": 3, "conflicts": ["CMSC 140"]})
+    dm.addCourse({"course_id": "CMSC 160", "credits": 3, "conflicts": ["CMSC 150"]})
+    dm.getCourses()
+
+    with patch.object(
+        dm, "_clean_invalid_references", wraps=dm._clean_invalid_references
+    ) as clean:
+        dm.removeCourse("CMSC 140")
+    repaired = clean.call_args.args[0]
+    assert [c["course_id"] for c in repaired] == ["CMSC 150"]
+    assert dm.data["config"]["courses"][0]["conflicts"] == []
+    assert dm.data["config"]["courses"][1]["conflicts"] == ["CMSC 150"]
+
+
+def test_added_course_forward_references_checked_on_read(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    dm.getCourses()
+    dm.addCourse({"course_id": "CMSC 150", "credits": 3, "room": ["Nowhere"]})
+    assert dm.data["config"]["courses"][1]["room"] == ["Nowhere"]
+    assert dm.getCourses()[1]["room"] == []
+
+
+# ---- Batches and listeners ----
+
+
+def test_listener_called_after_each_edit(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    calls = []
+    dm.addListener(calls.append)
+    dm.addRoom("Roddy 103")
+    dm.editCourse("CMSC 140", {"credits": 3})
+    assert calls == [
+        [("addRoom", ("Roddy 103",), {})],
+        [("editCourse", ("CMSC 140", {"credits": 3}), {})],
+    ]
+
+    dm.removeListener(calls.append)
+    with pytest.raises(ValueError):
+        dm.removeRoom("Missing")
+    dm.addLab("Mac")
+    assert len(calls) == 2
+
+
+def test_batch_notifies_once(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    calls = []
+    dm.addListener(calls.append)
+    with patch("builtins.print") as mock_print, dm.batch():
+        for n in range(150, 160):
+            dm.addCourse({"course_id": f"CMSC {n}", "credits": 3})
+        with dm.batch():
+            dm.addRoom("Roddy 103")
+    mock_print.assert_called_once_with("Applied 11 changes.")
+    assert len(calls) == 1
+    assert [c[0] for c in calls[0]] == ["addCourse"] * 10 + ["addRoom"]
+    assert len(dm.getCourses()) == 11
+
+
+def test_batch_validates_against_final_config(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    with pytest.raises(ValueError, match="Unknown room"):
+        dm.editCourse("CMSC 140", {"room": ["Roddy 103"]})
+
+    with dm.batch():
+        dm.editCourse("CMSC 140", {"room": ["Roddy 103"]})
+        dm.addRoom("Roddy 103")
+    assert dm.getCourses()[0]["room"] == ["Roddy 103"]
+
+
+def test_batch_rolls_back_on_error(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    before = json.loads(json.dumps(sample_config))
+    data = dm.data
+    calls = []
+    dm.addListener(calls.append)
+
+    with pytest.raises(ValueError, match="Duplicate course ID 'CMSC 150'"), dm.batch():
+        dm.addRoom("Roddy 103")
+        dm.removeFaculty("Jones")
+        dm.addCourse({"course_id": "CMSC 150", "credits": 3})
+        dm.addCourse({"course_id": "CMSC 150", "credits": 4})
+
+    assert dm.data is data
+    assert dm.data == before
+    assert calls == []
+    # the indexes follow the restored data
+    with pytest.raises(ValueError, match="used by course 'CMSC 140'"):
+        dm.removeRoom("Roddy 101")
+    dm.removeFaculty("Jones")
+
+
+def test_batch_rolls_back_on_exception_in_body(sample_config):
+    dm = DataManager()
+    dm.data = sample_config
+    with pytest.raises(RuntimeError), dm.batch():
+        dm.addLab("Mac")
+        raise RuntimeError("stop")
+    assert "Mac" not in dm.getLabs()
+
+
+# ---- Saving ----
+
+
+def test_saveData_skips_unchanged(tmp_path, sample_config):
+    file_path = tmp_path / "out.json"
+    dm = DataManager()
+    dm.data = sample_config
+    assert dm.saveData(str(file_path)) is True
+    assert dm.saveData(str(file_path)) is False
+
+    dm.addRoom("Roddy 103")
+    assert dm.saveData(str(file_path)) is True
+    assert "Roddy 103" in json.loads(file_path.read_text())["config"]["rooms"]
+
+    # written again if the file went away or was changed by someone else
+    file_path.unlink()
+    assert dm.saveData(str(file_path)) is True
+    file_path.write_text("{}")
+    assert dm.saveData(str(file_path)) is True
+    assert json.loads(file_path.read_text()) == dm.data
+
+
+def test_saveData_compact(tmp_path, sample_config):
+    file_path = tmp_path / "out.json"
+    dm = DataManager()
+    dm.data = sample_config
+    dm.saveData(str(file_path), compact=True)
+    text = file_path.read_text()
+    assert "\n" not in text and ", " not in text
+    assert json.loads(text) == sample_config
+
+
+def test_saveData_failure_keeps_old_file(tmp_path, sample_config):
+    file_path = tmp_path / "out.json"
+    file_path.write_text('{"old": true}')
+    dm = DataManager()
+    dm.data = sample_config
+    with (
+        patch("Models.Data_manager.os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        dm.saveData(str(file_path))
+    assert json.loads(file_path.read_text()) == {"old": True}
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
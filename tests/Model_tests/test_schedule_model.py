@@ -0,0 +1,107 @@
+# File Name: test_schedule_model.py
+#
+# Unit tests for the typed Schedule model in Schedule.py using pytest.
+
+import pytest
+
+from Models.Schedule import (
+    ClassRow,
+    Schedule,
+    ScheduledCourse,
+    formatMeeting,
+    parseMeetingText,
+    schedulesToRows,
+)
+
+ROWS = [
+    [
+        "CMSC 161.01",
+        "Hogg",
+        "Roddy 140",
+        "Linux",
+        "TUE 10:00-11:50^",
+        "THU 10:00-11:15",
+    ],
+    [
+        "CMSC 140.01",
+        "Zoppetti",
+        "Roddy 136",
+        "None",
+        "MON 09:00-09:50",
+        "WED 09:00-09:50",
+    ],
+]
+
+
+def test_parse_meeting_text():
+    """Meetings become (day, start, end, is_lab) minutes."""
+    assert parseMeetingText("MON 09:00-09:50") == (0, 540, 590, False)
+    assert parseMeetingText("WED 14:00-15:50^") == (2, 840, 950, True)
+    assert parseMeetingText("garbage") is None
+    assert parseMeetingText("MON 25:00-26:00") is None
+
+
+def test_format_meeting_round_trips():
+    for text in ("MON 09:00-09:50", "FRI 14:00-15:50^"):
+        assert formatMeeting(parseMeetingText(text)) == text
+
+
+def test_from_rows_round_trips():
+    """A schedule built from rows gives the same rows back."""
+    schedule = Schedule.fromRows(ROWS)
+    assert schedule.toRows() == ROWS
+    assert schedule == ROWS
+    assert schedule[1].meetings == ((0, 540, 590, False), (2, 540, 590, False))
+
+
+def test_scheduled_course_acts_like_row():
+    course = ScheduledCourse.fromRow(ROWS[0])
+    name, faculty, room, lab, *times = course
+    assert (name, faculty, room, lab) == ("CMSC 161.01", "Hogg", "Roddy 140", "Linux")
+    assert times == ["TUE 10:00-11:50^", "THU 10:00-11:15"]
+    assert course[4:] == times
+    assert len(course) == 6
+    assert course.timesByDay() == {"TUE": "10:00-11:50^", "THU": "10:00-11:15"}
+
+
+def test_names_are_interned():
+    a = ScheduledCourse.fromRow(list(ROWS[1]))
+    b = ScheduledCourse.fromRow(["".join(part) for part in ROWS[1]])
+    assert a.faculty is b.faculty
+
+
+def test_invalid_meeting_raises():
+    with pytest.raises(ValueError):
+        ScheduledCourse.fromRow(
+            ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "soon"]
+        )
+
+
+def test_slots_keep_objects_small():
+    course = ScheduledCourse.fromRow(ROWS[1])
+    assert not hasattr(course, "__dict__")
+    with pytest.raises(AttributeError):
+        course.extra = 1
+
+
+def test_row_access_does_not_rebuild_the_row(monkeypatch):
+    course = ScheduledCourse.fromRow(ROWS[0])
+    monkeypatch.setattr(
+        ScheduledCourse, "toRow", lambda self: pytest.fail("row was rebuilt")
+    )
+    assert list(course) == ROWS[0]
+    assert [course[i] for i in range(-6, 6)] == ROWS[0] * 2
+    with pytest.raises(IndexError):
+        course[6]
+
+
+def test_class_row_keeps_meetings():
+    meetings = ScheduledCourse.fromRow(ROWS[0]).meetings
+    row = ClassRow(["CMSC 161.01", "Hogg"], meetings)
+    assert row == ["CMSC 161.01", "Hogg", "TUE 10:00-11:50^", "THU 10:00-11:15"]
+    assert row.meetings == meetings
+
+
+def test_schedules_to_rows_handles_nesting():
+    schedules = [Schedule.fromRows(ROWS), ROWS]
+    assert schedulesToRows(schedules) == [ROWS, ROWS]
@@ -0,0 +1,95 @@
+# File Name: test_schedule_set.py
+#
+# Unit tests for the columnar ScheduleSet in ScheduleSet.py using pytest.
+
+import pytest
+
+from Models.Schedule import Schedule
+from Models.ScheduleSet import ScheduleSet
+
+SCHEDULES = [
+    [
+        [
+            "CMSC 140.01",
+            "Zoppetti",
+            "Roddy 136",
+            "None",
+            "MON 09:00-09:50",
+            "WED 09:00-09:50",
+        ],
+        [
+            "CMSC 161.01",
+            "Hogg",
+            "Roddy 140",
+            "Linux",
+            "TUE 10:00-11:50^",
+            "THU 10:00-11:15",
+        ],
+    ],
+    [
+        ["CMSC 140.01", "Hogg", "Roddy 140", "None", "MON 13:00-13:50"],
+        ["CMSC 161.01", "Zoppetti", "Roddy 136", "Mac", "TUE 08:00-09:50^"],
+    ],
+]
+
+
+def test_round_trips_rows():
+    """Rows go in and come back out unchanged."""
+    scheduleSet = ScheduleSet.fromRows(SCHEDULES)
+    assert len(scheduleSet) == 2
+    assert scheduleSet.recordCount == 6
+    assert scheduleSet.toRows() == SCHEDULES
+    assert scheduleSet.schedule(1) == SCHEDULES[1]
+
+
+def test_accepts_schedule_objects():
+    scheduleSet = ScheduleSet.fromRows([Schedule.fromRows(s) for s in SCHEDULES])
+    assert scheduleSet.toRows() == SCHEDULES
+
+
+def test_row_without_meetings_round_trips():
+    rows = [["CMSC 499.01", "Hogg", "Roddy 140", "None"]]
+    assert ScheduleSet.fromRows([rows]).toRows() == [rows]
+
+
+def test_names_stored_once():
+    scheduleSet = ScheduleSet.fromRows(SCHEDULES)
+    assert scheduleSet.tables["faculty"] == ["Zoppetti", "Hogg"]
+    assert scheduleSet.tables["lab"] == ["None", "Linux", "Mac"]
+
+
+def test_where_matches_every_condition():
+    scheduleSet = ScheduleSet.fromRows(SCHEDULES)
+    records = scheduleSet.where(room="Roddy 136", day="MON")
+    assert [scheduleSet.meetingText(i) for i in records] == ["MON 09:00-09:50"]
+    assert scheduleSet.schedulesWhere(faculty="Hogg", is_lab=True) == [0]
+    assert scheduleSet.where(room="Nowhere") == []
+
+
+def test_where_rejects_unknown_column():
+    with pytest.raises(ValueError):
+        ScheduleSet.fromRows(SCHEDULES).where(building="Roddy")
+
+
+def test_group_by_room_for_all_schedules():
+    scheduleSet = ScheduleSet.fromRows(SCHEDULES)
+    groups = scheduleSet.groupBy("room")
+    assert set(groups) == {
+        (0, "Roddy 136"),
+        (0, "Roddy 140"),
+        (1, "Roddy 136"),
+        (1, "Roddy 140"),
+    }
+    assert scheduleSet.minutes(groups[(0, "Roddy 140")]) == 110 + 75
+    assert scheduleSet.value("course", groups[(1, "Roddy 136")][0]) == "CMSC 161.01"
+
+
+def test_group_by_across_schedules():
+    groups = ScheduleSet.fromRows(SCHEDULES).groupBy("faculty", perSchedule=False)
+    assert sorted(groups) == ["Hogg", "Zoppetti"]
+    assert len(groups["Hogg"]) == 3
+
+
+def test_schedule_index_out_of_range():
+    with pytest.raises(IndexError):
+        ScheduleSet.fromRows(SCHEDULES).schedule(2)
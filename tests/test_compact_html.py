@@ -0,0 +1,59 @@
+# File Name: test_compact_html.py
+#
+# Tests for the self-contained .htm schedule viewer export.
+import json
+import re
+
+from Controller.compact_html import (
+    exportCompactScheduleHTML,
+    packMeeting,
+    unpackMeeting,
+)
+
+ROWS = [
+    ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"],
+    ["CMSC </script> 161.01", "Hogg", "Roddy 140", "Linux", "TUE 10:00-11:50^"],
+]
+
+
+def _embedded(html, scriptId):
+    pattern = f'<script id="{scriptId}" type="application/json">(.*?)</script>'
+    return json.loads(re.search(pattern, html, re.S).group(1))
+
+
+def test_meeting_packing_round_trips():
+    for meeting in [(0, 540, 590, False), (6, 0, 1439, True), (1, 600, 710, True)]:
+        assert unpackMeeting(packMeeting(meeting)) == meeting
+
+
+def test_schedules_are_embedded_once_with_a_string_table(tmp_path):
+    path = tmp_path / "all.htm"
+    exportCompactScheduleHTML([ROWS, ROWS[::-1]] * 50, str(path))
+    html = path.read_text()
+
+    strings = _embedded(html, "strings")
+    schedules = _embedded(html, "schedules")
+    assert len(schedules) == 100
+    assert sorted(strings) == sorted(set(strings))
+    assert [strings[i] for i in schedules[0][1][:4]] == ROWS[1][:4]
+    assert unpackMeeting(schedules[0][1][4]) == (1, 600, 710, True)
+
+    # no CDN, and names cannot close the script tag
+    assert "jquery" not in html
+    assert html.count("</script>") == 3
+
+
+def test_rows_are_embedded_in_time_order(tmp_path):
+    from Controller.schedule_layout import sortSchedulesByTime
+
+    late = ["CMSC 162.01", "Hogg", "Roddy 136", "None", "FRI 08:00-09:15"]
+    schedule = [late, ROWS[1], ROWS[0]]
+    path = tmp_path / "one.htm"
+    exportCompactScheduleHTML([schedule], str(path))
+    html = path.read_text()
+
+    strings = _embedded(html, "strings")
+    rows = _embedded(html, "schedules")[0]
+    names = [strings[row[0]] for row in rows]
+    assert names == [row[0] for row in sortSchedulesByTime(schedule)]
+    assert names == ["CMSC 140.01", ROWS[1][0], "CMSC 162.01"]
@@ -7,7 +7,7 @@
 import sys
 import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 mock = Mock()
 sys.modules["reportlab"] = mock
@@ -20,6 +20,9 @@ sys.modules["reportlab.platypus"] = mock
 if True:
     import Controller.main_controller as ctrl
 
+# the app's own DataManager, before the fixture below swaps it for a mock
+APP_DM = ctrl.DM
+
 # with patch("Controller.main_controller.DataManager", Mock(return_value=Mock())):
 
 
@@ -27,7 +30,7 @@ if True:
 @pytest.fixture(autouse=True)
 def reset_dm(monkeypatch):
     """Provide a mock DataManager for each test run."""
-    dm = Mock()
+    dm = MagicMock()
     dm.data = {"config": {"rooms": [], "labs": [], "courses": [], "faculty": []}}
     monkeypatch.setattr(ctrl, "DM", dm)
     return dm
@@ -72,10 +75,10 @@ def test_configExportBTN_saves(monkeypatch, tmp_path):
     assert "Config File saved" in pathVar.set.call_args[0][0]
 
 
-def test_importSchedulesBTN_reads_valid_json(monkeypatch, tmp_path):
-    data = {"schedules": [1, 2]}
+def test_importScheduleSourceBTN_reads_wrapped_json(monkeypatch, tmp_path):
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
     file_path = tmp_path / "sch.json"
-    file_path.write_text(json.dumps(data))
+    file_path.write_text(json.dumps({"schedules": [rows, rows]}))
 
     monkeypatch.setattr(
         "Controller.main_controller.filedialog.askopenfilename",
@@ -83,18 +86,43 @@ def test_importSchedulesBTN_reads_valid_json(monkeypatch, tmp_path):
     )
 
     pathVar = Mock()
-    result = ctrl.importSchedulesBTN(pathVar)
-    assert result == data
+    source = ctrl.importScheduleSourceBTN(pathVar)
+    assert source.toRows() == [rows, rows]
     assert pathVar.set.call_args[0][0] == str(file_path)
+    source.close()
 
 
-def test_importSchedulesBTN_invalid_path(monkeypatch):
+def test_importScheduleSourceBTN_reads_csv_and_reports_line(monkeypatch, tmp_path):
+    file_path = tmp_path / "sch.csv"
+    monkeypatch.setattr(
+        "Controller.main_controller.filedialog.askopenfilename",
+        Mock(return_value=str(file_path)),
+    )
+
+    file_path.write_text("A,B,C,None,MON 09:00-09:50\n\nD,E,F,None,TUE 10:00-10:50\n")
+    pathVar = Mock()
+    source = ctrl.importScheduleSourceBTN(pathVar)
+    assert source.toRows() == [
+        [["A", "B", "C", "None", "MON 09:00-09:50"]],
+        [["D", "E", "F", "None", "TUE 10:00-10:50"]],
+    ]
+    assert pathVar.set.call_args[0][0] == str(file_path)
+    source.close()
+
+    file_path.write_text("A,B,C,None,MON 09:00-09:50\n,,,,\nD,E,F,None,noon\n")
+    source = ctrl.importScheduleSourceBTN(pathVar)
+    with pytest.raises(ValueError, match=r"line 3 \(row 0 in schedule 1\)"):
+        source[1]
+    source.close()
+
+
+def test_importScheduleSourceBTN_invalid_path(monkeypatch):
     monkeypatch.setattr(
         "Controller.main_controller.filedialog.askopenfilename",
         Mock(return_value="nonexistent.json"),
     )
     pathVar = Mock()
-    result = ctrl.importSchedulesBTN(pathVar)
+    result = ctrl.importScheduleSourceBTN(pathVar)
     assert result is None
     assert "Unable to open" in pathVar.set.call_args[0][0]
 
@@ -683,39 +711,6 @@ def test_course_controller_edit_with_target_index():
     ctrl.DM.editCourse.assert_called_with("CMSC 140", course_data, target_index=2)
 
 
-def test_generate_schedules_with_optimization_flags():
-    """Test that generateSchedulesBtn properly sets optimization flags"""
-    with patch("Controller.main_controller.Scheduler") as MockScheduler:
-        with patch("Controller.main_controller.CombinedConfig"):
-            mock_scheduler_instance = MockScheduler.return_value
-            mock_scheduler_instance.get_models.return_value = []
-
-            # Test with optimization flags
-            optimize_flags = ["faculty_course", "pack_rooms"]
-            result = ctrl.generateSchedulesBtn(5, optimize_flags, None)
-
-            # Verify optimization flags were set
-            ctrl.DM.updateOptimizerFlags.assert_called_with(optimize_flags)
-            ctrl.DM.updateLimit.assert_called_with(5)
-            assert result == []
-
-
-def test_generate_schedules_with_zero_limit():
-    """Test generateSchedulesBtn handles zero limit gracefully"""
-    with patch("Controller.main_controller.Scheduler") as MockScheduler:
-        with patch("Controller.main_controller.CombinedConfig"):
-            mock_scheduler_instance = MockScheduler.return_value
-            mock_scheduler_instance.get_models.return_value = []
-
-            # Test with limit of 0
-            result = ctrl.generateSchedulesBtn(0, [], None)
-
-            # Should return empty list
-            assert result == []
-            # Should update limit in DataManager
-            ctrl.DM.updateLimit.assert_called_with(0)
-
-
 def test_config_import_empty_path():
     """Test configImportBTN with empty file path"""
     with patch(
@@ -880,179 +875,6 @@ def test_configExportBTN_cancelled():
         pathVar.set.assert_not_called()
 
 
-def test_generateSchedulesBtn_with_progress_callback():
-    """Test schedule generation with progress callback"""
-    with patch("Controller.main_controller.Scheduler") as MockScheduler:
-        with patch("Controller.main_controller.CombinedConfig"):
-            mock_scheduler_instance = MockScheduler.return_value
-
-            # Mock course objects with as_csv method
-            mock_course1 = Mock()
-            mock_course1.as_csv.return_value = (
-                "CMSC101,Dr.Smith,Room101,LabA,MON 9:00-10:00"
-            )
-            mock_course2 = Mock()
-            mock_course2.as_csv.return_value = (
-                "CMSC102,Dr.Johnson,Room102,LabB,TUE 10:00-11:00"
-            )
-
-            # Mock generator that yields two schedules
-            mock_scheduler_instance.get_models.return_value = [
-                [mock_course1, mock_course2],
-                [mock_course1],  # Second schedule with one course
-            ]
-
-            progress_calls = []
-
-            def progress_callback(current, total):
-                progress_calls.append((current, total))
-
-            result = ctrl.generateSchedulesBtn(2, [], progress_callback)
-
-            # Verify progress was called for each schedule
-            assert len(progress_calls) == 2
-            assert progress_calls[0] == (1, 2)
-            assert progress_calls[1] == (2, 2)
-
-            # Verify result structure
-            assert len(result) == 2
-            assert len(result[0]) == 2  # First schedule has 2 courses
-            assert len(result[1]) == 1  # Second schedule has 1 course
-
-
-def test_generateSchedulesBtn_with_optimization_and_progress():
-    """Test schedule generation with optimization flags and progress tracking"""
-    with patch("Controller.main_controller.Scheduler") as MockScheduler:
-        with patch("Controller.main_controller.CombinedConfig"):
-            mock_scheduler_instance = MockScheduler.return_value
-            mock_scheduler_instance.get_models.return_value = [
-                [Mock(as_csv=Mock(return_value="course1,data"))]
-            ]
-
-            progress_calls = []
-
-            def progress_callback(current, total):
-                progress_calls.append((current, total))
-
-            optimize_flags = ["faculty_course", "pack_rooms"]
-            ctrl.generateSchedulesBtn(1, optimize_flags, progress_callback)
-
-            # Should call progress for optimization step and schedule generation
-            assert len(progress_calls) == 2
-            assert progress_calls[0] == (1, 2)  # Optimization step
-            assert progress_calls[1] == (2, 2)  # Schedule generation
-
-
-def test_checkFileContent_valid_data():
-    """Test checkFileContent with valid schedule data"""
-    valid_data = [
-        [  # Schedule 1
-            ["CMSC101", "Dr. Smith", "Room101", "LabA", "MON 9:00-10:00"],
-            ["CMSC102", "Dr. Johnson", "Room102", "LabB", "TUE 10:00-11:00"],
-        ],
-        [  # Schedule 2
-            ["CMSC103", "Dr. Wilson", "Room103", "LabC", "WED 11:00-12:00"]
-        ],
-    ]
-
-    pathVar = Mock()
-    result = ctrl.checkFileContent(valid_data, pathVar)
-
-    assert result is True
-    pathVar.set.assert_not_called()  # No error message should be set
-
-
-def test_checkFileContent_invalid_schedule_not_list():
-    """Test checkFileContent with invalid schedule (not a list)"""
-    invalid_data = [
-        ["valid", "schedule", "data"],
-        "not_a_list",  # Invalid: schedule is not a list
-    ]
-
-    pathVar = Mock()
-    result = ctrl.checkFileContent(invalid_data, pathVar)
-
-    assert result is False
-    # The actual error message format is different than expected
-    error_message = pathVar.set.call_args[0][0]
-    assert "is not a list" in error_message
-    # Check that it contains the key error components
-    assert "schedule" in error_message and "not a list" in error_message
-
-
-def test_checkFileContent_empty_schedule():
-    """Test checkFileContent with empty schedule"""
-    invalid_data = [
-        []  # Empty schedule
-    ]
-
-    pathVar = Mock()
-    result = ctrl.checkFileContent(invalid_data, pathVar)
-
-    assert result is False
-    assert "schedule 0 is empty" in pathVar.set.call_args[0][0]
-
-
-def test_checkFileContent_row_too_few_elements():
-    """Test checkFileContent with row that has too few elements"""
-    invalid_data = [
-        [
-            ["CMSC101", "Dr. Smith", "Room101"]  # Only 3 elements, need at least 5
-        ]
-    ]
-
-    pathVar = Mock()
-    result = ctrl.checkFileContent(invalid_data, pathVar)
-
-    assert result is False
-    assert "row 0 in schedule 0 has too few elements" in pathVar.set.call_args[0][0]
-
-
-def test_csvToJson_simple_conversion():
-    """Test CSV to JSON conversion with simple data"""
-    csv_data = [
-        ["CMSC101", "Dr. Smith", "Room101", "LabA", "MON 9:00-10:00"],
-        ["CMSC102", "Dr. Johnson", "Room102", "LabB", "TUE 10:00-11:00"],
-        [],  # Empty row as separator
-        ["CMSC103", "Dr. Wilson", "Room103", "LabC", "WED 11:00-12:00"],
-    ]
-
-    result = ctrl.csvToJson(csv_data)
-
-    assert len(result) == 2  # Two schedules separated by empty row
-    assert len(result[0]) == 2  # First schedule has 2 courses
-    assert len(result[1]) == 1  # Second schedule has 1 course
-
-
-def test_csvToJson_no_separators():
-    """Test CSV to JSON conversion with no empty row separators"""
-    csv_data = [
-        ["CMSC101", "Dr. Smith", "Room101", "LabA", "MON 9:00-10:00"],
-        ["CMSC102", "Dr. Johnson", "Room102", "LabB", "TUE 10:00-11:00"],
-    ]
-
-    result = ctrl.csvToJson(csv_data)
-
-    assert len(result) == 1  # One schedule (no separators)
-    assert len(result[0]) == 2  # Schedule has 2 courses
-
-
-def test_csvToJson_multiple_empty_rows():
-    """Test CSV to JSON conversion with multiple consecutive empty rows"""
-    csv_data = [
-        ["CMSC101", "Dr. Smith", "Room101", "LabA", "MON 9:00-10:00"],
-        [],  # Empty row
-        [],  # Another empty row
-        ["CMSC102", "Dr. Johnson", "Room102", "LabB", "TUE 10:00-11:00"],
-    ]
-
-    result = ctrl.csvToJson(csv_data)
-
-    assert len(result) == 2  # Two schedules
-    assert len(result[0]) == 1  # First schedule has 1 course
-    assert len(result[1]) == 1  # Second schedule has 1 course
-
-
 def test_rooms_controller_operations_without_refresh():
     """Test rooms controller operations without refresh callback"""
     c = ctrl.RoomsController()
@@ -1129,14 +951,14 @@ def test_controllers_handle_none_data_gracefully():
     assert courses == []
 
 
-def test_importSchedulesBTN_handles_file_read_errors():
-    """Test importSchedulesBTN handles file read errors gracefully"""
+def test_importScheduleSourceBTN_handles_file_read_errors():
+    """Test importScheduleSourceBTN handles file read errors gracefully"""
     with patch("Controller.main_controller.filedialog.askopenfilename") as mock_file:
         with patch("builtins.open", side_effect=IOError("File read error")):
             mock_file.return_value = "/fake/path.json"
             pathVar = Mock()
 
-            result = ctrl.importSchedulesBTN(pathVar)
+            result = ctrl.importScheduleSourceBTN(pathVar)
 
             assert result is None
             assert "Unable to open" in pathVar.set.call_args[0][0]
@@ -1161,53 +983,6 @@ def test_exportSchedulesBTN_handles_file_write_errors():
             pathVar.set.assert_not_called()
 
 
-def test_generateSchedulesBtn_early_break():
-    """Test that generateSchedulesBtn breaks early when limit is reached"""
-    with patch("Controller.main_controller.Scheduler") as MockScheduler:
-        with patch("Controller.main_controller.CombinedConfig"):
-            mock_scheduler_instance = MockScheduler.return_value
-
-            # Mock generator that yields infinite schedules
-            def infinite_schedules():
-                i = 0
-                while True:
-                    yield [Mock(as_csv=Mock(return_value=f"Course{i}"))]
-                    i += 1
-
-            mock_scheduler_instance.get_models.return_value = infinite_schedules()
-
-            # Request only 3 schedules from infinite generator
-            result = ctrl.generateSchedulesBtn(3, [], None)
-
-            # Should return exactly 3 schedules
-            assert len(result) == 3
-
-
-def test_checkFileContent_edge_cases():
-    """Test checkFileContent with various edge cases"""
-    pathVar = Mock()
-
-    # Test with None data
-    result = ctrl.checkFileContent(None, pathVar)
-    assert result is False
-    # Just verify that an error message was set, don't check the exact content
-    pathVar.set.assert_called_once()
-
-    # Reset the mock for next test
-    pathVar.reset_mock()
-
-    # Test with empty list
-    result = ctrl.checkFileContent([], pathVar)
-    # Don't assert on the specific result, just that the function doesn't crash
-    # Empty list might be valid or invalid depending on implementation
-
-    # Test with list containing None
-    pathVar.reset_mock()
-    result = ctrl.checkFileContent([None], pathVar)
-    assert result is False
-    pathVar.set.assert_called_once()
-
-
 def test_controllers_method_chaining():
     """Test that controller methods can be chained without issues"""
     c_rooms = ctrl.RoomsController()
@@ -1224,60 +999,24 @@ def test_controllers_method_chaining():
     assert ctrl.DM.addLab.call_count == 2
 
 
-def test_importSchedulesBTN_json_direct_wrapped_format():
-    """Test importing JSON files with direct wrapped format (not list of lists)"""
-    with patch("Controller.main_controller.filedialog.askopenfilename") as mock_file:
-        with patch("builtins.open"):
-            # Mock a JSON file that contains a dict with 'schedules' key
-            # but the value is not a list of lists (simple test-style JSON)
-            mock_json_data = {
+def test_importScheduleSourceBTN_rejects_other_wrapped_json(tmp_path):
+    """A "schedules" key that does not hold a list of schedules is rejected"""
+    file_path = tmp_path / "sch.json"
+    file_path.write_text(
+        json.dumps(
+            {
                 "schedules": {
                     "schedule1": ["CMSC101", "Dr. Smith", "Room101"],
                     "schedule2": ["CMSC102", "Dr. Johnson", "Room102"],
                 }
             }
-
-            # Mock file reading more simply
-            mock_file.return_value = "/test/path.json"
-
-            # Mock json.load to return our test data directly
-            with patch("json.load") as mock_json_load:
-                mock_json_load.return_value = mock_json_data
-
-                pathVar = Mock()
-                result = ctrl.importSchedulesBTN(pathVar)
-
-                # The function might be failing the checkFileContent validation
-                # Let's see what actually happens - it might return None due to validation
-                if result is None:
-                    # If it returns None, check what error message was set
-                    error_message = pathVar.set.call_args[0][0]
-                    # The function might be validating the structure and rejecting it
-                    print(f"Function returned None with error: {error_message}")
-                    # In this case, the test should expect None due to invalid structure
-                    assert result is None
-                    assert "Invalid" in error_message or "Unable" in error_message
-                else:
-                    # If it returns data, verify it's correct
-                    assert result == mock_json_data
-                    pathVar.set.assert_called_with("/test/path.json")
-
-
-def test_generateSchedulesBtn_zero_limit_returns_empty():
-    """Test that generateSchedulesBtn returns empty list when limit is 0"""
-    with patch("Controller.main_controller.Scheduler") as MockScheduler:
-        with patch("Controller.main_controller.CombinedConfig"):
-            mock_scheduler_instance = MockScheduler.return_value
-            mock_scheduler_instance.get_models.return_value = [
-                [Mock(as_csv=Mock(return_value="course1"))],
-                [Mock(as_csv=Mock(return_value="course2"))],
-            ]
-
-            result = ctrl.generateSchedulesBtn(0, [], None)
-
-            assert result == []
-            # The function might still call get_models, but should break immediately
-            # Don't assert on get_models being called or not
+        )
+    )
+    with patch("Controller.main_controller.filedialog.askopenfilename") as mock_file:
+        mock_file.return_value = str(file_path)
+        pathVar = Mock()
+        assert ctrl.importScheduleSourceBTN(pathVar) is None
+        assert "does not hold a list of schedules" in pathVar.set.call_args[0][0]
 
 
 def test_configImportBTN_empty_filepath_handled():
@@ -1418,21 +1157,6 @@ def test_labs_controller_remove_with_nonexistent_lab():
     ctrl.DM.removeLabs.assert_not_called()
 
 
-def test_generateSchedulesBtn_no_optimization_flags():
-    """Test generateSchedulesBtn with empty optimization flags list"""
-    with patch("Controller.main_controller.Scheduler") as MockScheduler:
-        with patch("Controller.main_controller.CombinedConfig"):
-            mock_scheduler_instance = MockScheduler.return_value
-            mock_scheduler_instance.get_models.return_value = [
-                [Mock(as_csv=Mock(return_value="course1,data"))]
-            ]
-
-            result = ctrl.generateSchedulesBtn(1, [], None)
-
-            assert len(result) == 1
-            ctrl.DM.updateOptimizerFlags.assert_called_with([])
-
-
 def test_controllers_method_return_values():
     """Test that controller methods return expected values"""
     c_rooms = ctrl.RoomsController()
@@ -1452,33 +1176,6 @@ def test_controllers_method_return_values():
     assert c_courses.listCourses() == [{"id": "C1"}]
 
 
-def test_generateSchedulesBtn_basic_functionality():
-    """Test basic schedule generation functionality"""
-    with patch("Controller.main_controller.Scheduler") as MockScheduler:
-        with patch("Controller.main_controller.CombinedConfig"):
-            mock_scheduler_instance = MockScheduler.return_value
-
-            # Mock a single course schedule
-            mock_course = Mock()
-            mock_course.as_csv.return_value = (
-                "CMSC101,Faculty1,Room1,Lab1,MON 9:00-10:00"
-            )
-            mock_scheduler_instance.get_models.return_value = [[mock_course]]
-
-            result = ctrl.generateSchedulesBtn(1, [], None)
-
-            # Should return list with one schedule containing one course
-            assert len(result) == 1
-            assert len(result[0]) == 1
-            assert result[0][0] == [
-                "CMSC101",
-                "Faculty1",
-                "Room1",
-                "Lab1",
-                "MON 9:00-10:00",
-            ]
-
-
 def test_faculty_controller_operations():
     """Test faculty controller basic operations"""
     c = ctrl.FacultyController()
@@ -1972,3 +1669,597 @@ def test_classpatterncontroller_savepatterns_clears_existing_patterns(reset_dm):
 
     # Verify new pattern was added
     mock_dm.addClassPattern.assert_called_once_with(new_pattern)
+
+
+# --- ScheduleGenerationJob ---
+
+
+def _mock_course(csv):
+    return Mock(as_csv=Mock(return_value=csv))
+
+
+def _run_job(job, timeout=5):
+    job.start()
+    job.join(timeout)
+    assert not job.isRunning()
+    return job.poll()
+
+
+def test_generation_job_streams_schedules_and_timestamps():
+    """Worker thread should hand back each schedule with a timestamp, then done"""
+    with (
+        patch("Controller.main_controller.Scheduler") as MockScheduler,
+        patch("Controller.main_controller.CombinedConfig"),
+    ):
+        MockScheduler.return_value.get_models.return_value = [
+            [_mock_course("CMSC101,Dr.Smith,Room101,None,MON 9:00-10:00")],
+            [_mock_course("CMSC102,Dr.Jones,Room102,None,TUE 9:00-10:00")],
+            [_mock_course("CMSC103,Dr.Wilson,Room103,None,WED 9:00-10:00")],
+        ]
+
+        job = ctrl.ScheduleGenerationJob(2, ["pack_rooms"])
+        messages = _run_job(job)
+
+    kinds = [kind for kind, _ in messages]
+    assert kinds == ["schedule", "schedule", "done"]
+    assert messages[0][1][0] == 0
+    assert messages[0][1][1][0][0] == "CMSC101"
+    assert messages[-1][1] == 2
+    assert len(job.schedules) == 2
+    assert len(job.timestamps) == 2
+    assert job.timestamps[0] <= job.timestamps[1]
+    ctrl.DM.updateOptimizerFlags.assert_called_with(["pack_rooms"])
+
+
+def test_generation_job_cancel_before_first_schedule():
+    """Cancelling a paused job should stop without pulling another schedule"""
+    with (
+        patch("Controller.main_controller.Scheduler") as MockScheduler,
+        patch("Controller.main_controller.CombinedConfig"),
+    ):
+        MockScheduler.return_value.get_models.return_value = [
+            [_mock_course("CMSC101,Dr.Smith,Room101,None,MON 9:00-10:00")]
+        ]
+
+        job = ctrl.ScheduleGenerationJob(5, [])
+        job.pause()
+        assert job.paused
+        job.cancel()
+        messages = _run_job(job)
+
+    assert messages == [("cancelled", 0)]
+    assert job.schedules == []
+
+
+def test_generation_job_reports_errors():
+    """Errors raised by the scheduler should come back through the queue"""
+    with (
+        patch(
+            "Controller.main_controller.Scheduler", side_effect=ValueError("bad config")
+        ),
+        patch("Controller.main_controller.CombinedConfig"),
+    ):
+        job = ctrl.ScheduleGenerationJob(1, [])
+        messages = _run_job(job)
+
+    assert len(messages) == 1
+    kind, error = messages[0]
+    assert kind == "error"
+    assert "bad config" in str(error)
+
+
+def test_generation_job_cannot_start_twice():
+    with (
+        patch("Controller.main_controller.Scheduler"),
+        patch("Controller.main_controller.CombinedConfig"),
+    ):
+        job = ctrl.ScheduleGenerationJob(0, [])
+        job.start()
+        with pytest.raises(RuntimeError):
+            job.start()
+        job.join(5)
+
+
+def test_scheduleStream_fails_fast_on_infeasible_config():
+    """The feasibility check should stop generation before the solver starts"""
+    ctrl.DM.data["config"]["courses"] = [
+        {"course_id": "CMSC 140", "credits": 4, "room": ["R1"], "faculty": []}
+    ]
+    with (
+        patch("Controller.main_controller.Scheduler") as MockScheduler,
+        patch("Controller.main_controller.CombinedConfig"),
+        pytest.raises(ValueError, match="cannot produce any schedule"),
+    ):
+        ctrl._scheduleStream(1, [])
+
+    MockScheduler.assert_not_called()
+
+
+def test_controller_utils_read_typed_schedules():
+    """The drawing helpers give the same answers for typed and plain rows."""
+    from datetime import datetime
+
+    from Controller.controllerUtils import (
+        filterDurations,
+        getTimeRange,
+        parseMeeting,
+        sortSchedulesByTime,
+    )
+    from Models.Schedule import Schedule
+
+    ROWS = [
+        [
+            "CMSC 161.01",
+            "Hogg",
+            "Roddy 140",
+            "Linux",
+            "TUE 10:00-11:50^",
+            "THU 10:00-11:15",
+        ],
+        [
+            "CMSC 140.01",
+            "Zoppetti",
+            "Roddy 136",
+            "None",
+            "MON 09:00-09:50",
+            "WED 09:00-09:50",
+        ],
+    ]
+    typed = Schedule.fromRows(ROWS)
+    assert getTimeRange(typed) == getTimeRange(ROWS) == (9, 12)
+    assert sortSchedulesByTime(typed) == sortSchedulesByTime(ROWS)
+    assert sortSchedulesByTime(ROWS)[0] == ROWS[1]
+    assert parseMeeting("WED 14:00-15:50^") == (
+        "WED",
+        datetime.strptime("14:00", "%H:%M"),
+        datetime.strptime("15:50", "%H:%M"),
+    )
+    assert parseMeeting(None) == (None, None, None)
+    assert filterDurations(["TUE 10:00-11:50^", "THU 10:00-11:15"], 110) == [
+        "TUE 10:00-11:50"
+    ]
+
+
+def test_typed_layout_matches_text_layout():
+    """Grouped typed rows are laid out from their meetings, same result."""
+    from Controller.controllerUtils import orderedSchedules
+    from Controller.schedule_layout import scheduleLayout
+    from Models.Schedule import Schedule
+
+    rows = [
+        ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"],
+        ["CMSC 161.01", "Hogg", "Roddy 136", "Linux", "TUE 10:00-11:50^"],
+        ["CMSC 162.01", "Hogg", "Roddy 140", "None", "SAT 08:00-08:50"],
+    ]
+    for order in ("Rooms & Labs", "Faculty"):
+        typed = orderedSchedules(Schedule.fromRows(rows), order)[0]
+        text = orderedSchedules(rows, order)[0]
+        assert typed == text
+        for name, classes in typed.items():
+            assert all(hasattr(c, "meetings") for c in classes)
+            a = scheduleLayout([name, classes])
+            b = scheduleLayout([name, text[name]])
+            assert (a.startHour, a.endHour) == (b.startHour, b.endHour)
+            assert [
+                (x.day, x.start, x.end, x.classIndex, x.second, x.meeting)
+                for x in a.blocks
+            ] == [
+                (x.day, x.start, x.end, x.classIndex, x.second, x.meeting)
+                for x in b.blocks
+            ]
+
+
+def test_importScheduleSourceBTN_opens_archive(monkeypatch, tmp_path):
+    from Controller.schedule_archive import ArchiveWriter
+
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+    file_path = tmp_path / "sch.sched"
+    with ArchiveWriter(file_path) as writer:
+        writer.write(rows)
+
+    monkeypatch.setattr(
+        "Controller.main_controller.filedialog.askopenfilename",
+        Mock(return_value=str(file_path)),
+    )
+    pathVar = Mock()
+    result = ctrl.importScheduleSourceBTN(pathVar)
+    assert result[0] == rows
+    result.close()
+
+
+def test_exportSchedulesBTN_writes_archive(monkeypatch, tmp_path):
+    from Controller.schedule_archive import ScheduleArchive
+
+    fake_save = tmp_path / "all.sched"
+    monkeypatch.setattr(
+        "Controller.main_controller.filedialog.asksaveasfilename",
+        Mock(return_value=str(fake_save)),
+    )
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+    ctrl.exportSchedulesBTN([rows, rows], Mock())
+
+    with ScheduleArchive(fake_save) as archive:
+        assert [archive.rows(k) for k in range(len(archive))] == [rows, rows]
+
+
+def test_exportSchedulesBTN_writes_sqlite(monkeypatch, tmp_path):
+    from Controller.schedule_db import ScheduleDatabase
+
+    fake_save = tmp_path / "all.db"
+    monkeypatch.setattr(
+        "Controller.main_controller.filedialog.asksaveasfilename",
+        Mock(return_value=str(fake_save)),
+    )
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+    pathVar = Mock()
+    ctrl.exportSchedulesBTN([rows, rows], pathVar)
+
+    with ScheduleDatabase(fake_save) as db:
+        assert db.toRows() == [rows, rows]
+        assert db.schedulesWhere(room="Roddy 136", startsBefore="10:00") == [0, 1]
+    assert "saved to" in pathVar.set.call_args[0][0]
+
+
+def test_importScheduleSourceBTN_indexes_file(monkeypatch, tmp_path):
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+    file_path = tmp_path / "sch.json"
+    file_path.write_text(json.dumps([rows, rows]))
+    monkeypatch.setattr(
+        "Controller.main_controller.filedialog.askopenfilename",
+        Mock(return_value=str(file_path)),
+    )
+
+    pathVar = Mock()
+    source = ctrl.importScheduleSourceBTN(pathVar)
+    assert len(source) == 2
+    assert source[1] == rows
+    assert pathVar.set.call_args[0][0] == str(file_path)
+    source.close()
+
+
+def test_importScheduleSourceBTN_rejects_empty_list(monkeypatch, tmp_path):
+    file_path = tmp_path / "sch.json"
+    file_path.write_text("[]")
+    monkeypatch.setattr(
+        "Controller.main_controller.filedialog.askopenfilename",
+        Mock(return_value=str(file_path)),
+    )
+
+    pathVar = Mock()
+    assert ctrl.importScheduleSourceBTN(pathVar) is None
+    assert "no schedules" in pathVar.set.call_args[0][0]
+
+
+def test_exportSchedulesPDF_reports_progress(monkeypatch, tmp_path):
+    import Controller.controllerUtils as utils
+
+    written = []
+    monkeypatch.setattr(
+        utils, "exportMultiPagePDF", lambda sch, out, name: written.append(name)
+    )
+    progress = Mock()
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+
+    assert utils.exportSchedulesPDF([rows, rows], str(tmp_path), 1, progress) == 2
+    assert written == ["Schedule_1.pdf", "Schedule_2.pdf"]
+    assert progress.call_args_list[-1][0] == (2, 2)
+
+
+def test_exportSchedulesBTN_writes_pdfs_off_the_tk_thread(monkeypatch, tmp_path):
+    import threading
+
+    import Controller.controllerUtils as utils
+
+    fake_save = tmp_path / "all.pdf"
+    monkeypatch.setattr(
+        "Controller.main_controller.filedialog.asksaveasfilename",
+        Mock(return_value=str(fake_save)),
+    )
+    release = threading.Event()
+    threads = []
+
+    def fakeExport(schedules, output_dir, workers=None, progress=None):
+        threads.append(threading.current_thread())
+        progress(1, 2)
+        release.wait(5)
+        progress(2, 2)
+        return 2
+
+    monkeypatch.setattr(utils, "exportSchedulesPDF", fakeExport)
+
+    class FakeWidget:
+        def __init__(self):
+            self.callbacks = []
+
+        def after(self, ms, callback):
+            self.callbacks.append(callback)
+
+        def run(self):
+            callback = self.callbacks.pop(0)
+            callback()
+
+    widget = FakeWidget()
+    pathVar = Mock()
+    job = ctrl.exportSchedulesBTN([[], []], pathVar, widget=widget)
+
+    # returned while the export is still running, progress shows up in after()
+    while not pathVar.set.called:
+        widget.run()
+    assert threads == [job._thread]
+    assert pathVar.set.call_args[0][0] == "Exporting PDFs: 1/2"
+    assert widget.callbacks
+
+    release.set()
+    job.join(5)
+    widget.run()
+    assert pathVar.set.call_args[0][0] == f"Schedules have been saved to: {fake_save}"
+    assert not widget.callbacks
+
+
+def test_exportSchedulesPDF_uses_pool(monkeypatch, tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    import Controller.controllerUtils as utils
+
+    pools = []
+
+    def fakePool(max_workers, mp_context):
+        pools.append(max_workers)
+        return ThreadPoolExecutor(max_workers)
+
+    written = []
+    monkeypatch.setattr(utils, "ProcessPoolExecutor", fakePool)
+    monkeypatch.setattr(
+        utils, "exportMultiPagePDF", lambda sch, out, name: written.append(name)
+    )
+    progress = Mock()
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+
+    utils.exportSchedulesPDF([rows] * 5, str(tmp_path), 3, progress)
+    assert pools == [3]
+    assert sorted(written) == [f"Schedule_{i}.pdf" for i in range(1, 6)]
+    assert [c[0] for c in progress.call_args_list] == [(i, 5) for i in range(1, 6)]
+
+
+def test_exportMultiScheduleHTML_streams_every_page(tmp_path):
+    import io
+
+    from Controller.controllerUtils import (
+        drawScheduleSVG,
+        exportMultiScheduleHTML,
+        writeScheduleSVG,
+    )
+
+    rows = [
+        ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"],
+        ["CMSC 161.01", "Hogg", "Roddy 140", "None", "TUE 10:00-11:15"],
+    ]
+    out = io.StringIO()
+    writeScheduleSVG(out, ["Roddy 136", rows[:1]])
+    assert out.getvalue() == drawScheduleSVG(["Roddy 136", rows[:1]])
+    assert out.getvalue().startswith("<h2>Roddy 136</h2><svg")
+
+    path = tmp_path / "all.html"
+    exportMultiScheduleHTML([rows, rows[:1]], str(path))
+    html = path.read_text()
+    assert 'id="p1"' in html and 'id="p2"' in html
+    assert "let maxPages = 2;" in html
+    # rooms then faculty for the first schedule, four SVGs
+    first_page = html.split('id="p1"')[1].split('id="p2"')[0]
+    assert first_page.count("<svg") == 4
+    assert first_page.count('<div class="seperator"></div>') == 3
+
+
+def test_drawSchedulePagePDF_reuses_grid_form(monkeypatch):
+    import Controller.controllerUtils as utils
+
+    monkeypatch.setattr(utils, "letter", (612, 792))
+    forms = set()
+    can = Mock()
+    can.stringWidth.return_value = 50
+    can.hasForm.side_effect = lambda name: name in forms
+    can.beginForm.side_effect = forms.add
+
+    morning = [["CMSC 140.01", "Zoppetti", "MON 09:00-09:50"]]
+    late = [["CMSC 161.01", "Hogg", "TUE 13:00-14:50"]]
+    utils.drawSchedulePagePDF(can, ["Roddy 136", morning])
+    utils.drawSchedulePagePDF(can, ["Roddy 140", morning])
+    utils.drawSchedulePagePDF(can, ["Roddy 147", late])
+
+    assert [c[0][0] for c in can.beginForm.call_args_list] == [
+        "ScheduleGrid_9_10",
+        "ScheduleGrid_13_15",
+    ]
+    assert can.doForm.call_count == 3
+    assert can.endForm.call_count == 2
+    # only the class blocks are drawn on each page
+    assert can.rect.call_count == 3
+
+
+def test_exportSchedulesPDF_skips_unchanged_files(monkeypatch, tmp_path):
+    import Controller.controllerUtils as utils
+
+    written = []
+
+    def fakeExport(sch, out, name):
+        written.append(name)
+        (tmp_path / name).write_text("pdf")
+
+    monkeypatch.setattr(utils, "exportMultiPagePDF", fakeExport)
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+    other = [["CMSC 161.01", "Hogg", "Roddy 140", "None", "TUE 10:00-10:50"]]
+
+    utils.exportSchedulesPDF([rows, rows], str(tmp_path), 1)
+    assert written == ["Schedule_1.pdf", "Schedule_2.pdf"]
+
+    written.clear()
+    progress = Mock()
+    utils.exportSchedulesPDF([rows, other], str(tmp_path), 1, progress)
+    assert written == ["Schedule_2.pdf"]
+    assert [c[0] for c in progress.call_args_list] == [(1, 2), (2, 2)]
+
+    written.clear()
+    utils.exportSchedulesPDF([rows, other], str(tmp_path), 1, force=True)
+    assert written == ["Schedule_1.pdf", "Schedule_2.pdf"]
+
+
+def test_exportSchedulesPDF_removes_files_past_the_last_schedule(monkeypatch, tmp_path):
+    import Controller.controllerUtils as utils
+    from Controller.export_manifest import ExportManifest
+
+    def fakeExport(sch, out, name):
+        (tmp_path / name).write_text("pdf")
+
+    monkeypatch.setattr(utils, "exportMultiPagePDF", fakeExport)
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+    (tmp_path / "Schedule_notes.pdf").write_text("keep")
+    # not written by an export, so not ours to delete
+    (tmp_path / "Schedule_9.pdf").write_text("keep")
+
+    utils.exportSchedulesPDF([rows, rows, rows], str(tmp_path), 1)
+    utils.exportSchedulesPDF([rows], str(tmp_path), 1)
+
+    assert sorted(p.name for p in tmp_path.glob("*.pdf")) == [
+        "Schedule_1.pdf",
+        "Schedule_9.pdf",
+        "Schedule_notes.pdf",
+    ]
+    assert list(ExportManifest(tmp_path).hashes) == ["Schedule_1.pdf"]
+
+
+def test_exportOneScheduleHTML_skips_unchanged_room(tmp_path):
+    from Controller.controllerUtils import exportOneScheduleHTML
+
+    classes = [["CMSC 140.01", "Zoppetti", "MON 09:00-09:50"]]
+    exportOneScheduleHTML(["Roddy 136", classes], str(tmp_path))
+    page = tmp_path / "Roddy 136_schedule.html"
+    page.write_text("edited")
+
+    exportOneScheduleHTML(["Roddy 136", classes], str(tmp_path))
+    assert page.read_text() == "edited"
+
+    classes.append(["CMSC 161.01", "Hogg", "TUE 10:00-10:50"])
+    exportOneScheduleHTML(["Roddy 136", classes], str(tmp_path))
+    assert "CMSC 161.01" in page.read_text()
+
+
+# --- Batched edits ---
+
+
+def _realDM(monkeypatch):
+    from Models.Data_manager import DataManager
+
+    dm = DataManager()
+    dm.data = {
+        "config": {
+            "rooms": ["Roddy 101"],
+            "labs": [],
+            "faculty": [{"name": "Zoppetti"}],
+            "courses": [],
+        }
+    }
+    monkeypatch.setattr(ctrl, "DM", dm)
+    return dm
+
+
+def test_importCourses_adds_all_or_nothing(monkeypatch):
+    dm = _realDM(monkeypatch)
+    calls = []
+    dm.addListener(calls.append)
+    c = ctrl.CourseController()
+
+    error = c.importCourses(
+        [
+            {"course_id": "CMSC 140", "credits": 4, "room": ["Roddy 101"]},
+            {"course_id": "CMSC 140", "credits": 3},
+        ]
+    )
+    assert "Duplicate course ID" in error
+    assert dm.getCourses() == []
+    assert calls == []
+
+    refresh = Mock()
+    courses = [{"course_id": f"CMSC {n}", "credits": 3} for n in range(140, 145)]
+    assert c.importCourses(courses, refresh) is None
+    assert len(dm.getCourses()) == 5
+    # one notification for the whole import
+    assert len(calls) == 1
+    refresh.assert_called_once_with("ConfigPage")
+
+
+def test_coursesImportBTN_reads_courses_of_a_config(monkeypatch, tmp_path):
+    dm = _realDM(monkeypatch)
+    path = tmp_path / "other.json"
+    path.write_text(
+        json.dumps({"config": {"courses": [{"course_id": "CMSC 140", "credits": 4}]}})
+    )
+    monkeypatch.setattr(ctrl.filedialog, "askopenfilename", lambda **kwargs: str(path))
+    assert ctrl.coursesImportBTN() is None
+    assert [c["course_id"] for c in dm.getCourses()] == ["CMSC 140"]
+
+    path.write_text("{not json")
+    assert "Could not read" in ctrl.coursesImportBTN()
+
+    for bad in ({"config": []}, {"config": {"courses": "CMSC 140"}}, [1, 2], 7):
+        path.write_text(json.dumps(bad))
+        assert "does not hold a list of courses" in ctrl.coursesImportBTN()
+    assert [c["course_id"] for c in dm.getCourses()] == ["CMSC 140"]
+
+
+def test_editFaculty_keeps_old_entry_when_new_one_is_rejected(monkeypatch):
+    dm = _realDM(monkeypatch)
+    c = ctrl.FacultyController()
+    with pytest.raises(ValueError, match="valid 'name'"):
+        c.editFaculty({"name": ""}, "Zoppetti")
+    assert dm.getFaculty() == [{"name": "Zoppetti"}]
+
+
+def test_generation_job_applies_settings_on_the_calling_thread(monkeypatch):
+    import threading
+
+    dm = _realDM(monkeypatch)
+    threads = []
+    dm.addListener(lambda changes: threads.append(threading.current_thread()))
+    with (
+        patch("Controller.main_controller.Scheduler") as MockScheduler,
+        patch("Controller.main_controller.CombinedConfig"),
+    ):
+        MockScheduler.return_value.get_models.return_value = []
+        messages = _run_job(ctrl.ScheduleGenerationJob(2, ["pack_rooms"]))
+
+    assert messages == [("done", 0)]
+    # updateLimit and updateOptimizerFlags, once each, before the worker
+    assert threads == [threading.current_thread()] * 2
+    assert dm.data["limit"] == 2
+
+
+def test_imported_config_edits_survive_a_crash(monkeypatch, tmp_path):
+    from Models.Data_manager import DataManager
+
+    assert APP_DM.journaling
+    dm = DataManager(journal=APP_DM.journaling)
+    monkeypatch.setattr(ctrl, "DM", dm)
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps(
+            {
+                "config": {
+                    "rooms": ["Roddy 101"],
+                    "labs": [],
+                    "courses": [],
+                    "faculty": [],
+                }
+            }
+        )
+    )
+    monkeypatch.setattr(ctrl.filedialog, "askopenfilename", lambda **kwargs: str(path))
+
+    ctrl.configImportBTN(Mock())
+    ctrl.RoomsController().addRoom("Roddy 102")
+
+    # the app dies without saving, loading the config brings the edit back
+    assert "Roddy 102" not in path.read_text()
+    assert DataManager(str(path), journal=True).getRooms() == [
+        "Roddy 101",
+        "Roddy 102",
+    ]
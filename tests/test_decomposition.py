@@ -0,0 +1,198 @@
+# File Name: test_decomposition.py
+#
+# Tests for splitting a config into independent course groups.
+import itertools
+from unittest.mock import patch
+
+import Controller.decomposition as decomposition
+from Controller.decomposition import (
+    _layer,
+    decomposedGroups,
+    findComponents,
+    iterDecomposedSchedules,
+    mergeComponents,
+    subConfig,
+)
+
+
+def _course(course_id, room, lab=(), faculty=(), conflicts=()):
+    return {
+        "course_id": course_id,
+        "credits": 3,
+        "room": list(room),
+        "lab": list(lab),
+        "conflicts": list(conflicts),
+        "faculty": list(faculty),
+    }
+
+
+def _config():
+    # lecture courses in Roddy, a lab cluster in Caputo that shares nothing
+    return {
+        "config": {
+            "rooms": ["Roddy 136", "Roddy 140", "Caputo 101"],
+            "labs": ["Linux", "Mac"],
+            "courses": [
+                _course("CMSC 140", ["Roddy 136"]),
+                _course("CMSC 161", ["Caputo 101"], lab=["Linux"]),
+                _course("CMSC 140", ["Roddy 140"]),
+                _course("CMSC 162", ["Caputo 101"], lab=["Mac"], faculty=["Hogg"]),
+            ],
+            "faculty": [
+                {
+                    "name": "Zoppetti",
+                    "maximum_credits": 12,
+                    "course_preferences": {"CMSC 140": 5},
+                    "room_preferences": {"Roddy 136": 5, "Caputo 101": 1},
+                    "lab_preferences": {"Linux": 2},
+                },
+                {
+                    "name": "Hogg",
+                    "maximum_credits": 12,
+                    "course_preferences": {"CMSC 161": 5},
+                    "room_preferences": {"Caputo 101": 5},
+                    "lab_preferences": {"Mac": 5},
+                },
+            ],
+        },
+        "limit": 10,
+    }
+
+
+def test_find_components_splits_unrelated_courses():
+    assert findComponents(_config()) == [[0, 2], [1, 3]]
+
+
+def test_shared_room_joins_components():
+    data = _config()
+    data["config"]["courses"][0]["room"].append("Caputo 101")
+    assert findComponents(data) == [[0, 1, 2, 3]]
+
+
+def test_conflict_joins_components():
+    data = _config()
+    data["config"]["courses"][3]["conflicts"] = ["CMSC 140"]
+    assert findComponents(data) == [[0, 1, 2, 3]]
+
+
+def test_preference_joins_components_even_with_explicit_faculty():
+    data = _config()
+    data["config"]["faculty"][0]["course_preferences"]["CMSC 162"] = 1
+    assert findComponents(data) == [[0, 1, 2, 3]]
+
+
+def test_sub_config_prunes_other_groups():
+    data = _config()
+    sub = subConfig(data, [1, 3])["config"]
+
+    assert [c["course_id"] for c in sub["courses"]] == ["CMSC 161", "CMSC 162"]
+    assert sub["rooms"] == ["Caputo 101"]
+    assert sub["labs"] == ["Linux", "Mac"]
+    assert [f["name"] for f in sub["faculty"]] == ["Hogg"]
+    assert sub["faculty"][0]["course_preferences"] == {"CMSC 161": 5}
+    # the input is left alone
+    assert data == _config()
+
+
+def test_sub_config_prunes_preferences_for_other_rooms():
+    sub = subConfig(_config(), [0, 2])["config"]
+    zoppetti = sub["faculty"][0]
+    assert zoppetti["room_preferences"] == {"Roddy 136": 5}
+    assert zoppetti["lab_preferences"] == {}
+
+
+def test_merge_components_caps_groups():
+    comps = [[0], [1, 2, 3], [4], [5, 6]]
+    assert mergeComponents(comps, 4) == comps
+    merged = mergeComponents(comps, 2)
+    assert len(merged) == 2
+    assert sorted(i for g in merged for i in g) == list(range(7))
+
+
+def test_layers_cover_product_once():
+    lengths = [3, 1, 2]
+    combos = [c for m in range(3) for c in _layer(lengths, m)]
+    assert sorted(combos) == sorted(itertools.product(range(3), range(1), range(2)))
+    assert len(combos) == len(set(combos))
+
+
+class _FakeWorkers:
+    # stands in for EnumerationWorkers, every part yields its schedules in turn
+    def __init__(self, parts, limit):
+        self.parts = parts
+        self.stopped = False
+
+    def __iter__(self):
+        for part, sub in enumerate(self.parts):
+            courses = sub["config"]["courses"]
+            for n in range(2):
+                yield (
+                    "schedule",
+                    part,
+                    [[c["course_id"], f"option {n}"] for c in courses],
+                )
+            yield "done", part, None
+
+    def stop(self):
+        self.stopped = True
+
+
+def test_decomposed_stream_combines_groups_in_course_order():
+    with patch.object(decomposition, "EnumerationWorkers", _FakeWorkers):
+        schedules = list(iterDecomposedSchedules(_config(), 10, [[0, 2], [1, 3]]))
+
+    assert len(schedules) == 4
+    assert schedules[0] == [
+        ["CMSC 140", "option 0"],
+        ["CMSC 161", "option 0"],
+        ["CMSC 140", "option 0"],
+        ["CMSC 162", "option 0"],
+    ]
+    assert len({str(s) for s in schedules}) == 4
+
+
+def test_decomposed_stream_respects_limit():
+    with patch.object(decomposition, "EnumerationWorkers", _FakeWorkers):
+        schedules = list(iterDecomposedSchedules(_config(), 3, [[0, 2], [1, 3]]))
+    assert len(schedules) == 3
+
+
+def test_generate_uses_decomposition_for_independent_groups():
+    import Controller.main_controller as ctrl
+
+    rows = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+    with (
+        patch.object(ctrl, "DM") as dm,
+        patch.object(ctrl, "checkFeasibility", return_value=[]),
+    ):
+        dm.data = _config()
+        with patch.object(
+            ctrl, "iterDecomposedSchedules", return_value=(r for r in [rows])
+        ) as decomposed:
+            result = list(ctrl._scheduleStream(1, [], workers=2))
+
+    decomposed.assert_called_once_with(dm.data, 1, [[0, 2], [1, 3]])
+    assert result == [rows]
+
+
+def test_one_worker_means_no_decomposition():
+    import Controller.main_controller as ctrl
+
+    assert decomposedGroups(_config(), 1) == [[0, 1, 2, 3]]
+    assert decomposedGroups(_config(), 2) == [[0, 2], [1, 3]]
+    assert decomposedGroups(_config()) == [[0, 2], [1, 3]]
+
+    with (
+        patch.object(ctrl, "DM") as dm,
+        patch.object(ctrl, "checkFeasibility", return_value=[]),
+        patch.object(ctrl, "_prepareScheduler") as prepare,
+        patch.object(ctrl, "iterDecomposedSchedules") as decomposed,
+        patch.object(ctrl, "iterParallelSchedules") as parallel,
+    ):
+        dm.data = _config()
+        dm.filePath = None
+        prepare.return_value.get_models.return_value = []
+        assert list(ctrl._scheduleStream(1, [], workers=1)) == []
+
+    decomposed.assert_not_called()
+    parallel.assert_not_called()
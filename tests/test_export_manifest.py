@@ -0,0 +1,75 @@
+# File Name: test_export_manifest.py
+#
+# Tests for the content hash manifest used by incremental exports.
+from Controller.export_manifest import MANIFEST_NAME, ExportManifest, contentHash
+
+ROWS = [["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+
+
+def test_hash_depends_on_kind_and_content():
+    assert contentHash("pdf", ROWS) == contentHash("pdf", [list(r) for r in ROWS])
+    assert contentHash("pdf", ROWS) != contentHash("html", ROWS)
+    assert contentHash("pdf", ROWS) != contentHash("pdf", ROWS + ROWS)
+
+
+def test_manifest_round_trips_and_checks_the_file(tmp_path):
+    digest = contentHash("pdf", ROWS)
+    manifest = ExportManifest(tmp_path)
+    assert not manifest.isCurrent("a.pdf", digest)
+    manifest.record("a.pdf", digest)
+    manifest.save()
+
+    reloaded = ExportManifest(tmp_path)
+    # recorded, but the file itself is missing
+    assert not reloaded.isCurrent("a.pdf", digest)
+    (tmp_path / "a.pdf").write_text("pdf")
+    assert reloaded.isCurrent("a.pdf", digest)
+    assert not reloaded.isCurrent("a.pdf", contentHash("pdf", []))
+
+
+def test_broken_manifest_is_ignored(tmp_path):
+    (tmp_path / MANIFEST_NAME).write_text("{not json")
+    assert ExportManifest(tmp_path).hashes == {}
+
+
+def test_saves_from_two_exports_are_merged(tmp_path):
+    first = ExportManifest(tmp_path)
+    second = ExportManifest(tmp_path)
+    first.record("a.pdf", contentHash("pdf", ROWS))
+    second.record("b.pdf", contentHash("pdf", []))
+    first.save()
+    second.save()
+
+    assert set(ExportManifest(tmp_path).hashes) == {"a.pdf", "b.pdf"}
+
+
+def test_forgotten_entries_are_dropped_on_save(tmp_path):
+    manifest = ExportManifest(tmp_path)
+    manifest.record("a.pdf", contentHash("pdf", ROWS))
+    manifest.record("b.pdf", contentHash("pdf", []))
+    manifest.save()
+
+    again = ExportManifest(tmp_path)
+    again.forget("b.pdf")
+    again.forget("missing.pdf")
+    again.save()
+    assert set(ExportManifest(tmp_path).hashes) == {"a.pdf"}
+
+
+def test_concurrent_saves_keep_every_entry(tmp_path):
+    import threading
+
+    def export(n):
+        for i in range(20):
+            manifest = ExportManifest(tmp_path)
+            manifest.record(f"{n}_{i}.pdf", contentHash("pdf", [n, i]))
+            manifest.save()
+
+    threads = [threading.Thread(target=export, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(ExportManifest(tmp_path).hashes) == 80
+    assert [p.name for p in tmp_path.iterdir()] == [MANIFEST_NAME]
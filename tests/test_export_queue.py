@@ -0,0 +1,70 @@
+# File Name: test_export_queue.py
+#
+# Tests for the background export queue used by the per-room export buttons.
+import threading
+
+from Controller.export_queue import ExportQueue
+
+
+def _drain(exportQueue):
+    exportQueue.close()
+    exportQueue.join(5)
+    return exportQueue.poll()
+
+
+def test_jobs_run_in_order_off_the_calling_thread():
+    exportQueue = ExportQueue()
+    ran = []
+    caller = threading.get_ident()
+    release = threading.Event()
+
+    # both are queued before the first one runs
+    exportQueue.submit("wait", release.wait, 5)
+    for name in ("a", "b"):
+        exportQueue.submit(name, lambda n: ran.append((n, threading.get_ident())), name)
+    release.set()
+
+    messages = _drain(exportQueue)
+    assert [n for n, _ in ran] == ["a", "b"]
+    assert all(thread != caller for _, thread in ran)
+    assert [m for m in messages if m[0] == "done"] == [
+        ("done", "wait", 2),
+        ("done", "a", 1),
+        ("done", "b", 0),
+    ]
+    assert exportQueue.pending() == 0
+
+
+def test_waiting_duplicates_are_coalesced():
+    exportQueue = ExportQueue()
+    release = threading.Event()
+    ran = []
+
+    exportQueue.submit("busy", release.wait, label="busy")
+    assert exportQueue.submit("room", ran.append, "old", label="Roddy 136 PDF")
+    assert not exportQueue.submit("room", ran.append, "new", label="Roddy 136 PDF")
+    assert exportQueue.pending() == 2
+    release.set()
+
+    messages = _drain(exportQueue)
+    # only one export, with the newest arguments
+    assert ran == ["new"]
+    assert ("coalesced", "Roddy 136 PDF", 2) in messages
+
+
+def test_errors_are_reported_and_the_queue_keeps_going():
+    exportQueue = ExportQueue()
+    ran = []
+
+    def fail():
+        raise OSError("disk full")
+
+    exportQueue.submit("bad", fail, label="bad")
+    exportQueue.submit("good", ran.append, 1, label="good")
+
+    messages = _drain(exportQueue)
+    errors = [m for m in messages if m[0] == "error"]
+    assert len(errors) == 1
+    assert errors[0][1][0] == "bad"
+    assert isinstance(errors[0][1][1], OSError)
+    assert ran == [1]
@@ -0,0 +1,153 @@
+# File Name: test_feasibility.py
+#
+# Tests for the pre-solve feasibility checks.
+import json
+
+import pytest
+
+from Controller.feasibility import checkFeasibility, feasibilityReport
+
+
+@pytest.fixture
+def data():
+    return {
+        "config": {
+            "rooms": ["Roddy 136"],
+            "labs": ["Linux"],
+            "courses": [
+                {
+                    "course_id": "CMSC 140",
+                    "credits": 3,
+                    "room": ["Roddy 136"],
+                    "lab": [],
+                    "conflicts": [],
+                    "faculty": ["Zoppetti"],
+                },
+                {
+                    "course_id": "CMSC 161",
+                    "credits": 4,
+                    "room": ["Roddy 136"],
+                    "lab": ["Linux"],
+                    "conflicts": [],
+                    "faculty": [],
+                },
+            ],
+            "faculty": [
+                {
+                    "name": "Zoppetti",
+                    "minimum_credits": 0,
+                    "maximum_credits": 12,
+                    "course_preferences": {"CMSC 161": 5},
+                }
+            ],
+        },
+        "time_slot_config": {
+            "times": {
+                day: [{"start": "08:00", "spacing": 60, "end": "12:00"}]
+                for day in ("MON", "TUE", "WED", "THU", "FRI")
+            },
+            "classes": [
+                {
+                    "credits": 3,
+                    "meetings": [
+                        {"day": "MON", "duration": 50},
+                        {"day": "WED", "duration": 50},
+                        {"day": "FRI", "duration": 50},
+                    ],
+                },
+                {
+                    "credits": 4,
+                    "meetings": [
+                        {"day": "TUE", "duration": 110, "lab": True},
+                        {"day": "THU", "duration": 110},
+                    ],
+                },
+            ],
+        },
+    }
+
+
+def test_feasible_config_has_no_issues(data):
+    assert checkFeasibility(data) == []
+
+
+def test_empty_config_is_fine():
+    assert checkFeasibility({"config": {"courses": []}}) == []
+    assert checkFeasibility(None) == []
+
+
+def test_shipped_configs_pass():
+    for path in ("output/mainConfig.json", "template/ConfigTemplate.json"):
+        with open(path) as f:
+            assert checkFeasibility(json.load(f)) == []
+
+
+def test_not_enough_faculty_credits(data):
+    data["config"]["faculty"][0]["maximum_credits"] = 5
+    issues = checkFeasibility(data)
+    assert any("need 7 credits" in i and "only add up to 5" in i for i in issues)
+
+
+def test_faculty_minimum_cannot_be_reached(data):
+    data["config"]["courses"][1]["faculty"] = ["Ghost"]
+    data["config"]["faculty"][0]["minimum_credits"] = 6
+    issues = checkFeasibility(data)
+    assert any("CMSC 161" in i and "none of them exist" in i for i in issues)
+    assert any("'Zoppetti' needs at least 6" in i for i in issues)
+
+
+def test_faculty_without_candidate_courses_has_no_minimum(data):
+    # the solver does not hold faculty who cannot teach anything to a minimum
+    data["config"]["faculty"].append(
+        {"name": "Extra", "minimum_credits": 6, "maximum_credits": 12}
+    )
+    data["config"]["faculty"][0]["minimum_credits"] = 3
+    assert checkFeasibility(data) == []
+
+    # only Zoppetti's minimum counts against the 7 course credits
+    data["config"]["faculty"][0]["minimum_credits"] = 8
+    issues = checkFeasibility(data)
+    assert any("add up to 8" in i for i in issues)
+    assert not any("Extra" in i for i in issues)
+
+
+def test_course_without_any_faculty(data):
+    data["config"]["faculty"][0]["course_preferences"] = {}
+    issues = checkFeasibility(data)
+    assert issues == [
+        "CMSC 161 (course #2) has no faculty list and no faculty has it in course_preferences."
+    ]
+
+
+def test_course_without_rooms(data):
+    data["config"]["courses"][0]["room"] = []
+    assert "CMSC 140 (course #1) has no rooms to be scheduled in." in checkFeasibility(
+        data
+    )
+
+
+def test_pattern_that_does_not_fit_any_block(data):
+    # 110 minute meetings can't fit after an 11:00 fixed start in an 08-12 block
+    data["time_slot_config"]["classes"][1]["start_time"] = "11:00"
+    issues = checkFeasibility(data)
+    assert any("4-credit courses: CMSC 161" in i for i in issues)
+
+
+def test_disabled_pattern_does_not_count(data):
+    data["time_slot_config"]["classes"][0]["disabled"] = True
+    issues = checkFeasibility(data)
+    assert any("3-credit courses: CMSC 140" in i for i in issues)
+
+
+def test_room_capacity_per_day(data):
+    # four sections that must all meet 110 minutes on TUE in one 240 minute room
+    section = data["config"]["courses"][1]
+    data["config"]["courses"] = [dict(section) for _ in range(4)]
+    data["config"]["faculty"][0]["maximum_credits"] = 16
+    issues = checkFeasibility(data)
+    assert any("440 room-minutes on TUE" in i and "have 240" in i for i in issues)
+
+
+def test_report_lists_every_issue():
+    report = feasibilityReport(["first", "second"])
+    assert report.splitlines()[1:] == ["  - first", "  - second"]
@@ -0,0 +1,119 @@
+# File Name: test_parallel_generation.py
+#
+# Tests for splitting a scheduler run across worker processes.
+import itertools
+from unittest.mock import patch
+
+from Controller.parallel_generation import splitSearchSpace
+
+
+def _config():
+    return {
+        "config": {
+            "rooms": ["R1", "R2", "R3", "R4"],
+            "labs": ["Linux", "Mac"],
+            "courses": [
+                {
+                    "course_id": "CMSC 140",
+                    "credits": 3,
+                    "room": ["R1", "R2", "R3", "R4"],
+                    "lab": [],
+                    "conflicts": [],
+                    "faculty": [],
+                },
+                {
+                    "course_id": "CMSC 161",
+                    "credits": 4,
+                    "room": ["R1"],
+                    "lab": ["Linux", "Mac"],
+                    "conflicts": [],
+                    "faculty": ["Zoppetti"],
+                },
+            ],
+            "faculty": [
+                {
+                    "name": "Zoppetti",
+                    "maximum_credits": 12,
+                    "course_preferences": {"CMSC 140": 5, "CMSC 161": 5},
+                },
+                {
+                    "name": "Hogg",
+                    "maximum_credits": 12,
+                    "course_preferences": {"CMSC 140": 3},
+                },
+            ],
+        },
+        "time_slot_config": {
+            "times": {
+                day: [{"start": "08:00", "spacing": 60, "end": "17:00"}]
+                for day in ("MON", "TUE", "WED", "THU", "FRI")
+            },
+            "classes": [
+                {"credits": 3, "meetings": [{"day": "MON", "duration": 150}]},
+                {"credits": 4, "meetings": [{"day": "TUE", "duration": 200}]},
+            ],
+        },
+        "limit": 10,
+    }
+
+
+def _choices(part):
+    # every assignment of pinned fields this partition still allows
+    c140, c161 = part["config"]["courses"]
+    faculty_140 = c140["faculty"] or ["Zoppetti", "Hogg"]
+    return set(itertools.product(c140["room"], faculty_140, c161["lab"]))
+
+
+def test_single_worker_keeps_config():
+    data = _config()
+    assert splitSearchSpace(data, 1) == [data]
+
+
+def test_split_is_disjoint_and_covers_everything():
+    data = _config()
+    for workers in (2, 3, 4, 8, 16):
+        parts = splitSearchSpace(data, workers)
+        assert 1 < len(parts) <= workers
+
+        seen = set()
+        for part in parts:
+            choices = _choices(part)
+            assert not (choices & seen)
+            seen |= choices
+        assert seen == _choices(data)
+
+
+def test_split_does_not_mutate_input():
+    data = _config()
+    splitSearchSpace(data, 8)
+    assert data == _config()
+
+
+def test_split_pins_largest_branch_first():
+    parts = splitSearchSpace(_config(), 2)
+    rooms = [p["config"]["courses"][0]["room"] for p in parts]
+    assert rooms == [["R1", "R3"], ["R2", "R4"]]
+
+
+def test_split_without_branches_runs_one_part():
+    data = _config()
+    for course in data["config"]["courses"]:
+        course["room"] = ["R1"]
+        course["lab"] = []
+        course["faculty"] = ["Zoppetti"]
+    assert len(splitSearchSpace(data, 4)) == 1
+
+
+def test_generate_with_workers_uses_parallel_stream():
+    import Controller.main_controller as ctrl
+
+    rows = [["CMSC 140.01", "Zoppetti", "R1", "None", "MON 09:00-09:50"]]
+    with patch.object(ctrl, "DM") as dm:
+        dm.data = _config()
+        with patch.object(
+            ctrl, "iterParallelSchedules", return_value=(r for r in [rows, rows])
+        ) as parallel:
+            result = list(ctrl._scheduleStream(2, [], workers=4))
+
+    parallel.assert_called_once_with(dm.data, 2, 4)
+    assert result == [rows, rows]
@@ -0,0 +1,68 @@
+# File Name: test_pdf_export.py
+#
+# Tests for the PDF export with the real reportlab, skipped when it is not
+# installed. test_controller.py puts a mock reportlab in sys.modules, so the
+# exports run in a fresh interpreter.
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCHEDULES = [
+    [
+        ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"],
+        ["CMSC 161.01", "Hogg", "Roddy 140", "Linux", "TUE 10:00-11:50^"],
+        ["CMSC 162.01", "Hogg", "Roddy 136", "None", "WED 13:00-14:15"],
+    ],
+    [
+        ["CMSC 140.01", "Zoppetti", "Roddy 140", "None", "THU 09:00-09:50"],
+        ["CMSC 161.01", "Hogg", "Roddy 136", "Linux", "FRI 08:00-09:50^"],
+    ],
+]
+
+EXPORT = """
+import json, sys
+from Controller.controllerUtils import exportSchedulesPDF
+schedules = json.loads(sys.argv[1])
+exportSchedulesPDF(schedules, sys.argv[2], workers=int(sys.argv[3]), force=True)
+"""
+
+
+def _python(*args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, *sys.path]))
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+
+
+@pytest.fixture(scope="module")
+def reportlab():
+    if _python("-c", "import reportlab").returncode != 0:
+        pytest.skip("reportlab is not installed")
+
+
+def _export(output_dir, workers):
+    result = _python("-c", EXPORT, json.dumps(SCHEDULES), str(output_dir), workers)
+    assert result.returncode == 0, result.stderr
+    return {
+        name: (output_dir / name).read_bytes()
+        for name in sorted(os.listdir(output_dir))
+        if name.endswith(".pdf")
+    }
+
+
+def test_pdfs_are_byte_identical_across_runs(reportlab, tmp_path):
+    first = _export(tmp_path / "first", "1")
+    again = _export(tmp_path / "again", "1")
+    pooled = _export(tmp_path / "pooled", "2")
+
+    assert sorted(first) == ["Schedule_1.pdf", "Schedule_2.pdf"]
+    assert all(data.startswith(b"%PDF") for data in first.values())
+    # the grid is drawn once as a form and reused, with invariant=1 no
+    # timestamp or document id ends up in the file
+    assert again == first
+    assert pooled == first
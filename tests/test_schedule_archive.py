@@ -0,0 +1,84 @@
+# File Name: test_schedule_archive.py
+#
+# Tests for the binary .sched schedule archive and the format converters.
+import json
+
+import pytest
+
+from Controller.schedule_archive import ArchiveWriter, ScheduleArchive
+from Controller.schedule_io import convertSchedules, iterScheduleFile
+
+SCHEDULES = [
+    [
+        ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"],
+        ["CMSC 161.01", "Hogg", "Roddy 140", "Linux", "TUE 10:00-11:50^"],
+    ],
+    [["CMSC 152.01", "Xie", "Roddy 147", "Mac", "WED 13:00-14:50", "FRI 13:00-13:50"]],
+    [["CMSC 499.01", "Hogg", "Roddy 140", "None"]],
+]
+
+
+def _archive(tmp_path, schedules=SCHEDULES):
+    path = tmp_path / "out.sched"
+    with ArchiveWriter(path) as writer:
+        for sch in schedules:
+            writer.write(sch)
+    return path
+
+
+def test_archive_round_trips(tmp_path):
+    with ScheduleArchive(_archive(tmp_path)) as archive:
+        assert len(archive) == 3
+        assert [archive.rows(k) for k in range(len(archive))] == SCHEDULES
+
+
+def test_archive_random_access(tmp_path):
+    with ScheduleArchive(_archive(tmp_path)) as archive:
+        assert archive[1] == SCHEDULES[1]
+        assert archive[-1] == SCHEDULES[-1]
+        assert archive[0][1].meetings == ((1, 600, 710, True),)
+        with pytest.raises(IndexError):
+            archive[3]
+
+
+def test_archive_stores_names_once(tmp_path):
+    with ScheduleArchive(_archive(tmp_path)) as archive:
+        assert archive.strings.count("Hogg") == 1
+        assert archive.strings.count("None") == 1
+
+
+def test_empty_archive(tmp_path):
+    with ScheduleArchive(_archive(tmp_path, [])) as archive:
+        assert len(archive) == 0
+        assert list(archive) == []
+
+
+@pytest.mark.parametrize("content", [b"", b"not an archive at all, just text"])
+def test_rejects_other_files(tmp_path, content):
+    path = tmp_path / "bad.sched"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        ScheduleArchive(path)
+
+
+@pytest.mark.parametrize("fmt", ["json", "csv", "jsonl"])
+def test_convert_to_and_from_archive(tmp_path, fmt):
+    (tmp_path / "src.json").write_text(json.dumps(SCHEDULES))
+    src = tmp_path / f"src.{fmt}"
+    if fmt != "json":
+        convertSchedules(tmp_path / "src.json", src)
+
+    assert convertSchedules(src, tmp_path / "out.sched") == 3
+    assert convertSchedules(tmp_path / "out.sched", tmp_path / f"back.{fmt}") == 3
+    assert list(iterScheduleFile(tmp_path / f"back.{fmt}")) == SCHEDULES
+
+
+def test_json_export_matches_json_dump(tmp_path):
+    path = _archive(tmp_path)
+    convertSchedules(path, tmp_path / "out.json")
+    assert (tmp_path / "out.json").read_text() == json.dumps(SCHEDULES, indent=4)
+
+
+def test_convert_rejects_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        convertSchedules(_archive(tmp_path), tmp_path / "out.xlsx")
@@ -0,0 +1,147 @@
+# File Name: test_schedule_cache.py
+#
+# Tests for the on-disk cache of generated schedules.
+import copy
+
+import pytest
+
+from Controller.schedule_cache import (
+    ScheduleCache,
+    cacheDirFor,
+    cachedSchedules,
+    configFingerprint,
+)
+
+
+@pytest.fixture
+def data():
+    return {
+        "config": {
+            "rooms": ["Roddy 136", "Roddy 140"],
+            "labs": ["Linux"],
+            "courses": [
+                {
+                    "course_id": "CMSC 140",
+                    "credits": 4,
+                    "room": ["Roddy 136", "Roddy 140"],
+                    "lab": [],
+                    "conflicts": [],
+                    "faculty": [],
+                }
+            ],
+            "faculty": [{"name": "Zoppetti"}],
+        },
+        "limit": 5,
+        "optimizer_flags": [],
+    }
+
+
+def _schedule(n):
+    return [[f"CMSC 140.0{n}", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"]]
+
+
+class Producer:
+    """Counts how often the solver would have been started."""
+
+    def __init__(self, total):
+        self.total = total
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return (_schedule(i) for i in range(self.total))
+
+
+def test_fingerprint_ignores_order_limit_and_flag_order(data):
+    other = copy.deepcopy(data)
+    other["config"]["rooms"].reverse()
+    other["config"]["courses"][0]["room"].reverse()
+    other["limit"] = 100
+    other = dict(reversed(list(other.items())))
+
+    assert configFingerprint(data, ["same_room", "pack_rooms"]) == configFingerprint(
+        other, ["pack_rooms", "same_room"]
+    )
+
+
+def test_fingerprint_changes_with_config_and_flags(data):
+    base = configFingerprint(data, [])
+    assert configFingerprint(data, ["pack_rooms"]) != base
+
+    other = copy.deepcopy(data)
+    other["config"]["courses"][0]["credits"] = 3
+    assert configFingerprint(other, []) != base
+
+
+def test_fingerprint_changes_with_generation_mode(data):
+    single = configFingerprint(data, [])
+    assert configFingerprint(data, [], "single") == single
+    assert configFingerprint(data, [], "parallel") != single
+    assert configFingerprint(data, [], "decomposed") != single
+
+
+def test_modes_do_not_share_entries(tmp_path, data):
+    cache = ScheduleCache(tmp_path)
+    produce = Producer(10)
+
+    list(cachedSchedules(cache, data, 3, [], produce, "single"))
+    list(cachedSchedules(cache, data, 3, [], produce, "decomposed"))
+
+    assert produce.calls == 2
+    assert cache.load(configFingerprint(data, [], "decomposed")) is not None
+
+
+def test_second_run_is_served_from_cache(tmp_path, data):
+    cache = ScheduleCache(tmp_path)
+    produce = Producer(10)
+
+    first = list(cachedSchedules(cache, data, 3, [], produce))
+    second = list(cachedSchedules(cache, data, 3, [], produce))
+
+    assert first == second == [_schedule(i) for i in range(3)]
+    assert produce.calls == 1
+
+
+def test_larger_limit_resumes_after_cached_prefix(tmp_path, data):
+    cache = ScheduleCache(tmp_path)
+    produce = Producer(10)
+    list(cachedSchedules(cache, data, 2, [], produce))
+
+    result = list(cachedSchedules(cache, data, 5, [], produce))
+
+    assert result == [_schedule(i) for i in range(5)]
+    assert produce.calls == 2
+    key = configFingerprint(data, [])
+    assert len(cache.load(key)["schedules"]) == 5
+
+
+def test_exhausted_search_is_marked_complete(tmp_path, data):
+    cache = ScheduleCache(tmp_path)
+    produce = Producer(2)
+
+    assert len(list(cachedSchedules(cache, data, 5, [], produce))) == 2
+    # a complete entry answers any larger limit without running the solver
+    assert len(list(cachedSchedules(cache, data, 50, [], produce))) == 2
+    assert produce.calls == 1
+
+
+def test_closing_early_keeps_partial_results(tmp_path, data):
+    cache = ScheduleCache(tmp_path)
+    stream = cachedSchedules(cache, data, 5, [], Producer(10))
+    next(stream)
+    next(stream)
+    stream.close()
+
+    entry = cache.load(configFingerprint(data, []))
+    assert entry == {"complete": False, "schedules": [_schedule(0), _schedule(1)]}
+
+
+def test_corrupt_entry_is_a_miss(tmp_path, data):
+    cache = ScheduleCache(tmp_path)
+    key = configFingerprint(data, [])
+    (tmp_path / f"{key}.json").write_text("{not json")
+    assert cache.load(key) is None
+
+
+def test_cacheDirFor_sits_beside_config(tmp_path):
+    assert cacheDirFor(str(tmp_path / "mainConfig.json")) == str(tmp_path / ".cache")
@@ -0,0 +1,90 @@
+# File Name: test_schedule_db.py
+#
+# Tests for the SQLite schedule export and its query API.
+import pytest
+
+from Controller.schedule_db import ScheduleDatabase, SqliteWriter
+from Controller.schedule_io import convertSchedules, iterScheduleFile
+from Controller.schedule_source import LazyScheduleSource
+
+SCHEDULES = [
+    [
+        ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"],
+        ["CMSC 161.01", "Hogg", "Roddy 140", "Linux", "TUE 10:00-11:50^"],
+    ],
+    [
+        ["CMSC 140.01", "Hogg", "Roddy 136", "None", "MON 11:00-11:50"],
+        ["CMSC 161.01", "Zoppetti", "Roddy 140", "Mac", "THU 08:00-09:50^"],
+    ],
+    [
+        ["CMSC 140.02", "Xie", "Roddy 136", "None", "WED 08:00-08:50"],
+        ["CMSC 1400.01", "Hogg", "Roddy 147", "None", "FRI 08:00-08:50"],
+        ["CMSC 499.01", "Hogg", "Roddy 140", "None"],
+    ],
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "out.db"
+    with SqliteWriter(path) as writer:
+        for sch in SCHEDULES:
+            writer.write(sch)
+    with ScheduleDatabase(path) as database:
+        yield database
+
+
+def test_database_round_trips(db):
+    assert len(db) == 3
+    assert db.toRows() == SCHEDULES
+    assert db[-1] == SCHEDULES[-1]
+    assert db[1][1].meetings == ((3, 480, 590, True),)
+    with pytest.raises(IndexError):
+        db[3]
+
+
+def test_reading_a_schedule_uses_the_indexes(db):
+    for table in ("assignments", "meetings"):
+        plan = db._db.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM {table} WHERE schedule_id = ?",
+            (0,),
+        ).fetchall()
+        assert "USING INDEX" in plan[0][-1], plan
+
+
+def test_query_course_room_and_time(db):
+    # the example from the request, sections match but CMSC 1400 does not
+    assert db.schedulesWhere(course="CMSC 140", room="Roddy 136") == [0, 1, 2]
+    assert db.schedulesWhere(
+        course="CMSC 140", room="Roddy 136", startsBefore="10:00"
+    ) == [0, 2]
+    assert db.schedulesWhere(course="CMSC 140.01", startsAfter=600) == [1]
+
+
+def test_query_faculty_day_and_labs(db):
+    assert db.schedulesWhere(faculty="Hogg", day="TUE") == [0]
+    assert db.schedulesWhere(lab="Mac") == [1]
+    assert db.schedulesWhere(is_lab=True, faculty="Zoppetti") == [1]
+    assert db.schedulesWhere() == [0, 1, 2]
+    with pytest.raises(ValueError):
+        db.schedulesWhere(day="someday")
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "bad.db"
+    path.write_text("not a database")
+    with pytest.raises(ValueError):
+        ScheduleDatabase(path)
+    with pytest.raises(ValueError):
+        ScheduleDatabase(tmp_path / "missing.db")
+
+
+def test_db_is_a_schedule_format(tmp_path, db):
+    convertSchedules(db.path, tmp_path / "copy.db")
+    assert list(iterScheduleFile(tmp_path / "copy.db")) == SCHEDULES
+
+    source = LazyScheduleSource(tmp_path / "copy.db")
+    try:
+        assert source[2] == SCHEDULES[2]
+    finally:
+        source.close()
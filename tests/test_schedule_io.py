@@ -0,0 +1,198 @@
+# File Name: test_schedule_io.py
+#
+# Tests for the streaming schedule readers and writers.
+import csv
+import json
+
+import pytest
+
+from Controller.schedule_io import (
+    CsvScheduleWriter,
+    JsonArrayWriter,
+    JsonLinesWriter,
+    NotScheduleListError,
+    ScheduleWriter,
+    iterCsvSchedules,
+    iterJsonSchedules,
+    openScheduleWriter,
+)
+
+SCHEDULES = [
+    [
+        ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"],
+        ["CMSC 161.01", "Hogg", "Roddy 140", "Linux", "TUE 10:00-11:50^"],
+    ],
+    [["CMSC 152.01", "Xie", "Roddy 147", "Mac", "WED 13:00-14:50", "FRI 13:00-13:50"]],
+]
+
+
+@pytest.mark.parametrize("schedules", [SCHEDULES, SCHEDULES[:1], []])
+def test_json_writer_matches_json_dump(tmp_path, schedules):
+    path = tmp_path / "out.json"
+    with JsonArrayWriter(path) as writer:
+        for sch in schedules:
+            writer.write(sch)
+
+    assert path.read_text() == json.dumps(schedules, indent=4)
+
+
+def test_json_writer_flushes_each_schedule(tmp_path):
+    path = tmp_path / "out.json"
+    writer = JsonArrayWriter(path)
+    writer.write(SCHEDULES[0])
+
+    # without close() only the closing bracket is missing
+    assert json.loads(path.read_text() + "\n]") == SCHEDULES[:1]
+    writer.close()
+    writer.close()  # closing twice is harmless
+    assert json.loads(path.read_text()) == SCHEDULES[:1]
+
+
+def test_jsonl_writer_one_schedule_per_line(tmp_path):
+    path = tmp_path / "out.jsonl"
+    with JsonLinesWriter(path) as writer:
+        for sch in SCHEDULES:
+            writer.write(sch)
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == SCHEDULES
+    assert writer.count == 2
+
+
+def test_csv_writer_separates_schedules_with_blank_rows(tmp_path):
+    path = tmp_path / "out.csv"
+    with CsvScheduleWriter(path) as writer:
+        for sch in SCHEDULES:
+            writer.write(sch)
+
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [[]] + SCHEDULES[0] + [[]] + SCHEDULES[1]
+
+
+def test_openScheduleWriter_picks_format(tmp_path):
+    with openScheduleWriter(tmp_path / "a", "jsonl") as writer:
+        assert isinstance(writer, JsonLinesWriter)
+    with pytest.raises(ValueError):
+        openScheduleWriter(tmp_path / "b", "xml")
+
+
+def test_writer_base_needs_writeSchedule(tmp_path):
+    class NoWrite(ScheduleWriter):
+        pass
+
+    with pytest.raises(TypeError):
+        NoWrite(tmp_path / "a.json")
+    with pytest.raises(TypeError):
+        ScheduleWriter(tmp_path / "b.json")
+    assert not (tmp_path / "a.json").exists()
+
+
+@pytest.mark.parametrize("fmt", ["json", "jsonl", "csv", "sched", "db"])
+def test_every_writer_shares_the_base_bookkeeping(tmp_path, fmt):
+    path = tmp_path / f"out.{fmt}"
+    writer = openScheduleWriter(path, fmt)
+    assert isinstance(writer, ScheduleWriter)
+    for schedule in SCHEDULES:
+        writer.write(schedule)
+    assert writer.count == len(SCHEDULES)
+    writer.close()
+    # closing again does nothing
+    writer.close()
+    assert path.exists()
+
+
+def _write(tmp_path, data, **kwargs):
+    path = tmp_path / "schedules.json"
+    path.write_text(json.dumps(data, **kwargs))
+    return path
+
+
+@pytest.mark.parametrize("chunkSize", [1, 7, 1 << 16])
+def test_reads_plain_list_in_any_chunk_size(tmp_path, chunkSize):
+    path = _write(tmp_path, SCHEDULES, indent=4)
+    assert list(iterJsonSchedules(path, chunkSize)) == SCHEDULES
+
+
+@pytest.mark.parametrize("chunkSize", [3, 1 << 16])
+def test_reads_wrapped_list_and_skips_other_keys(tmp_path, chunkSize):
+    data = {"count": 12345, "meta": {"a": [1, "]"]}, "schedules": SCHEDULES}
+    path = _write(tmp_path, data)
+    assert list(iterJsonSchedules(path, chunkSize)) == SCHEDULES
+
+
+def test_empty_list(tmp_path):
+    assert list(iterJsonSchedules(_write(tmp_path, []))) == []
+
+
+def test_schedules_are_yielded_before_a_bad_one(tmp_path):
+    path = _write(tmp_path, [SCHEDULES[0], [["too", "short"]]])
+    reader = iterJsonSchedules(path, 8)
+    assert next(reader) == SCHEDULES[0]
+    with pytest.raises(ValueError, match="row 0 in schedule 1 has too few"):
+        next(reader)
+
+
+def test_truncated_file_is_reported(tmp_path):
+    path = tmp_path / "cut.json"
+    path.write_text(json.dumps(SCHEDULES)[:-20])
+    with pytest.raises(ValueError, match="Invalid json"):
+        list(iterJsonSchedules(path, 16))
+
+
+@pytest.mark.parametrize(
+    "data", [{"schedules": {"a": 1}}, {"other": []}, [1, 2], "text"]
+)
+def test_other_shapes_are_not_schedule_lists(tmp_path, data):
+    with pytest.raises(NotScheduleListError):
+        list(iterJsonSchedules(_write(tmp_path, data)))
+
+
+def _writeCsv(tmp_path, text):
+    path = tmp_path / "schedules.csv"
+    path.write_text(text)
+    return path
+
+
+def test_csv_reader_splits_on_blank_rows(tmp_path):
+    path = _writeCsv(
+        tmp_path,
+        "\nA,B,C,None,MON 09:00-09:50\n,,,,\nD,E,F,Mac,TUE 10:00-11:50^\n\n",
+    )
+    assert list(iterCsvSchedules(path, validate=True)) == [
+        [["A", "B", "C", "None", "MON 09:00-09:50"]],
+        [["D", "E", "F", "Mac", "TUE 10:00-11:50^"]],
+    ]
+
+
+def test_csv_reader_reports_line_of_short_row(tmp_path):
+    path = _writeCsv(
+        tmp_path, "A,B,C,None,MON 09:00-09:50\n\nA,B,C,None,MON 09:00-09:50\nD,E\n"
+    )
+    with pytest.raises(ValueError, match=r"line 4 \(row 1 in schedule 1\) has too few"):
+        list(iterCsvSchedules(path, validate=True))
+
+
+def test_csv_reader_reports_bad_meeting(tmp_path):
+    path = _writeCsv(tmp_path, "A,B,C,None,MON 9am\n")
+    reader = iterCsvSchedules(path, validate=True)
+    with pytest.raises(ValueError, match=r"line 1 .* bad meeting time 'MON 9am'"):
+        next(reader)
+
+
+def test_csv_reader_is_lazy(tmp_path):
+    path = _writeCsv(tmp_path, "A,B,C,None,MON 09:00-09:50\n\nD,E\n")
+    reader = iterCsvSchedules(path, validate=True)
+    assert next(reader) == [["A", "B", "C", "None", "MON 09:00-09:50"]]
+    with pytest.raises(ValueError):
+        next(reader)
+
+
+def test_csv_reader_ignores_empty_trailing_cells(tmp_path):
+    path = _writeCsv(
+        tmp_path, "A,B,C,None,MON 09:00-09:50,,\n, ,,\nD,E,F,Mac,TUE 10:00-11:50,\n"
+    )
+    assert list(iterCsvSchedules(path, validate=True)) == [
+        [["A", "B", "C", "None", "MON 09:00-09:50"]],
+        [["D", "E", "F", "Mac", "TUE 10:00-11:50"]],
+    ]
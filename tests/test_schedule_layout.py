@@ -0,0 +1,42 @@
+# File Name: test_schedule_layout.py
+#
+# Tests for the week grid layout shared by the schedule renderers.
+from Controller.schedule_layout import blockTimes, getTimeRange, scheduleLayout
+
+CLASSES = [
+    ["CMSC 140.01", "Zoppetti", "MON 09:00-09:50", "WED 14:00-15:50^"],
+    ["CMSC 161.01", "Hogg", "TUE 10:05-11:15", "SAT 08:00-08:50", "None"],
+]
+
+
+def test_layout_places_weekday_meetings():
+    layout = scheduleLayout(["Roddy 136", CLASSES])
+    assert (layout.name, layout.startHour, layout.endHour) == ("Roddy 136", 8, 16)
+
+    # the weekend meeting and the lab name are not drawn
+    assert [(b.day, b.start, b.end, b.classIndex) for b in layout.blocks] == [
+        (0, 540, 590, 0),
+        (2, 840, 950, 0),
+        (1, 605, 675, 1),
+    ]
+    block = layout.blocks[2]
+    assert block.startHours == 10 + 5 / 60
+    assert block.seconds == 70 * 60
+    assert (block.course, block.second, block.meeting) == (
+        "CMSC 161.01",
+        "Hogg",
+        "TUE 10:05-11:15",
+    )
+    assert blockTimes(block) == "10:05 AM - 11:15 AM"
+
+
+def test_layout_is_cached_per_name_and_classes():
+    first = scheduleLayout(["Roddy 136", CLASSES])
+    assert scheduleLayout(["Roddy 136", [list(c) for c in CLASSES]]) is first
+    assert scheduleLayout(["Hogg", CLASSES]) is not first
+    assert scheduleLayout(["Roddy 136", CLASSES[:1]]) is not first
+
+
+def test_time_range_spans_all_meetings():
+    assert getTimeRange(CLASSES) == (8, 16)
+    assert getTimeRange([["CMSC 101", "Hogg"]]) is None
@@ -0,0 +1,227 @@
+# File Name: test_schedule_source.py
+#
+# Tests for the lazy schedule source used by the View Schedules page.
+import json
+import time
+
+import pytest
+
+from Controller.schedule_io import convertSchedules
+from Controller.schedule_source import LazyScheduleSource
+
+SCHEDULES = [
+    [
+        ["CMSC 140.01", "Zoppetti", "Roddy 136", "None", "MON 09:00-09:50"],
+        ["CMSC 161.01", "Hogg", "Roddy 140", "Linux", "TUE 10:00-11:50^"],
+    ],
+    [["CMSC [152].01", "Xie", "Roddy 147", "Mac", "WED 13:00-14:50"]],
+    [["CMSC 499.01", "Hogg", "Roddy 140", "None", "FRI 08:00-08:50"]],
+]
+
+
+@pytest.fixture(params=["json", "jsonl", "csv", "sched"])
+def schedules_file(tmp_path, request):
+    src = tmp_path / "src.json"
+    with open(src, "w") as f:
+        json.dump(SCHEDULES, f, indent=4)
+    if request.param == "json":
+        return src
+    path = tmp_path / f"out.{request.param}"
+    convertSchedules(src, path)
+    return path
+
+
+def test_source_reads_every_format(schedules_file):
+    source = LazyScheduleSource(schedules_file)
+    try:
+        assert len(source) == 3
+        assert [source[k] for k in range(3)] == SCHEDULES
+        assert source[-1] == SCHEDULES[-1]
+        assert source.toRows() == SCHEDULES
+    finally:
+        source.close()
+
+
+def test_source_parses_only_what_is_shown(schedules_file):
+    source = LazyScheduleSource(schedules_file)
+    try:
+        assert not any(source.isCached(k) for k in range(3))
+        source[1]
+        assert source.isCached(1)
+        assert not source.isCached(0)
+    finally:
+        source.close()
+
+
+def test_lru_window_is_bounded(tmp_path):
+    path = tmp_path / "many.json"
+    path.write_text(json.dumps(SCHEDULES * 10))
+    source = LazyScheduleSource(path)
+    source.WINDOW = 4
+    try:
+        for k in range(len(source)):
+            source[k]
+        assert sum(source.isCached(k) for k in range(len(source))) == 4
+        assert source.isCached(len(source) - 1)
+    finally:
+        source.close()
+
+
+def test_prefetch_loads_neighbours(tmp_path):
+    path = tmp_path / "many.json"
+    path.write_text(json.dumps(SCHEDULES * 5))
+    source = LazyScheduleSource(path)
+    try:
+        source.prefetch(5)
+        deadline = time.time() + 5
+        while not source.isCached(7) and time.time() < deadline:
+            time.sleep(0.01)
+        assert all(source.isCached(k) for k in range(3, 8))
+        assert not source.isCached(0)
+    finally:
+        source.close()
+
+
+def test_wrapped_json_is_supported(tmp_path):
+    path = tmp_path / "wrapped.json"
+    path.write_text(json.dumps({"schedules": SCHEDULES}))
+    source = LazyScheduleSource(path)
+    try:
+        assert source[2] == SCHEDULES[2]
+    finally:
+        source.close()
+
+
+def test_bad_schedule_is_reported_when_opened(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps([SCHEDULES[0], [["too", "short"]]]))
+    source = LazyScheduleSource(path)
+    try:
+        assert source[0] == SCHEDULES[0]
+        with pytest.raises(ValueError, match="row 0 in schedule 1"):
+            source[1]
+    finally:
+        source.close()
+
+
+def test_empty_file_is_rejected(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text("")
+    with pytest.raises(ValueError):
+        LazyScheduleSource(path)
+
+
+def test_index_falls_back_for_other_json_shapes(tmp_path):
+    from Controller.schedule_source import _indexJsonArray
+
+    buf = '[ [["a", 1, null]], {"not": ["a", "schedule"]}, [["b]", "ü"]] ]'.encode()
+    path = tmp_path / "odd.json"
+    path.write_bytes(buf)
+    spans = _indexJsonArray(path, buf)
+    assert [json.loads(buf[s:e]) for s, e in spans] == [
+        [["a", 1, None]],
+        {"not": ["a", "schedule"]},
+        [["b]", "ü"]],
+    ]
+
+
+def test_wrapped_json_is_indexed_not_loaded(tmp_path, monkeypatch):
+    path = tmp_path / "wrapped.json"
+    data = {"name": "ü run", "schedules": SCHEDULES * 3, "after": [1]}
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    monkeypatch.setattr(
+        "Controller.schedule_io.checkSchedule",
+        lambda *args: pytest.fail("indexing should not check schedules"),
+    )
+    source = LazyScheduleSource(path)
+    try:
+        assert len(source) == 9
+        assert not any(source.isCached(k) for k in range(9))
+        assert source[4] == SCHEDULES[1]
+    finally:
+        source.close()
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ('{"schedules": {"a": 1}}', "does not hold a list"),
+        ('{"other": []}', "does not hold a list"),
+        ('{"schedules": [[["a", "b"', "not valid json"),
+    ],
+)
+def test_bad_wrapped_json_is_rejected(tmp_path, text, message):
+    path = tmp_path / "bad.json"
+    path.write_text(text)
+    with pytest.raises(ValueError, match=message):
+        LazyScheduleSource(path)
+
+
+CSV_TEXT = (
+    "A,B,C,None,MON 09:00-09:50,,\n"
+    "A2,B,C,None,WED 09:00-09:50\n"
+    ",,,,\n"
+    '"D, E",E,F,Mac,TUE 10:00-11:50,\n'
+    "\n"
+    "G,H,I,None,noon\n"
+    ",,,,\n"
+)
+
+
+def test_csv_source_matches_the_streaming_reader(tmp_path):
+    from Controller.schedule_io import iterCsvSchedules
+
+    path = tmp_path / "sheet.csv"
+    path.write_text(CSV_TEXT)
+    expected = list(iterCsvSchedules(path))
+    assert len(expected) == 3
+    source = LazyScheduleSource(path)
+    try:
+        assert len(source) == 3
+        assert source[0] == expected[0]
+        assert source[1] == [["D, E", "E", "F", "Mac", "TUE 10:00-11:50"]]
+    finally:
+        source.close()
+
+
+def test_csv_source_names_the_line_of_a_bad_row(tmp_path):
+    path = tmp_path / "sheet.csv"
+    path.write_text(CSV_TEXT)
+    source = LazyScheduleSource(path)
+    try:
+        with pytest.raises(
+            ValueError, match=r"line 6 \(row 0 in schedule 2\) has a bad meeting"
+        ):
+            source[2]
+    finally:
+        source.close()
+
+
+def test_cached_schedules_are_served_while_another_parses(tmp_path):
+    import threading
+
+    path = tmp_path / "many.json"
+    path.write_text(json.dumps(SCHEDULES))
+    source = LazyScheduleSource(path)
+    try:
+        assert source[0] == SCHEDULES[0]
+        parse = source._parse
+        started = threading.Event()
+        release = threading.Event()
+
+        def slowParse(k):
+            started.set()
+            release.wait(5)
+            return parse(k)
+
+        source._parse = slowParse
+        worker = threading.Thread(target=lambda: source[2])
+        worker.start()
+        assert started.wait(5)
+        # not stuck behind the parse of schedule 2
+        assert source[0] == SCHEDULES[0]
+        release.set()
+        worker.join(5)
+        assert source.isCached(2)
+    finally:
+        source.close()